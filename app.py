@@ -1,95 +1,242 @@
+import math
+
 import streamlit as st
-import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
-from datetime import datetime
+
+import perf
+import static
+from companies import DEFAULT_COMPANY, companies
+from downsample import MAX_POINTS
+from goalseek import goal_seek
+from scenario import ScenarioGraph, round_key
+from sensitivity import SWING
+from snapshot import (ROI_YEARS, TARGET_MONTH, compile_page, figure_inputs, open_rounds,
+                      round_pools)
+
+# Company to present: ?company=<slug> picks one under companies/; the
+# repository's own data is the default. Companies share this process and
+# its figure cache, and the least recently viewed are evicted past
+# COMPANY_CACHE_SIZE.
+COMPANY = st.query_params.get('company', DEFAULT_COMPANY)
+try:
+    company = companies.get(COMPANY)
+except KeyError:
+    st.error(f"No pitch deck for company {COMPANY!r}.")
+    st.stop()
+info = company.info
 
 # Page configuration
 st.set_page_config(
-    page_title="PayFlow Canada - Series A Pitch",
+    page_title=f"{info['name']} - Series A Pitch",
     page_icon="💰",
     layout="wide",
     initial_sidebar_state="collapsed"
 )
 
+# Per-section timings, shown on the hidden ?debug=perf panel; a no-op
+# stopwatch unless enabled there or with DASHBOARD_PERF=1
+DEBUG_PERF = st.query_params.get('debug') == 'perf'
+clock = perf.stopwatch(DEBUG_PERF)
+clock.lap('scenario', 'prep')
+
 # Custom CSS for better styling
-st.markdown("""
-<style>
-    .main > div {
-        padding-top: 2rem;
-    }
-    .stMetric {
-        background-color: #f0f2f6;
-        padding: 1rem;
-        border-radius: 0.5rem;
-    }
-    h1 {
-        color: #1f77b4;
-        padding-bottom: 1rem;
-    }
-    h2 {
-        color: #2c3e50;
-        padding-top: 2rem;
-        padding-bottom: 1rem;
-        border-bottom: 2px solid #1f77b4;
-    }
-    .highlight-box {
-        background-color: #e3f2fd;
-        padding: 2rem;
-        border-radius: 1rem;
-        border-left: 5px solid #1f77b4;
-        margin: 2rem 0;
-    }
-    .cta-box {
-        background-color: #c8e6c9;
-        padding: 2rem;
-        border-radius: 1rem;
-        border-left: 5px solid #4caf50;
-        margin: 2rem 0;
-    }
-</style>
-""", unsafe_allow_html=True)
-
-# Load data
-@st.cache_data
-def load_data():
-    financials = pd.read_csv('financials_10yr.csv')
-    financials['Date'] = pd.to_datetime(financials['Date'])
-
-    key_metrics = pd.read_csv('key_metrics_10yr.csv')
-    key_metrics['Date'] = pd.to_datetime(key_metrics['Date'])
-
-    roi_data = pd.read_csv('roi_comparison_10yr.csv')
-
-    funding_rounds = pd.read_csv('funding_rounds_updated.csv')
-
-    return financials, key_metrics, roi_data, funding_rounds
-
-financials, key_metrics, roi_data, funding_rounds = load_data()
-
-# Current month marker
-CURRENT_MONTH = 18
+st.markdown(static.PAGE_CSS, unsafe_allow_html=True)
+
+# Load data lazily: each section asks the company for the datasets and
+# columns it renders, and every (name, columns) request is cached on its own.
+# Caches are keyed on the files' modification stamps, so months recorded by
+# ingest.py show up on the next rerun.
+DATA_VERSION = company.version()
+
+# Base-case page, precompiled by script_6.py and shared read-only by every
+# session viewing the company (None if missing or stale)
+snapshot = company.snapshot(DATA_VERSION)
+
+# What-if scenario: one memoized graph per session, built on first use.
+# Historical months stay fixed; projections, ROI and the fan charts follow
+# the sidebar inputs.
+def scenario_graph():
+    if st.session_state.get('scenario_version') != (COMPANY, DATA_VERSION):
+        st.session_state.scenario = ScenarioGraph(company.dataset)
+        st.session_state.scenario_version = (COMPANY, DATA_VERSION)
+    return st.session_state.scenario
+
+defaults = snapshot['defaults'] if snapshot else scenario_graph().defaults
+
+REVENUE_CONTROLS = [
+    ('revenue_growth_series_a', 'Months 18-35'),
+    ('revenue_growth_series_b', 'Months 36-53'),
+    ('revenue_growth_series_c', 'Months 54-71'),
+    ('revenue_growth_mature', 'Month 72+ (before decay)'),
+]
+CUSTOMER_CONTROLS = [
+    ('customer_growth_series_a', 'Months 18-35'),
+    ('customer_growth_series_b', 'Months 36-53'),
+    ('customer_growth_series_c', 'Months 54-71'),
+    ('customer_growth_mature', 'Month 72+ (before decay)'),
+]
+COST_CONTROLS = [
+    ('cogs_ratio', 'COGS'),
+    ('sales_marketing_ratio', 'Sales & Marketing'),
+    ('rd_ratio', 'R&D'),
+    ('admin_ratio', 'Admin'),
+]
+
+OPEN_ROUNDS = snapshot['open_rounds'] if snapshot else open_rounds(scenario_graph())
+ROUND_POOLS = snapshot['round_pools'] if snapshot else round_pools(scenario_graph())
+RAISING = OPEN_ROUNDS[0]
+# The round after it, which the pitch compares against (None if last)
+LATER = OPEN_ROUNDS[1] if len(OPEN_ROUNDS) > 1 else None
+
+# Goal seek targets: label -> (target, keyword arguments, display scale)
+GOAL_TARGETS = {
+    f"{RAISING} ROI after {ROI_YEARS} years (%)": ('roi', {'round_name': RAISING, 'years': ROI_YEARS}, 1),
+    f"ARR at month {TARGET_MONTH} ($M)": ('arr', {'month': TARGET_MONTH}, 1e6),
+    f"Company valuation at month {TARGET_MONTH} ($M)": ('valuation', {'month': TARGET_MONTH}, 1e6),
+}
+GOAL_LEVERS = {f"Revenue growth, {label.lower()}": key for key, label in REVENUE_CONTROLS}
+ROUND_LEVERS = {f"{RAISING} valuation": round_key(RAISING, 'valuation'),
+                f"{RAISING} equity": round_key(RAISING, 'equity')}
+
+def percent_slider(key, label, max_value):
+    default = round(defaults[key] * 100, 2)
+    return st.slider(label, 0.0, max_value, default, 0.5, format='%.1f%%', key=key) / 100
+
+def reset_scenario():
+    for key in list(st.session_state):
+        if key in defaults:
+            del st.session_state[key]
+
+with st.sidebar:
+    st.markdown("## 🔧 What-If Scenario")
+    st.caption("Historical months stay fixed; only the projection responds.")
+    overrides = {}
+
+    st.markdown("**Monthly Revenue Growth**")
+    for key, label in REVENUE_CONTROLS:
+        overrides[key] = percent_slider(key, label, 50.0)
+
+    st.markdown("**Monthly Customer Growth**")
+    for key, label in CUSTOMER_CONTROLS:
+        overrides[key] = percent_slider(key, label, 50.0)
+
+    st.markdown("**Cost Ratios (% of revenue at Series A)**")
+    for key, label in COST_CONTROLS:
+        overrides[key] = percent_slider(key, label, 60.0)
+
+    st.markdown("**Funding Rounds ($M)**")
+    for name in OPEN_ROUNDS:
+        for field in ['amount', 'valuation']:
+            key = round_key(name, field)
+            value = st.number_input(f"{name} {field}", min_value=0.1,
+                                    value=defaults[key] / 1e6, step=0.5, key=key)
+            overrides[key] = int(round(value * 1e6))
+        # The stake and the option pool top-up must leave the earlier
+        # holders something: cap the amount just below valuation x (1 - pool)
+        amount_key, valuation_key = round_key(name, 'amount'), round_key(name, 'valuation')
+        pool = ROUND_POOLS[name]
+        cap = math.ceil(overrides[valuation_key] * (1 - pool) / 1e5 - 1) * 100_000
+        if cap < 100_000:
+            st.warning(f"{name}: a ${overrides[valuation_key] / 1e6:,.1f}M post-money is too "
+                       f"small for a {pool:.0%} option pool; using the base-case terms.")
+            overrides[amount_key], overrides[valuation_key] = defaults[amount_key], defaults[valuation_key]
+        elif overrides[amount_key] > cap:
+            st.warning(f"{name}: ${overrides[amount_key] / 1e6:,.1f}M of a "
+                       f"${overrides[valuation_key] / 1e6:,.1f}M post-money with a {pool:.0%} "
+                       f"option pool leaves nothing for earlier holders; "
+                       f"using ${cap / 1e6:,.1f}M, the most it can be.")
+            overrides[amount_key] = cap
+
+    st.button("Reset to base case", on_click=reset_scenario)
+
+# The base case renders straight from the snapshot; a what-if compiles the
+# same page from the session's graph
+if snapshot and all(value == defaults[key] for key, value in overrides.items()):
+    page = snapshot
+else:
+    scenario_graph().update(overrides)
+    page = compile_page(scenario_graph(), figures=())
+values = page['values']
+
+# Goal seek: the growth or round terms that reach a target, given the other
+# what-if inputs. Off by default so the base case never builds the graph.
+with st.sidebar:
+    if st.toggle("🎯 Goal seek", key='goal_seek'):
+        label = st.selectbox("Target", list(GOAL_TARGETS), key='goal_target')
+        target, target_args, scale = GOAL_TARGETS[label]
+        # Starts at the current projection's value, which its inputs just reach
+        current = {'roi': values['rounds'][RAISING]['roi'], 'arr': values['target_arr'],
+                   'valuation': values['target_valuation']}
+        goal = st.number_input("At least", min_value=0.0, value=round(current[target] / scale, 1),
+                               key=f'goal_value_{target}')
+        lever_options = dict(GOAL_LEVERS, **(ROUND_LEVERS if target == 'roi' else {}))
+        lever_label = st.selectbox("By changing", list(lever_options), key='goal_lever')
+        scenario_graph().update(overrides)
+        try:
+            result = goal_seek(scenario_graph(), target, goal * scale,
+                               lever_options[lever_label], **target_args)
+        except ValueError as error:
+            st.warning(str(error))
+        else:
+            lever = result.lever
+            if lever.endswith('_valuation'):
+                answer = f"${result.value / 1e6:,.1f}M or less"
+            elif lever.endswith('_equity'):
+                answer = f"{result.value:.1f}% or more"
+            else:
+                answer = f"{result.value * 100:.2f}% per month or more"
+            st.success(f"**{lever_label}:** {answer}")
+            st.caption(f"Reaches {result.achieved / scale:,.1f} "
+                       f"({result.evaluations} model evaluations)")
+            if result.achieved > goal * scale * (1 + 1e-6):
+                st.caption("Met across the whole search range: the answer is its end.")
+
+def zoom_window(key, months):
+    # Long scenarios are downsampled to about one point per pixel; picking a
+    # narrower range redraws just those months at full resolution
+    if months <= MAX_POINTS:
+        return None
+    start, stop = st.slider("Zoom (months)", 0, months, (0, months), key=key)
+    return None if (start, stop) == (0, months) else (start, max(stop, start + 2))
+
+def chart(section, name, window=None):
+    # Snapshot figures are looked up; anything else is built (or fetched
+    # from the figure cache) from the session's graph
+    if window is None and name in page['figures']:
+        clock.lap(section, 'figure')
+        return page['figures'][name]
+    clock.lap(section, 'prep')
+    scenario_graph().update(overrides)
+    builder, args = figure_inputs(scenario_graph(), name, window)
+    clock.lap(section, 'figure')
+    return builder(*args)
+
+# Current month marker (first projected month)
+CURRENT_MONTH = values['current_month']
+
+# Terms of the round currently being raised, and its and the next round's
+# returns after ROI_YEARS
+round_amount = values['round_amount']
+round_valuation = values['round_valuation']
+round_equity = values['round_equity']
+raising = values['rounds'][RAISING]
+later = values['rounds'][LATER] if LATER else None
 
 # Header Section
-st.markdown("<h1 style='text-align: center;'>🚀 PayFlow Canada</h1>", unsafe_allow_html=True)
-st.markdown("<h3 style='text-align: center; color: #666;'>Revolutionizing SMB Payments in Canada</h3>", unsafe_allow_html=True)
+clock.lap('header', 'emit')
+st.markdown(static.TITLE.format(**info), unsafe_allow_html=True)
+st.markdown(static.TAGLINE.format(**info), unsafe_allow_html=True)
 
 # Series A Opportunity Callout
-st.markdown("""
-<div class='highlight-box'>
-    <h2 style='margin:0; padding:0; border:none; color:#1f77b4;'>💎 Series A Investment Opportunity</h2>
-    <h3 style='margin-top:1rem;'>$10M for 20% Equity @ $50M Valuation</h3>
-    <p style='font-size:1.1rem; margin-top:1rem;'>Join us at the perfect inflection point - proven traction, massive market, exceptional team.</p>
-</div>
-""", unsafe_allow_html=True)
+st.markdown(static.CALLOUT.format(amount_m=round_amount / 1e6, valuation_m=round_valuation / 1e6,
+                                   equity=round_equity), unsafe_allow_html=True)
 
 # Key Metrics Cards
-st.markdown("### 📊 Current Performance (Month 18 - End of Seed Round)")
+st.markdown(f"### 📊 Current Performance (Month {CURRENT_MONTH} - End of Seed Round)")
 col1, col2, col3, col4 = st.columns(4)
 
-current_revenue = financials.loc[CURRENT_MONTH - 1, 'Revenue']
-current_customers = key_metrics.loc[CURRENT_MONTH - 1, 'Customers']
-current_ltv_cac = key_metrics.loc[CURRENT_MONTH - 1, 'LTV_CAC_Ratio']
+current_revenue = values['current_revenue']
+current_customers = values['current_customers']
+current_ltv_cac = values['ltv_cac']
 
 with col1:
     st.metric("Monthly Revenue", f"${current_revenue:,.0f}", "+32% MoM")
@@ -98,139 +245,77 @@ with col2:
 with col3:
     st.metric("LTV/CAC Ratio", f"{current_ltv_cac:.1f}x", "Excellent")
 with col4:
-    st.metric("5-Year ROI (Series A)", "850%+", "vs 320% Series B")
+    st.metric(f"{ROI_YEARS}-Year ROI ({RAISING})", f"{raising['roi']:,.0f}%",
+              f"vs {later['roi']:,.0f}% {LATER}" if later else None, delta_color='off')
 
 # Section 1: WHY INVEST NOW
+clock.lap('why_invest', 'emit')
 st.markdown("## 🎯 Why Invest in Series A NOW?")
 st.markdown("**The earlier you invest, the higher your returns.** Compare 5-year ROI across funding rounds:")
 
 # ROI Comparison Chart
-roi_5yr = roi_data[roi_data['Years'] == 5].copy()
-roi_5yr = roi_5yr[roi_5yr['Round'].isin(['Series A', 'Series B', 'Series C'])]
-
-fig_roi = go.Figure()
-
-fig_roi.add_trace(go.Bar(
-    x=roi_5yr['Round'],
-    y=roi_5yr['ROI_Percentage'],
-    text=[f"{val:,.0f}%" for val in roi_5yr['ROI_Percentage']],
-    textposition='outside',
-    marker_color=['#4caf50', '#ff9800', '#f44336'],
-    name='5-Year ROI %'
-))
-
-fig_roi.update_layout(
-    title="5-Year ROI Comparison: Invest Early = Higher Returns",
-    xaxis_title="Funding Round",
-    yaxis_title="ROI Percentage (%)",
-    height=400,
-    showlegend=False,
-    plot_bgcolor='white'
-)
-
+fig_roi = chart('why_invest', 'roi')
+clock.lap('why_invest', 'emit')
 st.plotly_chart(fig_roi, use_container_width=True)
 
 col1, col2 = st.columns(2)
 with col1:
-    st.markdown("""
-    **Series A Advantages:**
-    - ✅ 20% equity at $50M valuation
-    - ✅ 850%+ projected 5-year ROI
-    - ✅ 9.5x return multiple
+    st.markdown(f"""
+    **{RAISING} Advantages:**
+    - ✅ {raising['equity']:g}% equity at ${raising['valuation'] / 1e6:,.0f}M valuation
+    - ✅ {raising['roi']:,.0f}% projected {ROI_YEARS}-year ROI, on {raising['diluted_equity']:.1f}% after later rounds
+    - ✅ {raising['multiple']:,.1f}x return multiple
     - ✅ Proven traction with Seed success
     """)
-with col2:
-    st.markdown("""
-    **Wait for Series B?**
-    - ⚠️ Same 20% equity costs $30M (3x more)
-    - ⚠️ Only 320% projected 5-year ROI
-    - ⚠️ 4.2x return multiple
-    - ⚠️ Miss the highest growth phase
-    """)
+if later:
+    # What the same stake costs at the next round's valuation
+    same_stake = raising['equity'] / 100 * later['valuation']
+    with col2:
+        st.markdown(f"""
+        **Wait for {LATER}?**
+        - ⚠️ Same {raising['equity']:g}% equity costs ${same_stake / 1e6:,.0f}M ({same_stake / raising['amount']:.1f}x more)
+        - ⚠️ {later['roi']:,.0f}% projected {ROI_YEARS}-year ROI, on {later['diluted_equity']:.1f}% after later rounds
+        - ⚠️ {later['multiple']:,.1f}x return multiple
+        - ⚠️ Miss the highest growth phase
+        """)
+
+# What drives the return: every model input moved on its own
+st.markdown("### 🌪️ Which Assumption Matters Most?")
+st.markdown(f"Each input of the model moved ±{SWING:.0%} on its own, everything else held. "
+            "Past months are actuals, so only the projection's inputs move the return.")
+fig_tornado = chart('why_invest', 'tornado')
+clock.lap('why_invest', 'emit')
+st.plotly_chart(fig_tornado, use_container_width=True)
+
+# Who gets paid first at an exit: liquidation preferences, then common
+st.markdown("### 💧 Exit Waterfall")
+st.markdown("Each round takes back its liquidation preference first, latest round first, "
+            "and converts to common once its share of the exit is worth more. "
+            "Above the preference stack, everyone is paid pro rata to fully diluted ownership.")
+fig_waterfall = chart('why_invest', 'waterfall')
+clock.lap('why_invest', 'emit')
+st.plotly_chart(fig_waterfall, use_container_width=True)
 
 # Section 2: PROVEN TRACTION
+clock.lap('traction', 'emit')
 st.markdown("## 📈 Proven Traction: Revenue Growth")
 st.markdown("**We've exceeded all Seed round targets.** Solid line = actual performance. Dashed line = projections.")
 
-# Revenue chart with historical vs projected
-fig_revenue = go.Figure()
-
-# Historical revenue (solid line)
-historical_data = financials[financials['Is_Historical'] == True]
-projected_data = financials[financials['Is_Historical'] == False]
-
-fig_revenue.add_trace(go.Scatter(
-    x=historical_data.index,
-    y=historical_data['Revenue'],
-    mode='lines',
-    name='Actual Performance',
-    line=dict(color='#2ecc71', width=3),
-    fill='tozeroy',
-    fillcolor='rgba(46, 204, 113, 0.2)'
-))
-
-fig_revenue.add_trace(go.Scatter(
-    x=projected_data.index,
-    y=projected_data['Revenue'],
-    mode='lines',
-    name='Projected',
-    line=dict(color='#3498db', width=2, dash='dash'),
-    fill='tozeroy',
-    fillcolor='rgba(52, 152, 219, 0.1)'
-))
-
-# Add vertical line at current month
-fig_revenue.add_vline(
-    x=CURRENT_MONTH,
-    line_dash="dot",
-    line_color="red",
-    line_width=2,
-    annotation_text="YOU ARE HERE - Series A",
-    annotation_position="top"
-)
-
-fig_revenue.update_layout(
-    title="Monthly Revenue: Historical Performance + 10-Year Projection",
-    xaxis_title="Months Since Launch",
-    yaxis_title="Monthly Revenue ($)",
-    height=500,
-    hovermode='x unified',
-    plot_bgcolor='white'
-)
-
+# Revenue chart with historical vs projected, plus the Monte Carlo fan
+fig_revenue = chart('traction', 'revenue', zoom_window('revenue_zoom', values['months']))
+clock.lap('traction', 'emit')
 st.plotly_chart(fig_revenue, use_container_width=True)
 
 # Section 3: MARKET OPPORTUNITY
+clock.lap('market', 'emit')
 st.markdown("## 🌍 Market Opportunity")
 
 col1, col2 = st.columns([2, 1])
 
 with col1:
     # Market sizing chart
-    market_data = pd.DataFrame({
-        'Market': ['Total Addressable\nMarket (TAM)', 'Serviceable Addressable\nMarket (SAM)', 'Serviceable Obtainable\nMarket (SOM)'],
-        'Value': [45, 12, 0.6],  # in billions
-        'Label': ['$45B', '$12B', '$600M']
-    })
-
-    fig_market = go.Figure()
-
-    fig_market.add_trace(go.Bar(
-        x=market_data['Market'],
-        y=market_data['Value'],
-        text=market_data['Label'],
-        textposition='outside',
-        marker_color=['#1f77b4', '#ff7f0e', '#2ca02c'],
-        showlegend=False
-    ))
-
-    fig_market.update_layout(
-        title="Canadian B2B Payments Market",
-        yaxis_title="Market Size (Billions CAD)",
-        height=400,
-        plot_bgcolor='white'
-    )
-
+    fig_market = chart('market', 'market')
+    clock.lap('market', 'emit')
     st.plotly_chart(fig_market, use_container_width=True)
 
 with col2:
@@ -244,60 +329,37 @@ with col2:
     """)
 
 # Section 4: CUSTOMER GROWTH
+clock.lap('customers', 'emit')
 st.markdown("## 👥 Customer Acquisition")
 
-fig_customers = go.Figure()
-
-# Historical customers
-historical_customers = key_metrics[key_metrics['Is_Historical'] == True]
-projected_customers = key_metrics[key_metrics['Is_Historical'] == False]
-
-fig_customers.add_trace(go.Scatter(
-    x=historical_customers.index,
-    y=historical_customers['Customers'],
-    mode='lines+markers',
-    name='Actual Customers',
-    line=dict(color='#2ecc71', width=3),
-    marker=dict(size=6)
-))
-
-fig_customers.add_trace(go.Scatter(
-    x=projected_customers.index,
-    y=projected_customers['Customers'],
-    mode='lines',
-    name='Projected Customers',
-    line=dict(color='#3498db', width=2, dash='dash')
-))
-
-fig_customers.add_vline(
-    x=CURRENT_MONTH,
-    line_dash="dot",
-    line_color="red",
-    line_width=2,
-    annotation_text="Series A Opportunity",
-    annotation_position="top"
-)
-
-fig_customers.update_layout(
-    title="Customer Growth: From 35 to 1M+ over 10 Years",
-    xaxis_title="Months Since Launch",
-    yaxis_title="Number of Customers",
-    height=450,
-    hovermode='x unified',
-    plot_bgcolor='white'
-)
-
+fig_customers = chart('customers', 'customers', zoom_window('customers_zoom', values['months']))
+clock.lap('customers', 'emit')
 st.plotly_chart(fig_customers, use_container_width=True)
 
+# Retention by monthly acquisition cohort
+st.markdown("### 🧊 Cohort Retention")
+st.markdown("Each row is a month's new customers; each column, how many are still with us "
+            "that many months later. Newer cohorts start from a lower churn rate and keep more customers.")
+fig_retention = chart('customers', 'retention')
+clock.lap('customers', 'emit')
+st.plotly_chart(fig_retention, use_container_width=True)
+st.caption(f"Behind this month's {values['current_customers']:,} customers are "
+           f"{values['new_customers']:,.0f} new ones; at these retention rates each brings "
+           f"${values['cohort_ltv']:,.0f} of gross margin by month {values['months']} "
+           f"(key metrics assume an LTV of ${values['ltv']:,.0f}).")
+
 # Section 5: KEY METRICS
+clock.lap('unit_economics', 'emit')
 st.markdown("## 🎯 Key Unit Economics (Current)")
 
 col1, col2, col3, col4 = st.columns(4)
 
-current_cac = key_metrics.loc[CURRENT_MONTH - 1, 'CAC']
-current_ltv = key_metrics.loc[CURRENT_MONTH - 1, 'LTV']
-current_churn = key_metrics.loc[CURRENT_MONTH - 1, 'Churn_Rate']
-current_volume = key_metrics.loc[CURRENT_MONTH - 1, 'Transaction_Volume']
+clock.lap('unit_economics', 'prep')
+current_cac = values['cac']
+current_ltv = values['ltv']
+current_churn = values['churn']
+current_volume = values['volume']
+clock.lap('unit_economics', 'emit')
 
 with col1:
     st.metric(
@@ -331,40 +393,49 @@ with col4:
         delta_color="inverse"
     )
 
-st.markdown("""
+st.markdown(f"""
 **Industry Benchmarks:**
 - LTV/CAC > 3.0 = Excellent ✅
 - CAC Payback < 12 months = Strong ✅
 - Monthly Churn < 5% = Healthy ✅
 
-**PayFlow Canada exceeds all benchmarks.**
+**{info['name']} exceeds all benchmarks.**
 """)
 
 # Section 6: CALL TO ACTION
+clock.lap('terms', 'emit')
 st.markdown("## 💼 Investment Terms")
 
-st.markdown("""
-<div class='cta-box'>
-    <h3>Series A Round Details</h3>
-    <ul style='font-size:1.1rem; line-height:2rem;'>
-        <li><strong>Amount Raising:</strong> $10,000,000 CAD</li>
-        <li><strong>Pre-Money Valuation:</strong> $50,000,000 CAD</li>
-        <li><strong>Equity Offered:</strong> 20%</li>
-        <li><strong>Use of Funds:</strong> Product development (40%), Sales & Marketing (40%), Team expansion (20%)</li>
-        <li><strong>Expected Close:</strong> Q1 2025</li>
-        <li><strong>Projected 5-Year ROI:</strong> 850%+</li>
-    </ul>
-    <h3 style='margin-top:2rem;'>Ready to Invest?</h3>
-    <p style='font-size:1.1rem;'>Contact: <strong>invest@payflowcanada.com</strong></p>
-    <p style='font-size:1.1rem;'>Schedule a call: <strong>calendly.com/payflow-series-a</strong></p>
-</div>
-""", unsafe_allow_html=True)
+st.markdown(static.TERMS.format(amount=round_amount, valuation=round_valuation,
+                                 pre_money=round_valuation - round_amount,
+                                 equity=round_equity, years=ROI_YEARS, roi=raising['roi'], **info),
+            unsafe_allow_html=True)
 
 # Footer
 st.markdown("---")
-st.markdown("""
-<div style='text-align: center; color: #666; padding: 2rem;'>
-    <p><strong>PayFlow Canada Inc.</strong> | Toronto, ON | Fintech - B2B Payments</p>
-    <p><em>This presentation contains forward-looking statements and projections based on current market conditions and assumptions.</em></p>
-</div>
-""", unsafe_allow_html=True)
+st.markdown(static.FOOTER.format(**info), unsafe_allow_html=True)
+clock.stop()
+
+# Hidden performance panel: ?debug=perf
+if DEBUG_PERF:
+    import pandas as pd
+
+    st.markdown("---")
+    st.markdown("## ⏱️ Section Timings (this process)")
+    rows = []
+    for (section, phase), histogram in perf.snapshot().items():
+        rows.append({
+            'Section': section,
+            'Phase': phase,
+            'Runs': histogram.count,
+            'Mean (ms)': histogram.sum / histogram.count * 1e3,
+            'P50 ≤ (ms)': histogram.quantile(0.5) * 1e3,
+            'P99 ≤ (ms)': histogram.quantile(0.99) * 1e3,
+        })
+    st.dataframe(pd.DataFrame(rows), hide_index=True, use_container_width=True)
+    metrics = perf.export()
+    st.download_button("Download Prometheus metrics", metrics, file_name='dashboard_metrics.prom')
+    st.download_button("Download OpenMetrics", perf.export(openmetrics=True),
+                       file_name='dashboard_metrics.txt')
+    with st.expander("Prometheus text"):
+        st.code(metrics, language='text')
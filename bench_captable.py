@@ -0,0 +1,61 @@
+# Cap table: diluted ownership for a grid of round terms in one vectorized
+# call versus one call per set of terms, and the live recompute of the ROI
+# table when a round's valuation changes in the dashboard
+#
+#   python bench_captable.py [grid size]
+
+import sys
+import time
+
+import numpy as np
+
+from captable import diluted_equity
+from datasets import load_dataset
+from scenario import ScenarioGraph
+
+
+def timed(fn, repeats=20):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        result = fn()
+    return (time.perf_counter() - start) / repeats, result
+
+
+def main(size=10_000):
+    rounds = load_dataset('funding_rounds')
+    terms = {column: rounds[column].to_numpy() for column in rounds}
+    r = list(rounds['Round']).index('Series B')
+    valuations = np.linspace(60e6, 600e6, size)
+    grid = dict(terms, Valuation=np.repeat(terms['Valuation'][np.newaxis].astype(float), size, axis=0))
+    grid['Valuation'][:, r] = valuations
+
+    def looped():
+        out = []
+        for v in valuations:
+            one = dict(terms, Valuation=terms['Valuation'].astype(float))
+            one['Valuation'][r] = v
+            out.append(diluted_equity(one))
+        return np.stack(out)
+
+    vectorized, batch = timed(lambda: diluted_equity(grid), 5)
+    loop, rows = timed(looped, 1)
+    assert np.allclose(batch, rows)
+
+    graph = ScenarioGraph()
+    graph.get('roi')
+    base = graph.inputs['series_b_valuation']
+    bump = iter(range(1, 10_000))
+
+    def rerun():
+        graph.update({'series_b_valuation': base + next(bump)})
+        return graph.get('roi')
+
+    live, _ = timed(rerun, 50)
+    print(f"{size} Series B valuations")
+    print(f"{'one call per valuation':>24} {loop * 1e3:10.1f} ms")
+    print(f"{'one vectorized call':>24} {vectorized * 1e3:10.1f} ms")
+    print(f"{'live ROI recompute':>24} {live * 1e3:10.2f} ms per valuation change")
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
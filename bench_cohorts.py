@@ -0,0 +1,73 @@
+# Cohort retention triangle: one cohort at a time versus retention_matrix's
+# single broadcast, monthly (120) to daily (10k) series, and a 1-year band
+# of the daily triangle; then the cohort projection, acquisitions behind a
+# customer count and back to active customers, checked against the triangle
+#
+#   python bench_cohorts.py [largest series] [band]
+
+import sys
+import time
+
+import numpy as np
+
+from cohorts import (_log_survival, acquisitions, active_customers, age_retention,
+                     retention_matrix)
+
+# Largest series the per-cohort loop is run for
+LOOP_LIMIT = 4000
+
+
+def timed(fn, repeats=5):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        result = fn()
+    return (time.perf_counter() - start) / repeats, result
+
+
+def per_cohort(churn):
+    # Row c: the cohort acquired in period c, aged 0..n-c-1
+    log_p = _log_survival(churn)
+    n = len(log_p)
+    q = age_retention(n)
+    matrix = np.full((n, n), np.nan)
+    for c in range(n):
+        matrix[c, :n - c] = q[:n - c] * np.exp(log_p[c:] - log_p[c])
+    return matrix
+
+
+def main(largest=10_000, band=365):
+    print(f"{'periods':>8} {'per cohort':>14} {'broadcast':>12} {'MB':>6}")
+    for n in (120, 1_000, largest):
+        churn = np.linspace(0.09, 0.015, n) * 120 / n
+        fast, matrix = timed(lambda: retention_matrix(churn, dtype='float32'), 1)
+        if n <= LOOP_LIMIT:
+            slow, expected = timed(lambda: per_cohort(churn), 1)
+            assert np.allclose(matrix, expected, equal_nan=True)
+            slow = f'{slow * 1e3:11.1f} ms'
+        else:
+            slow = f"{'-':>14}"
+        print(f"{n:>8} {slow} {fast * 1e3:9.1f} ms {matrix.nbytes / 1e6:>6.0f}")
+        del matrix
+
+    churn = np.full(largest, 0.002)
+    banded, matrix = timed(lambda: retention_matrix(churn, ages=band, dtype='float32'), 1)
+    print(f"{largest} x {band} retention band: {banded * 1e3:.1f} ms, {matrix.nbytes / 1e6:.0f} MB")
+
+    print(f"\n{'periods':>8} {'acquisitions':>14} {'active':>10}")
+    for n in (120, 1_000, largest):
+        churn = np.linspace(0.09, 0.015, n) * 120 / n
+        customers = 35 * np.power(1 + 12 / n, np.arange(n))
+        inverse, new = timed(lambda: acquisitions(customers, churn), 1)
+        forward, active = timed(lambda: active_customers(new, churn), 1)
+        assert np.allclose(active, customers)
+        if n <= LOOP_LIMIT:
+            # Every cohort's survivors, summed by calendar period
+            survivors = new[:, np.newaxis] * per_cohort(churn)
+            cohort, age = np.indices(survivors.shape)
+            by_period = np.bincount((cohort + age).ravel(), np.nan_to_num(survivors).ravel())[:n]
+            assert np.allclose(by_period, customers)
+        print(f"{n:>8} {inverse * 1e3:11.1f} ms {forward * 1e3:7.1f} ms")
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,87 @@
+# Cold start of the dashboard: time to first paint (the first element the
+# page emits) and to the full base-case page in a fresh process, with fast
+# start (deferred NumPy/pandas imports, see lazy.py) and with eager imports
+# (DASHBOARD_FAST_START=0). Each run is profiled with -X importtime, and the
+# heaviest imports made while the page script ran are listed.
+#
+#   python bench_coldstart.py [runs]
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+APP = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'app.py')
+MARKER = '--- page script ---'
+
+
+def child():
+    start = time.perf_counter()
+    from streamlit.delta_generator import DeltaGenerator
+    from streamlit.testing.v1 import AppTest
+    preload = time.perf_counter() - start
+
+    first = []
+    enqueue = DeltaGenerator._enqueue
+
+    def timed_enqueue(self, *args, **kwargs):
+        if not first:
+            first.append(time.perf_counter())
+        return enqueue(self, *args, **kwargs)
+
+    DeltaGenerator._enqueue = timed_enqueue
+    at = AppTest.from_file(APP, default_timeout=60)
+    print(MARKER, file=sys.stderr, flush=True)
+    run_start = time.perf_counter()
+    at.run()
+    done = time.perf_counter() - run_start
+    if at.exception:
+        raise RuntimeError(at.exception)
+    print(preload, first[0] - run_start, done)
+
+
+def imports(stderr):
+    """``[(cumulative seconds, module)]`` of top-level imports after the marker."""
+    found = []
+    for line in stderr.split(MARKER, 1)[-1].splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative_us, name = line.split('|')
+        if name.startswith('   ') or not cumulative_us.strip().isdigit():
+            continue  # nested import, or the header line
+        found.append((int(cumulative_us) / 1e6, name.strip()))
+    return found
+
+
+def run(fast):
+    env = dict(os.environ, DASHBOARD_FAST_START='1' if fast else '0')
+    out = subprocess.run([sys.executable, '-X', 'importtime', __file__, '--child'],
+                         env=env, capture_output=True, text=True, check=True)
+    preload, first_paint, done = (float(x) for x in out.stdout.split())
+    return preload, first_paint, done, imports(out.stderr)
+
+
+def main(runs=3):
+    print(f"{'mode':>6} {'streamlit (s)':>14} {'first paint (s)':>16} {'full page (s)':>14} "
+          f"{'page imports (s)':>17}")
+    heaviest = {}
+    for fast in (False, True):
+        results = [run(fast) for _ in range(runs)]
+        preload, first_paint, done = (statistics.median(r[i] for r in results) for i in range(3))
+        loaded = results[-1][3]
+        mode = 'fast' if fast else 'eager'
+        heaviest[mode] = sorted(loaded, reverse=True)[:5]
+        print(f"{mode:>6} {preload:>14.3f} {first_paint:>16.3f} {done:>14.3f} "
+              f"{sum(s for s, _ in loaded):>17.3f}")
+    for mode, top in heaviest.items():
+        print(f"\nheaviest imports while the page ran ({mode}):")
+        for seconds, name in top:
+            print(f"  {seconds * 1e3:8.1f} ms  {name}")
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--child']:
+        child()
+    else:
+        main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,45 @@
+# Memory of each dataset as pandas infers it from the CSV (float64, int64,
+# strings) versus with its declared schema (datasets.SCHEMAS), at the
+# published size and with the rows repeated up to a larger size
+#
+#   python bench_dtypes.py [rows]
+
+import sys
+
+import pandas as pd
+
+from datasets import DATASETS, apply_schema
+
+
+def inferred(name):
+    csv_path, parse_dates = DATASETS[name]
+    return pd.read_csv(csv_path, parse_dates=parse_dates)
+
+
+def scaled(df, rows):
+    reps = -(-rows // len(df))
+    return pd.concat([df] * reps, ignore_index=True).iloc[:rows]
+
+
+def mb(df):
+    return df.memory_usage(index=False, deep=True).sum() / 1e6
+
+
+def main(rows=1_000_000):
+    print(f"{'dataset':>15} {'rows':>9} {'inferred MB':>12} {'schema MB':>10} {'saved':>6}")
+    totals = {}
+    for name in DATASETS:
+        base = inferred(name)
+        for df in (base, scaled(base, rows)):
+            before, after = mb(df), mb(apply_schema(df, name))
+            total = totals.setdefault(len(df) == len(base), [0.0, 0.0])
+            total[0] += before
+            total[1] += after
+            print(f"{name:>15} {len(df):>9} {before:>12.3f} {after:>10.3f} {1 - after / before:>6.0%}")
+    for published, (before, after) in sorted(totals.items(), reverse=True):
+        label = 'published' if published else f'{rows} rows'
+        print(f"{'total':>15} {label:>9} {before:>12.3f} {after:>10.3f} {1 - after / before:>6.0%}")
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,96 @@
+# Unit economics from an event log: reading the whole CSV into one frame
+# versus streaming it through events.py in byte-range pieces, one process
+# and a pool of workers. The log is synthetic (the published historical
+# months, mostly transactions); each run is a fresh process and reports its
+# peak RSS, workers included, which should stay flat as the log grows.
+#
+#   python bench_events.py [rows ...]
+
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+import events
+from projection import CURRENT_MONTH, START_DATE
+
+# Rows generated per write
+WRITE_ROWS = 1_000_000
+
+# Pieces small enough that even the smallest log splits across the workers
+CHUNK_BYTES = 16 << 20
+
+
+def write_log(path, rows, seed=0):
+    """A time-ordered log of ``rows`` events over the historical months."""
+    rng = np.random.default_rng(seed)
+    start = np.datetime64(START_DATE, 's')
+    end = np.datetime64(START_DATE, 'M') + CURRENT_MONTH
+    seconds = (end - start) // np.timedelta64(1, 's')
+    for first in range(0, rows, WRITE_ROWS):
+        n = min(WRITE_ROWS, rows - first)
+        offsets = (np.arange(first, first + n) * seconds) // rows
+        kind = rng.choice(np.array(['signup', 'churn', 'transaction']), n, p=[0.01, 0.001, 0.989])
+        amount = np.where(kind == 'transaction', np.round(rng.gamma(2.0, 150.0, n), 2), np.nan)
+        pd.DataFrame({
+            'Timestamp': np.datetime_as_string(start + offsets.astype('timedelta64[s]')),
+            'Customer_ID': rng.integers(0, 1_000_000, n),
+            'Event': kind,
+            'Amount': amount,
+        }).to_csv(path, mode='a', header=first == 0, index=False)
+
+
+def materialized(path):
+    return events.reduce_events(pd.read_csv(path))
+
+
+def streamed(path, workers):
+    totals = events.aggregate(path, workers=workers, chunk_bytes=CHUNK_BYTES, resume=False)
+    os.remove(events.progress_path(path))
+    return np.stack([totals[name] for name in events.TOTALS])
+
+
+def child(mode, path):
+    start = time.perf_counter()
+    totals = materialized(path) if mode == 'materialized' else streamed(path, int(mode))
+    seconds = time.perf_counter() - start
+    # ru_maxrss is in KiB on Linux; workers report as children
+    peak = max(resource.getrusage(who).ru_maxrss
+               for who in (resource.RUSAGE_SELF, resource.RUSAGE_CHILDREN))
+    print(peak / 1024, seconds, totals[2].sum())
+
+
+def run(mode, path):
+    out = subprocess.run([sys.executable, __file__, '--child', mode, path],
+                         capture_output=True, text=True, check=True).stdout
+    return [float(x) for x in out.split()]
+
+
+def main(sizes):
+    workers = max(os.cpu_count() or 1, 2)
+    print(f"{'rows':>11} {'CSV MB':>8} {'whole frame':>20} {'streamed':>20} "
+          f"{f'{workers} workers':>20}")
+    for rows in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'events.csv')
+            # Written by another process: a child's peak RSS starts from its parent's
+            subprocess.run([sys.executable, __file__, '--write', str(rows), path], check=True)
+            size = os.path.getsize(path) / 1e6
+            results = [run(mode, path) for mode in ('materialized', '1', str(workers))]
+        assert len({transactions for _, _, transactions in results}) == 1
+        cells = ' '.join(f'{peak:>7.0f} MB {seconds:>6.1f} s' for peak, seconds, _ in results)
+        print(f"{rows:>11,} {size:>8.0f} {cells}")
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--child']:
+        child(sys.argv[2], sys.argv[3])
+    elif sys.argv[1:2] == ['--write']:
+        write_log(sys.argv[3], int(sys.argv[2]))
+    else:
+        main([int(arg) for arg in sys.argv[1:]] or [1_000_000, 4_000_000])
@@ -0,0 +1,84 @@
+# Peak memory of exporting Monte Carlo scenarios to CSV: materializing every
+# path and calling to_csv (what script_6.py does for the base case) versus
+# streaming them block by block with export.py. Each run is a fresh process
+# and reports its peak RSS. Fails unless the streaming peak stays flat from
+# the smallest size to the largest: it may grow by at most GROWTH_TOLERANCE
+# of what the materialized peak grows, which must be at least MIN_GROWTH_MB
+# for the sizes to tell the two apart. The smallest size should span a few
+# seeding blocks (montecarlo.BLOCK_SIZE) so both ends run the same loop.
+#
+#   python bench_export.py [scenarios ...]
+
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import export
+from captable import diluted_equity
+from datasets import load_dataset
+from montecarlo import simulate
+from projection import to_frames
+from roi import roi_cube, roi_frame
+
+GROWTH_TOLERANCE = 0.1
+MIN_GROWTH_MB = 100
+
+
+def materialized(out_dir, n_paths):
+    paths = simulate(n_paths, metrics=export.SERIES)
+    rounds = load_dataset('funding_rounds')
+    financials, key_metrics, _ = to_frames(paths)
+    roi = roi_frame(roi_cube(paths['revenue'], rounds, equity=diluted_equity(rounds)), rounds)
+    for table, df in [('financials', financials), ('key_metrics', key_metrics), ('roi', roi)]:
+        df.to_csv(os.path.join(out_dir, f'scenarios_{table}.csv'), index=False)
+
+
+def streamed(out_dir, n_paths):
+    export.export_scenarios(out_dir, n_paths)
+
+
+def child(mode, n_paths):
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        {'materialized': materialized, 'streamed': streamed}[mode](tmp, n_paths)
+        seconds = time.perf_counter() - start
+        size = sum(os.path.getsize(os.path.join(tmp, f)) for f in os.listdir(tmp))
+    # ru_maxrss is in KiB on Linux
+    print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, seconds, size / 1e6)
+
+
+def run(mode, n_paths):
+    out = subprocess.run([sys.executable, __file__, '--child', mode, str(n_paths)],
+                         capture_output=True, text=True, check=True).stdout
+    return [float(x) for x in out.split()]
+
+
+def main(sizes):
+    print(f"{'scenarios':>10} {'CSV MB':>8} {'materialized MB':>16} {'streamed MB':>12} "
+          f"{'materialized (s)':>17} {'streamed (s)':>13}")
+    peaks = []
+    for n_paths in sizes:
+        peak_m, secs_m, size = run('materialized', n_paths)
+        peak_s, secs_s, _ = run('streamed', n_paths)
+        peaks.append((peak_m, peak_s))
+        print(f"{n_paths:>10} {size:>8.0f} {peak_m:>16.0f} {peak_s:>12.0f} {secs_m:>17.1f} {secs_s:>13.1f}")
+
+    materialized_growth, streamed_growth = (last - first for first, last in zip(peaks[0], peaks[-1]))
+    print(f"peak growth from {sizes[0]} to {sizes[-1]} scenarios: materialized "
+          f"{materialized_growth:+.0f} MB, streamed {streamed_growth:+.0f} MB")
+    assert materialized_growth >= MIN_GROWTH_MB, (
+        f"materialized peak grew {materialized_growth:.0f} MB, under {MIN_GROWTH_MB} MB: "
+        "sizes too close to tell the modes apart")
+    assert streamed_growth <= GROWTH_TOLERANCE * materialized_growth, (
+        f"streamed peak grew {streamed_growth:.0f} MB with the number of scenarios, over "
+        f"{GROWTH_TOLERANCE:.0%} of the materialized growth")
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--child']:
+        child(sys.argv[2], int(sys.argv[3]))
+    else:
+        main([int(arg) for arg in sys.argv[1:]] or [2000, 4000, 8000])
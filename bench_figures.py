@@ -0,0 +1,47 @@
+
+# Time the dashboard's four figures built from scratch versus served from
+# the figure cache on an unchanged rerun, and report hit/miss counts
+#
+#   python bench_figures.py
+
+import time
+
+import numpy as np
+
+from figures import cache_stats, customers_figure, market_figure, revenue_figure, roi_figure
+from scenario import ScenarioGraph
+
+
+def build_all(graph):
+    roi = graph.get('roi')
+    roi_5yr = roi[(roi['Years'] == 5) & roi['Round'].isin(['Series A', 'Series B', 'Series C'])]
+    bands = graph.get('bands')
+    roi_figure(tuple(roi_5yr['Round']), roi_5yr['ROI_Percentage'].to_numpy())
+    revenue_figure(graph.get('revenue'), graph.current_month, bands['revenue'])
+    market_figure(('TAM', 'SAM', 'SOM'), np.array([45, 12, 0.6]), ('$45B', '$12B', '$600M'))
+    customers_figure(graph.get('customers'), graph.current_month, bands['customers'])
+
+
+def main(repeat=20):
+    graph = ScenarioGraph()
+    build_all(graph)
+
+    cold, warm = [], []
+    for _ in range(repeat):
+        for builder in (roi_figure, revenue_figure, market_figure, customers_figure):
+            builder.cache_clear()
+        start = time.perf_counter()
+        build_all(graph)
+        cold.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        build_all(graph)
+        warm.append(time.perf_counter() - start)
+
+    print(f"rebuild all figures: {np.median(cold) * 1e3:7.2f} ms")
+    print(f"cached rerun:        {np.median(warm) * 1e3:7.2f} ms")
+    for name, info in cache_stats().items():
+        print(f"{name:>18}: {info.hits} hits, {info.misses} misses, {info.currsize}/{info.maxsize} cached")
+
+
+if __name__ == '__main__':
+    main()
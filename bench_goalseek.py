@@ -0,0 +1,72 @@
+# Goal-seek latency: goalseek.py (one vectorized grid pass, then secant /
+# bisection refinement on a single path) versus plain bisection that sets the
+# input on the ScenarioGraph and recomputes the ROI table for every guess,
+# i.e. what rerunning the model by hand amounts to
+#
+#   python bench_goalseek.py [repeats]
+
+import sys
+import time
+
+from goalseek import goal_seek
+from roi import valuation_multiple
+from scenario import ScenarioGraph, round_key
+
+CASES = [
+    ('roi', 2_000_000, 'revenue_growth_series_a', {}),
+    ('roi', 1_000_000, 'revenue_growth_series_b', {}),
+    ('roi', 2_000_000, round_key('Series A', 'valuation'), {}),
+    ('arr', 5e9, 'revenue_growth_series_b', {}),
+    ('valuation', 1e11, 'revenue_growth_series_c', {'month': 72}),
+]
+
+
+def graph_bisection(graph, target, value, lever, round_name='Series A', years=5, month=60,
+                    tol=1e-9):
+    lo, hi = (0.0, 1.0) if 'growth' in lever else (1e7, 1e10)
+    rising = 'growth' in lever
+
+    def evaluate(x):
+        graph.update({lever: int(round(x)) if 'valuation' in lever else x})
+        if target in ('arr', 'valuation'):
+            arr = graph.get('financials')['Revenue'].iloc[month] * 12
+            return arr if target == 'arr' else arr * valuation_multiple(arr)
+        roi = graph.get('roi')
+        return roi.loc[(roi['Round'] == round_name) & (roi['Years'] == years),
+                       'ROI_Percentage'].item()
+
+    evaluations = 0
+    while hi - lo > tol * (hi if not rising else 1):
+        mid = (lo + hi) / 2
+        evaluations += 1
+        if (evaluate(mid) >= value) == rising:
+            hi = mid
+        else:
+            lo = mid
+    graph.reset()
+    return (hi if rising else lo), evaluations
+
+
+def timed(fn, repeats):
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main(repeats=5):
+    graph = ScenarioGraph()
+    print(f"{'target':>10} {'lever':>26} {'goal seek (ms)':>15} {'evals':>6} "
+          f"{'graph bisection (ms)':>21} {'evals':>6} {'answer':>12} {'bisection':>12}")
+    for target, value, lever, kwargs in CASES:
+        fast, result = timed(lambda: goal_seek(graph, target, value, lever, **kwargs), repeats)
+        slow, (answer, evaluations) = timed(
+            lambda: graph_bisection(graph, target, value, lever, **kwargs), 1)
+        print(f"{target:>10} {lever:>26} {fast * 1e3:>15.2f} {result.evaluations:>6} "
+              f"{slow * 1e3:>21.1f} {evaluations:>6} {result.value:>12.6g} {answer:>12.6g}")
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
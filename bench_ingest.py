@@ -0,0 +1,59 @@
+
+# Time recording the next month of actuals with ingest.py against rewriting
+# every table, on histories scaled up from the published data
+#
+#   python bench_ingest.py [months ...]
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+from columnar import columnar_path, write_columnar
+from datasets import DATASETS
+from ingest import ingest_month
+
+TABLES = ['financials', 'key_metrics', 'team']
+
+
+def scaled(name, months, current_month):
+    base = pd.read_csv(DATASETS[name][0], float_precision='round_trip')
+    reps = -(-months // len(base))
+    df = pd.concat([base] * reps, ignore_index=True).iloc[:months]
+    df['Date'] = pd.date_range('2024-01-31', periods=months, freq='D').strftime('%Y-%m-%d')
+    df['Is_Historical'] = df.index < current_month
+    return df
+
+
+def full_rewrite(tables, directory):
+    for name, df in tables.items():
+        csv_path = os.path.join(directory, DATASETS[name][0])
+        df.to_csv(csv_path, index=False)
+        columnar = df.copy()
+        columnar['Date'] = pd.to_datetime(columnar['Date'])
+        write_columnar(columnar, columnar_path(csv_path))
+
+
+def main(sizes):
+    print(f"{'months':>10} {'full rewrite (s)':>17} {'ingest (s)':>11} {'speedup':>8}")
+    for months in sizes:
+        current_month = months - 10
+        with tempfile.TemporaryDirectory() as tmp:
+            tables = {name: scaled(name, months, current_month) for name in TABLES}
+            for name in ['roi', 'funding_rounds']:
+                shutil.copy(DATASETS[name][0], tmp)
+            start = time.perf_counter()
+            full_rewrite(tables, tmp)
+            full = time.perf_counter() - start
+
+            start = time.perf_counter()
+            ingest_month(current_month + 1, {'revenue': 500_000.0, 'customers': 1_000}, tmp)
+            incremental = time.perf_counter() - start
+        print(f"{months:>10} {full:>17.3f} {incremental:>11.4f} {full / incremental:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or [120, 100_000, 1_000_000])
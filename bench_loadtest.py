@@ -0,0 +1,189 @@
+
+# Load test: N simulated investor sessions driving app.py through
+# Streamlit's AppTest. Each session loads the page, then performs a random
+# mix of plain reruns, slider and round-term changes and resets. Reports
+# rerun latency percentiles per action, the memory each extra session adds
+# and the hit rates of the caches the sessions share, and writes the
+# results to bench_results/loadtest-<commit>.json so runs can be compared
+# across commits (-dirty when tracked files have uncommitted changes).
+#
+# All sessions live in this one process, as they do in a `streamlit run`
+# server: they share the imported modules, the figure cache, the company
+# cache (datasets and snapshot) and the sensitivity cache. AppTest swaps a
+# process-wide Runtime in and out around every run, so reruns cannot
+# overlap; the sessions take turns, one action each, and the latencies are
+# those of an uncontended server. Memory per session is the resident set
+# growth from opening the second session to the last, after the first has
+# paid for the imports and filled the caches.
+#
+#   python bench_loadtest.py [sessions] [actions per session]
+
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+APP = os.path.join(HERE, 'app.py')
+RESULTS_DIR = os.path.join(HERE, 'bench_results')
+
+SLIDERS = ['revenue_growth_series_a', 'revenue_growth_series_b', 'customer_growth_series_a',
+           'cogs_ratio', 'sales_marketing_ratio']
+ROUND_INPUTS = ['series_a_valuation', 'series_b_valuation', 'series_c_amount']
+# action -> relative weight
+ACTIONS = {'rerun': 4, 'slider': 3, 'round': 2, 'reset': 1}
+
+
+def git(*args):
+    return subprocess.run(['git', *args], cwd=HERE, capture_output=True, text=True,
+                          check=True).stdout.strip()
+
+
+def commit():
+    """The checked-out commit, ``-dirty`` if tracked files differ from it."""
+    try:
+        head = git('rev-parse', '--short', 'HEAD')
+        return head + '-dirty' if git('status', '--porcelain', '--untracked-files=no') else head
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def rss_mb():
+    """Resident set size of this process now (peak where /proc is missing)."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2**20
+    except OSError:
+        # ru_maxrss is in KiB on Linux, bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 2**20 if sys.platform == 'darwin' else peak / 1024
+
+
+def open_session():
+    from streamlit.testing.v1 import AppTest
+    at = AppTest.from_file(APP, default_timeout=120)
+    start = time.perf_counter()
+    at.run()
+    if at.exception:
+        raise RuntimeError(f"page load failed: {at.exception}")
+    return at, time.perf_counter() - start
+
+
+def act(at, action, rng):
+    if action == 'slider':
+        at.slider(key=SLIDERS[rng.integers(len(SLIDERS))]).set_value(float(rng.integers(0, 60)) / 2)
+    elif action == 'round':
+        at.number_input(key=ROUND_INPUTS[rng.integers(len(ROUND_INPUTS))]).set_value(
+            float(rng.integers(20, 400)) / 2)
+    elif action == 'reset':
+        at.button[0].click()
+    start = time.perf_counter()
+    at.run()
+    elapsed = time.perf_counter() - start
+    if at.exception:
+        raise RuntimeError(f"{action} rerun failed: {at.exception}")
+    return elapsed
+
+
+def percentiles(timings):
+    ms = np.array(timings) * 1e3
+    return {'count': len(ms), 'p50_ms': float(np.percentile(ms, 50)),
+            'p90_ms': float(np.percentile(ms, 90)), 'p99_ms': float(np.percentile(ms, 99)),
+            'max_ms': float(ms.max())}
+
+
+def hit_rate(hits, misses):
+    return {'hits': hits, 'misses': misses,
+            'hit_rate': hits / (hits + misses) if hits + misses else None}
+
+
+def main(n_sessions=8, n_actions=25):
+    import figures
+    from companies import companies
+
+    baseline = rss_mb()
+    sessions, loads, opened = [], [], []
+    for _ in range(n_sessions):
+        at, load = open_session()
+        sessions.append(at)
+        loads.append(load)
+        opened.append(rss_mb())
+    per_session = ((opened[-1] - opened[0]) / (n_sessions - 1) if n_sessions > 1 else None)
+
+    # Round robin: every session takes its next action in turn
+    names, weights = list(ACTIONS), np.array(list(ACTIONS.values()), dtype=float)
+    rngs = [np.random.default_rng(i) for i in range(n_sessions)]
+    by_action, reruns = {}, []
+    start = time.perf_counter()
+    for _ in range(n_actions):
+        for at, rng in zip(sessions, rngs):
+            action = names[rng.choice(len(names), p=weights / weights.sum())]
+            elapsed = act(at, action, rng)
+            by_action.setdefault(action, []).append(elapsed)
+            reruns.append(elapsed)
+    wall = time.perf_counter() - start
+
+    builders = {name: info._asdict() for name, info in figures.cache_stats().items()}
+    recomputed = {}
+    for at in sessions:
+        if 'scenario' in at.session_state:
+            for node, count in at.session_state['scenario'].recomputed.items():
+                recomputed[node] = recomputed.get(node, 0) + count
+
+    results = {
+        'commit': commit(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'cpus': os.cpu_count(),
+        'sessions': n_sessions,
+        'actions_per_session': n_actions,
+        'wall_s': wall,
+        'reruns_per_s': len(reruns) / wall,
+        'page_load': percentiles(loads),
+        'first_page_load_ms': loads[0] * 1e3,
+        'rerun': percentiles(reruns),
+        'rerun_by_action': {action: percentiles(t) for action, t in sorted(by_action.items())},
+        'memory_mb': {
+            'before_sessions': baseline,
+            'after_first_session': opened[0],
+            'per_extra_session': per_session,
+            'after_actions': rss_mb(),
+        },
+        'figure_cache': dict(hit_rate(sum(info['hits'] for info in builders.values()),
+                                      sum(info['misses'] for info in builders.values())),
+                             builders=builders),
+        'company_cache': hit_rate(companies.hits, companies.misses),
+        'scenario_recomputations': recomputed,
+    }
+
+    print(f"{n_sessions} sessions x {n_actions} actions in one process: {wall:.1f} s "
+          f"({results['reruns_per_s']:.1f} reruns/s)")
+    print(f"{'':>10} {'count':>6} {'p50 (ms)':>9} {'p90 (ms)':>9} {'p99 (ms)':>9}")
+    rows = [('page load', results['page_load']), ('all reruns', results['rerun'])]
+    rows += list(results['rerun_by_action'].items())
+    for name, p in rows:
+        print(f"{name:>10} {p['count']:>6} {p['p50_ms']:>9.1f} {p['p90_ms']:>9.1f} {p['p99_ms']:>9.1f}")
+    memory = results['memory_mb']
+    print(f"RSS: {memory['before_sessions']:.0f} MB before, {memory['after_first_session']:.0f} MB "
+          f"after the first session, {memory['after_actions']:.0f} MB at the end")
+    if per_session is not None:
+        print(f"each further session: {per_session:+.1f} MB")
+    for name in ('figure_cache', 'company_cache'):
+        cache = results[name]
+        print(f"{name.replace('_', ' ')} hit rate: {cache['hit_rate']:.1%} "
+              f"({cache['hits']} hits, {cache['misses']} misses)")
+
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    path = os.path.join(RESULTS_DIR, f"loadtest-{results['commit']}.json")
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"wrote {os.path.relpath(path, HERE)}")
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
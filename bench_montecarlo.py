@@ -0,0 +1,57 @@
+
+# Benchmark the Monte Carlo simulator: wall time and peak memory for the
+# materialized and chunked modes, and process-pool scaling across cores
+#
+#   python bench_montecarlo.py [paths]
+#   python bench_montecarlo.py --scaling [paths]
+
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from montecarlo import CHUNK_SIZE, simulate_bands
+
+
+def measure(n_paths, chunk_size):
+    tracemalloc.start()
+    start = time.perf_counter()
+    simulate_bands(n_paths, chunk_size=chunk_size)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1e6
+
+
+def modes(n_paths):
+    print(f"{n_paths:,} paths x 120 months")
+    print(f"{'mode':>22} {'time (s)':>10} {'peak (MB)':>10}")
+    for label, chunk_size in [('materialized', None), (f'chunked ({CHUNK_SIZE:,})', CHUNK_SIZE)]:
+        elapsed, peak = measure(n_paths, chunk_size)
+        print(f"{label:>22} {elapsed:>10.2f} {peak:>10.1f}")
+
+
+def scaling(n_paths):
+    cores = os.cpu_count() or 1
+    counts = sorted({1, 2, 4, cores})
+    print(f"{n_paths:,} paths x 120 months, {cores} core(s) available")
+    print(f"{'workers':>8} {'time (s)':>10} {'speedup':>9} {'identical':>10}")
+    baseline = reference = None
+    for workers in counts:
+        start = time.perf_counter()
+        bands = simulate_bands(n_paths, workers=workers)
+        elapsed = time.perf_counter() - start
+        if reference is None:
+            baseline, reference = elapsed, bands
+        identical = all(np.array_equal(bands[m], reference[m]) for m in reference)
+        print(f"{workers:>8} {elapsed:>10.2f} {baseline / elapsed:>8.2f}x {str(identical):>10}")
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    if args and args[0] == '--scaling':
+        scaling(int(args[1]) if len(args) > 1 else 1_000_000)
+    else:
+        modes(int(args[0]) if args else 100_000)
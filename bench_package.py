@@ -0,0 +1,63 @@
+# Time the deployment ZIP: the old zipfile loop (every file re-deflated on
+# every run) against package.build cold, with a worker pool, and with
+# unchanged inputs, on a company directory whose CSVs are scaled up to
+# ``rows`` rows
+#
+#   python bench_package.py [rows ...]
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+import zipfile
+
+import pandas as pd
+
+import package
+from datasets import DATASETS
+
+
+def company(directory, rows):
+    for csv_path, _ in DATASETS.values():
+        base = pd.read_csv(csv_path)
+        reps = -(-rows // len(base))
+        pd.concat([base] * reps, ignore_index=True).iloc[:rows].to_csv(
+            os.path.join(directory, csv_path), index=False)
+    for path in ['company_info.json', 'market_data.json', 'snapshot.json']:
+        shutil.copy(path, directory)
+
+
+def zipfile_loop(path, files):
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+        for source, arcname in files:
+            zipf.write(source, arcname)
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main(sizes):
+    workers = os.cpu_count()
+    print(f"{'rows':>10} {'MB':>7} {'zipfile (s)':>12} {'cold (s)':>9} "
+          f"{f'{workers} workers (s)':>14} {'unchanged (s)':>14}")
+    for rows in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            company(tmp, rows)
+            files = [f for f in package.package_files(tmp) if os.path.isfile(f[0])]
+            mb = sum(os.path.getsize(source) for source, _ in files) / 1e6
+            out = os.path.join(tmp, 'deck.zip')
+            loop = timed(lambda: zipfile_loop(out, files))
+            package._compressed.clear()
+            cold = timed(lambda: package.build(out, tmp, workers=1, force=True))
+            package._compressed.clear()
+            pooled = timed(lambda: package.build(out, tmp, workers=workers, force=True))
+            unchanged = timed(lambda: package.build(out, tmp, workers=workers))
+        print(f"{rows:>10} {mb:>7.1f} {loop:>12.3f} {cold:>9.3f} {pooled:>14.3f} {unchanged:>14.3f}")
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or [120, 100_000, 1_000_000])
@@ -0,0 +1,148 @@
+
+# Benchmark the vectorized projection engine against the original loops
+# from script_6.py at 120, 10k and 1M months
+#
+#   python bench_projection.py [months ...]
+
+import sys
+import time
+
+import numpy as np
+
+from projection import project
+
+
+def loop_revenue_costs(months, current_month=18):
+    revenue = []
+    base_revenue = 8000
+    for i in range(months):
+        if i < 6:
+            if i == 0:
+                revenue.append(base_revenue)
+            else:
+                growth = np.random.uniform(0.12, 0.18)
+                revenue.append(revenue[-1] * (1 + growth))
+        elif i < 18:
+            growth = np.random.uniform(0.28, 0.35)
+            revenue.append(revenue[-1] * (1 + growth))
+        elif i < 36:
+            revenue.append(revenue[-1] * 1.22)
+        elif i < 54:
+            revenue.append(revenue[-1] * 1.16)
+        elif i < 72:
+            revenue.append(revenue[-1] * 1.12)
+        else:
+            growth_rate = max(0.05, 0.12 - (i - 72) * 0.001)
+            revenue.append(revenue[-1] * (1 + growth_rate))
+
+    cogs, sales_marketing, rd_costs, admin_costs = [], [], [], []
+    for i, r in enumerate(revenue):
+        if i < current_month:
+            cogs.append(r * np.random.uniform(0.28, 0.32))
+            sales_marketing.append(r * np.random.uniform(0.38, 0.45))
+            rd_costs.append(r * np.random.uniform(0.22, 0.28))
+            admin_costs.append(r * np.random.uniform(0.12, 0.18))
+        else:
+            scale_factor = min(1.0, (i - current_month) / 60)
+            cogs.append(r * (0.30 - 0.05 * scale_factor))
+            sales_marketing.append(r * (0.40 - 0.10 * scale_factor))
+            rd_costs.append(r * (0.25 - 0.05 * scale_factor))
+            admin_costs.append(r * (0.15 - 0.05 * scale_factor))
+
+    total_costs = [cogs[i] + sales_marketing[i] + rd_costs[i] + admin_costs[i] for i in range(months)]
+    profit = [revenue[i] - total_costs[i] for i in range(months)]
+    return revenue, total_costs, profit
+
+
+def loop_customers(months, current_month=18):
+    customers = []
+    base_customers = 35
+    for i in range(months):
+        if i == 0:
+            customers.append(base_customers)
+        elif i < current_month:
+            growth = np.random.uniform(0.18, 0.25)
+            customers.append(int(customers[-1] * (1 + growth)))
+        else:
+            if i < 36:
+                growth = 0.20
+            elif i < 54:
+                growth = 0.17
+            elif i < 72:
+                growth = 0.14
+            else:
+                growth = max(0.08, 0.14 - (i - 72) * 0.0008)
+            customers.append(int(customers[-1] * (1 + growth)))
+    return customers
+
+
+def loop_metrics_team(months, current_month=18):
+    cac = [max(45, 220 - i*1.5) for i in range(months)]
+    ltv = [min(4500, 450 + i*35) for i in range(months)]
+    churn = [max(1.5, 9.0 - i*0.08) for i in range(months)]
+    engineering = [int(3 * (1.06 ** i)) for i in range(months)]
+    sales = [int(2 * (1.08 ** i)) for i in range(months)]
+    operations = [int(1 * (1.05 ** i)) for i in range(months)]
+    leadership = [min(8, 2 + i // 12) for i in range(months)]
+    return cac, ltv, churn, engineering, sales, operations, leadership
+
+
+def time_loops(months):
+    """Time each loop stage; a stage that overflows Python ints reports None."""
+    np.random.seed(42)
+    timings = {}
+    results = {}
+    for name, stage in [('revenue_costs', loop_revenue_costs),
+                        ('customers', loop_customers),
+                        ('metrics_team', loop_metrics_team)]:
+        start = time.perf_counter()
+        try:
+            results[name] = stage(months)
+        except OverflowError:
+            timings[name] = None
+            continue
+        timings[name] = time.perf_counter() - start
+    return timings, results
+
+
+def time_engine(months, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with np.errstate(over='ignore', invalid='ignore'):
+            projection = project(months=months)
+        best = min(best, time.perf_counter() - start)
+    return best, projection
+
+
+def check_equal(results, projection):
+    revenue, total_costs, profit = results['revenue_costs']
+    assert np.array_equal(projection['revenue'], revenue)
+    assert np.array_equal(projection['total_costs'], total_costs)
+    assert np.array_equal(projection['profit'], profit)
+    assert np.array_equal(projection['customers'], results['customers'])
+    cac, ltv, churn, engineering, sales, operations, leadership = results['metrics_team']
+    assert np.array_equal(projection['cac'], cac)
+    assert np.array_equal(projection['engineering'], engineering)
+    assert np.array_equal(projection['leadership'], leadership)
+
+
+def main(sizes):
+    print(f"{'months':>10} {'loop (s)':>12} {'engine (s)':>12} {'speedup':>9}")
+    for months in sizes:
+        loop_timings, results = time_loops(months)
+        engine_time, projection = time_engine(months)
+        if months <= 120:
+            check_equal(results, projection)
+        if None in loop_timings.values():
+            overflowed = [k for k, v in loop_timings.items() if v is None]
+            partial = sum(v for v in loop_timings.values() if v is not None)
+            print(f"{months:>10} {partial:>11.4f}+ {engine_time:>12.4f} {'n/a':>9}"
+                  f"  (loop overflowed in: {', '.join(overflowed)})")
+        else:
+            loop_time = sum(loop_timings.values())
+            print(f"{months:>10} {loop_time:>12.4f} {engine_time:>12.4f} {loop_time / engine_time:>8.1f}x")
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or [120, 10_000, 1_000_000])
@@ -0,0 +1,52 @@
+
+# Build the revenue figure at several trace lengths with SVG scatter and
+# with WebGL (both at full resolution) and with the app's defaults, and
+# report construction time, JSON serialization time and payload size (what
+# Streamlit ships to the browser). WebGL does not shrink the payload; it
+# moves drawing off the browser's SVG renderer.
+#
+#   python bench_render.py [points ...]
+
+import sys
+import time
+
+import numpy as np
+
+from figures import revenue_figure
+
+
+def best_of(fn, repeat=3):
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def series(points, current_month=18):
+    # Smooth growth with noise, so it renders like a long revenue path
+    rng = np.random.default_rng(0)
+    revenue = 50_000 * np.exp(np.cumsum(rng.normal(0.0005, 0.01, points)))
+    band = np.stack([revenue * 0.8, revenue, revenue * 1.25])
+    return revenue, current_month, band
+
+
+def main(sizes):
+    print(f"{'points':>9} {'mode':>7} {'build (ms)':>11} {'to_json (ms)':>13} {'payload (KB)':>13}")
+    for points in sizes:
+        revenue, current_month, band = series(points)
+        modes = [
+            ('svg', dict(max_points=None, gl_threshold=float('inf'))),
+            ('webgl', dict(max_points=None, gl_threshold=0)),
+            ('auto', dict()),  # app defaults: LTTB downsampling, WebGL above the threshold
+        ]
+        for mode, options in modes:
+            build = lambda: revenue_figure.__wrapped__(revenue, current_month, band, **options)
+            build_time, fig = best_of(build)
+            json_time, payload = best_of(fig.to_json)
+            print(f"{points:>9} {mode:>7} {build_time * 1e3:>11.1f} {json_time * 1e3:>13.1f} "
+                  f"{len(payload) / 1024:>13.0f}")
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or [1_000, 10_000, 100_000, 1_000_000])
@@ -0,0 +1,41 @@
+
+# Time an incremental what-if update for each kind of sidebar input and
+# report which graph nodes it recomputed
+#
+#   python bench_scenario.py
+
+import time
+
+import numpy as np
+
+from scenario import ScenarioGraph
+
+TWEAKS = [
+    ('series_b_valuation', 200_000_000),
+    ('cogs_ratio', 0.27),
+    ('customer_growth_series_a', 0.22),
+    ('revenue_growth_series_a', 0.25),
+]
+
+
+def main(repeat=20):
+    graph = ScenarioGraph()
+    for node in ['financials', 'key_metrics', 'roi', 'bands']:
+        graph.get(node)
+
+    print(f"{'input':>26} {'median (ms)':>12}  recomputed")
+    for key, value in TWEAKS:
+        timings = []
+        for k in range(repeat):
+            before = graph.recomputed.copy()
+            start = time.perf_counter()
+            graph.update({key: value if k % 2 == 0 else graph.defaults[key]})
+            for node in ['financials', 'key_metrics', 'roi', 'bands']:
+                graph.get(node)
+            timings.append(time.perf_counter() - start)
+        nodes = sorted((graph.recomputed - before).keys())
+        print(f"{key:>26} {np.median(timings) * 1e3:>12.1f}  {', '.join(nodes)}")
+
+
+if __name__ == '__main__':
+    main()
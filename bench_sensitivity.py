@@ -0,0 +1,65 @@
+# Sensitivity analysis of every model input: one batched project() call
+# over all 4 * inputs + 1 perturbations (sensitivity.py) versus one call per
+# perturbation, plus the cached lookup a rerun on the same base scenario gets
+#
+#   python bench_sensitivity.py [repeats]
+
+import sys
+import time
+
+import numpy as np
+
+import sensitivity
+from datasets import load_dataset
+from projection import ASSUMPTIONS
+from roi import ARR_MULTIPLES, ARR_THRESHOLDS
+from sensitivity import ARR_PARAMETERS, SWING, evaluate, parameters, perturbations
+
+
+def looped(batch, names, terms, r):
+    # Same model, one perturbation at a time
+    return [evaluate(row[np.newaxis], names, terms, r) for row in batch]
+
+
+def best(fn, repeats):
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def main(repeats=5):
+    rounds = load_dataset('funding_rounds')
+    r = list(rounds['Round']).index('Series A')
+    terms = {column: rounds[column].to_numpy(dtype=np.float64)
+             for column in ('Amount', 'Valuation', 'Option_Pool')}
+    terms['Month'] = rounds['Month'].to_numpy()
+    names = parameters()
+    base = ([ASSUMPTIONS[name] for name in ASSUMPTIONS] + list(ARR_THRESHOLDS)
+            + list(ARR_MULTIPLES) + [terms['Amount'][r], terms['Valuation'][r]])
+    batch = perturbations(base, SWING)
+    assert len(names) == len(ASSUMPTIONS) + len(ARR_PARAMETERS) + 2
+
+    batched, outputs = best(lambda: evaluate(batch, names, terms, r), repeats)
+    loop, rows = best(lambda: looped(batch, names, terms, r), 1)
+    for output, values in outputs.items():
+        assert np.allclose(values, [r[output][0] for r in rows], rtol=1e-12), output
+
+    def cold():
+        sensitivity.cache_clear()
+        return sensitivity.sensitivity(rounds=rounds)
+
+    full, _ = best(cold, repeats)
+    cached, _ = best(lambda: sensitivity.sensitivity(rounds=rounds), repeats)
+
+    print(f"{len(names)} inputs, {len(batch)} perturbations, {len(outputs)} outputs")
+    print(f"{'one call per perturbation':>28} {loop * 1e3:10.1f} ms")
+    print(f"{'one batched call':>28} {batched * 1e3:10.1f} ms")
+    print(f"{'sensitivity() incl. tables':>28} {full * 1e3:10.1f} ms")
+    print(f"{'cached (same base scenario)':>28} {cached * 1e3:10.3f} ms")
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,48 @@
+
+# Rerun latency of the base-case page rendered from the precompiled
+# snapshot versus compiled live from a ScenarioGraph, driven headlessly
+# through Streamlit's AppTest
+#
+#   python bench_snapshot.py [reruns]
+
+import os
+import sys
+import time
+
+import numpy as np
+from streamlit.testing.v1 import AppTest
+
+import snapshot
+from companies import companies
+
+APP = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'app.py')
+
+
+def rerun_latencies(reruns):
+    companies.clear()
+    at = AppTest.from_file(APP, default_timeout=60).run()
+    timings = []
+    for _ in range(reruns):
+        start = time.perf_counter()
+        at.run()
+        timings.append(time.perf_counter() - start)
+    if at.exception:
+        raise RuntimeError(at.exception)
+    return np.array(timings)
+
+
+def main(reruns=100):
+    if snapshot.load_snapshot() is None:
+        sys.exit("snapshot.json is missing or stale; run script_6.py first")
+    results = {'snapshot': rerun_latencies(reruns)}
+    snapshot.SNAPSHOT_FILE = os.devnull + '.missing'
+    results['live'] = rerun_latencies(reruns)
+
+    print(f"{'mode':>9} {'p50 (ms)':>9} {'p99 (ms)':>9}")
+    for mode, timings in results.items():
+        p50, p99 = np.percentile(timings, [50, 99]) * 1e3
+        print(f"{mode:>9} {p50:>9.1f} {p99:>9.1f}")
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
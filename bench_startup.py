@@ -0,0 +1,63 @@
+
+# Compare load_data()'s two startup paths: CSV parsing + to_datetime versus
+# the memory-mapped columnar store, at 120 rows and at a scenario-file scale
+#
+#   python bench_startup.py [rows ...]
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from columnar import columnar_path, load_table, write_columnar
+
+
+def scaled_financials(rows):
+    base = pd.read_csv('financials_10yr.csv', parse_dates=['Date'])
+    reps = -(-rows // len(base))
+    df = pd.concat([base] * reps, ignore_index=True).iloc[:rows]
+    df['Date'] = pd.date_range('2024-01-31', periods=rows, freq='h')
+    return df
+
+
+def best_of(fn, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(sizes):
+    print(f"{'rows':>10} {'csv (s)':>10} {'columnar (s)':>13} {'+scan (s)':>10} {'speedup':>9}")
+    for rows in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_path = os.path.join(tmp, 'financials.csv')
+            df = scaled_financials(rows)
+            df.to_csv(csv_path, index=False)
+            write_columnar(df, columnar_path(csv_path))
+
+            def csv_load():
+                frame = pd.read_csv(csv_path)
+                frame['Date'] = pd.to_datetime(frame['Date'])
+                return frame
+
+            def columnar_load():
+                return load_table(csv_path, parse_dates=['Date'])
+
+            def columnar_scan():
+                return float(np.sum(columnar_load()['Revenue']))
+
+            csv_time = best_of(csv_load)
+            col_time = best_of(columnar_load)
+            scan_time = best_of(columnar_scan)
+            print(f"{rows:>10} {csv_time:>10.4f} {col_time:>13.4f} {scan_time:>10.4f} "
+                  f"{csv_time / scan_time:>8.1f}x")
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or [120, 1_000_000])
@@ -0,0 +1,46 @@
+# Exit waterfall: every round's payout over a grid of exit values x exit
+# months in one vectorized call versus one call per exit month, and the
+# looped time extrapolated from a sample of months
+#
+#   python bench_waterfall.py [exit values] [sampled months]
+
+import sys
+import time
+
+import numpy as np
+
+from datasets import load_dataset
+from projection import MONTHS
+from waterfall import payouts
+
+
+def timed(fn, repeats=5):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        result = fn()
+    return (time.perf_counter() - start) / repeats, result
+
+
+def main(size=10_000, sample=12):
+    rounds = load_dataset('funding_rounds')
+    exit_values = np.linspace(0, 2e9, size)
+    months = np.linspace(0, MONTHS - 1, sample).astype(int)
+
+    def looped():
+        return [payouts(exit_values, rounds, exit_months=[m]) for m in months]
+
+    vectorized, grid = timed(lambda: payouts(exit_values, rounds))
+    loop, rows = timed(looped, 1)
+    for m, row in zip(months, rows):
+        assert np.allclose(grid.investors[:, m], row.investors[:, 0])
+    # Every exit dollar goes to a round or to common
+    assert np.allclose(grid.investors.sum(axis=-1) + grid.common, exit_values[:, np.newaxis])
+
+    print(f"{size} exit values x {MONTHS} months x {len(rounds)} rounds")
+    print(f"{'one call per month':>24} {loop / sample * MONTHS * 1e3:10.1f} ms"
+          f" (from {sample} months)")
+    print(f"{'one vectorized call':>24} {vectorized * 1e3:10.1f} ms")
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
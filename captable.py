@@ -0,0 +1,114 @@
+"""Cap table: fully diluted ownership through every funding round.
+
+Each round sells ``Amount / Valuation`` of the post-money company to its
+investors (valuations are post-money, as in the funding-round table) and,
+when the round's ``Option_Pool`` target (% of post-money) is above what is
+left of the pool, tops the pool up first. The top-up is priced into the
+pre-money, so it dilutes the existing holders and not the new investors.
+Later rounds dilute everyone who came before.
+
+The share count only changes at a round, so issuing is a short loop over
+rounds; ownership at every month is then one gather, an ``(..., months,
+rounds)`` matrix. Round terms may carry leading batch axes (a grid of
+valuations, say) and every result keeps them.
+"""
+
+from collections import namedtuple
+
+from lazy import lazy_import
+from projection import MONTHS
+from roi import HORIZONS, end_months
+
+np = lazy_import('numpy')
+
+# Founders' shares before the first round; ownership does not depend on it
+FOUNDER_SHARES = 10_000_000
+
+CapTable = namedtuple('CapTable', ['shares', 'pool_shares', 'total_shares',
+                                   'founders', 'pool', 'investors'])
+
+
+def round_terms(rounds):
+    """``(amount, valuation, pool target, month)`` arrays of a round table in round order.
+
+    A table without an ``Option_Pool`` column has no pool.
+    """
+    amount = np.asarray(rounds['Amount'], dtype=np.float64)
+    valuation = np.asarray(rounds['Valuation'], dtype=np.float64)
+    pool = (np.asarray(rounds['Option_Pool'], dtype=np.float64) / 100 if 'Option_Pool' in rounds
+            else np.zeros(amount.shape[-1]))
+    return amount, valuation, pool, np.asarray(rounds['Month'])
+
+
+def issue(amount, valuation, pool, founder_shares=FOUNDER_SHARES):
+    """Shares issued at each round, in round (chronological) order.
+
+    ``amount``, ``valuation`` and ``pool`` (a post-money fraction) have the
+    rounds on their last axis. Returns ``(investor shares, pool shares
+    after the round, fully diluted shares after the round)``, each
+    ``(..., rounds)``. Raises ``ValueError`` unless every round's stake
+    (``amount / valuation``) plus its pool is under the whole post-money.
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        stake = np.asarray(amount, dtype=np.float64) / np.asarray(valuation, dtype=np.float64)
+    stake, pool = np.broadcast_arrays(stake, np.asarray(pool, dtype=np.float64))
+    invalid = ~np.isfinite(stake) | (stake < 0) | (stake + np.maximum(pool, 0) >= 1)
+    if invalid.any():
+        at = tuple(np.argwhere(invalid)[0])
+        raise ValueError(f"Round {at[-1]} sells {stake[at]:.1%} of the post-money with a "
+                         f"{pool[at]:.1%} option pool; stake plus pool must be under 100%")
+    shares = np.empty(stake.shape)
+    pool_after = np.empty(stake.shape)
+    total_after = np.empty(stake.shape)
+    total = np.full(stake.shape[:-1], float(founder_shares))
+    pool_shares = np.zeros(stake.shape[:-1])
+    for r in range(stake.shape[-1]):
+        e, p = stake[..., r], pool[..., r]
+        # Post-money total with the pool topped up to p, and without a top-up
+        topped = (total - pool_shares) / (1 - p - e)
+        plain = total / (1 - e)
+        top_up = p * plain > pool_shares
+        total = np.where(top_up, topped, plain)
+        pool_shares = np.where(top_up, p * total, pool_shares)
+        shares[..., r] = e * total
+        pool_after[..., r] = pool_shares
+        total_after[..., r] = total
+    return shares, pool_after, total_after
+
+
+def cap_table(rounds, months=MONTHS, founder_shares=FOUNDER_SHARES):
+    """Fully diluted ownership (fractions) at every month.
+
+    ``rounds`` is the funding-round table (a DataFrame or a dict of
+    columns), sorted by ``Month``. ``investors`` is ``(..., months,
+    rounds)``, zero before a round closes; ``founders`` and ``pool`` are
+    ``(..., months)``. Share counts are per round, after it closes.
+    """
+    amount, valuation, pool, month = round_terms(rounds)
+    shares, pool_shares, total_shares = issue(amount, valuation, pool, founder_shares)
+
+    # Index of the latest round closed by each month (-1 before the first)
+    latest = np.searchsorted(month, np.arange(months), side='right') - 1
+    closed = latest >= 0
+    at = np.maximum(latest, 0)
+    total = np.where(closed, total_shares[..., at], float(founder_shares))
+    investors = np.where(np.arange(len(month)) <= latest[:, np.newaxis],
+                         shares[..., np.newaxis, :] / total[..., np.newaxis], 0.0)
+    return CapTable(
+        shares=shares,
+        pool_shares=pool_shares,
+        total_shares=total_shares,
+        founders=founder_shares / total,
+        pool=np.where(closed, pool_shares[..., at], 0.0) / total,
+        investors=investors,
+    )
+
+
+def diluted_equity(rounds, horizons=HORIZONS, months=MONTHS):
+    """Each round's diluted ownership (%) when it is valued after ``horizons``.
+
+    Shape ``(..., rounds, horizons)``, as ``roi.roi_cube(..., equity=)`` takes it.
+    """
+    investors = cap_table(rounds, months).investors
+    end = end_months(rounds['Month'], horizons, months)
+    return investors[..., end, np.arange(end.shape[0])[:, np.newaxis]] * 100
@@ -0,0 +1,97 @@
+"""Cohort retention: customers as monthly acquisition cohorts that churn.
+
+Cohort ``c`` (customers acquired in period ``c``) still active in period
+``t >= c`` is ``S[c, t] = Q[t - c] * P[t] / P[c]``: ``P`` compounds the
+calendar churn (``Churn_Rate`` of key_metrics; newer months churn less)
+and ``Q`` the extra churn of young customers, ``EARLY_CHURN`` in their
+first period decaying by ``EARLY_CHURN_DECAY`` each period after.
+``retention_matrix`` builds the cohort x age triangle, or a band of its
+first ages, in one broadcast for the retention heatmap.
+
+Since ``S`` factors into ``P`` and ``Q``, the customers active in period
+``t`` are ``P[t] * sum_c (A[c] / P[c]) * Q[t - c]``, a convolution of the
+acquisitions ``A``: ``active_customers`` projects it forward,
+``acquisitions`` inverts it (the new customers behind a customer count)
+and ``lifetime_value`` sums a cohort's margin per customer over its
+remaining periods, without building the triangle.
+
+Rates are per period: monthly for the dashboard, daily works the same.
+"""
+
+from lazy import lazy_import
+
+np = lazy_import('numpy')
+
+EARLY_CHURN = 0.04
+EARLY_CHURN_DECAY = 0.5
+
+
+def age_retention(periods, early=EARLY_CHURN, decay=EARLY_CHURN_DECAY):
+    """``Q``: share of a cohort left by early churn alone after 0..periods-1 periods."""
+    hazard = early * np.power(decay, np.arange(periods - 1, dtype=np.float64))
+    return np.concatenate([[1.0], np.cumprod(1 - hazard)])
+
+
+def _log_survival(churn):
+    # log P: calendar churn compounded from period 0 (period 0 loses no one)
+    churn = np.asarray(churn, dtype=np.float64)
+    return np.concatenate([[0.0], np.cumsum(np.log1p(-churn[1:]))])
+
+
+def retention_matrix(churn, early=EARLY_CHURN, decay=EARLY_CHURN_DECAY, ages=None,
+                     dtype='float64'):
+    """Cohort x age triangle: the share of each cohort active ``age`` periods on.
+
+    Shape ``(cohorts, ages)``; ``ages`` (default: every period) keeps a
+    band of the first ages, which bounds the memory of long daily series.
+    Ages past the last period are NaN.
+    """
+    log_p = _log_survival(churn)
+    n = len(log_p)
+    ages = n if ages is None else min(ages, n)
+    # Row c is log P[c:c + ages], a strided view with NaN past the last period
+    padded = np.concatenate([log_p, np.full(ages - 1, np.nan)])
+    windows = np.lib.stride_tricks.sliding_window_view(padded, ages)
+    # Built in place in the output dtype: no full-size float64 temporaries
+    matrix = np.subtract(windows, log_p[:, np.newaxis], dtype=dtype)
+    np.exp(matrix, out=matrix)
+    matrix *= age_retention(ages, early, decay).astype(dtype)
+    return matrix
+
+
+def active_customers(acquisitions, churn, early=EARLY_CHURN, decay=EARLY_CHURN_DECAY):
+    """Customers active in each period: every cohort of ``acquisitions`` after its churn."""
+    acquisitions = np.asarray(acquisitions, dtype=np.float64)
+    n = len(acquisitions)
+    p = np.exp(_log_survival(churn))
+    return p * np.convolve(acquisitions / p, age_retention(n, early, decay))[:n]
+
+
+def acquisitions(customers, churn, early=EARLY_CHURN, decay=EARLY_CHURN_DECAY):
+    """New customers in each period for ``active_customers`` to give ``customers``.
+
+    Negative where the count falls faster than its cohorts churn.
+    """
+    p = np.exp(_log_survival(churn))
+    y = np.asarray(customers, dtype=np.float64) / p
+    n = len(y)
+    # Reversed Q, so q[n - t:] is Q[t..1]; Q[0] is 1
+    q = age_retention(n, early, decay)[::-1]
+    x = np.empty(n)
+    for t in range(n):
+        x[t] = y[t] - x[:t] @ q[n - t - 1:n - 1]
+    return x * p
+
+
+def lifetime_value(margin, customers, churn, early=EARLY_CHURN, decay=EARLY_CHURN_DECAY):
+    """Margin per customer acquired in each period, over the periods left.
+
+    ``margin`` is the whole period's (e.g. revenue less COGS) and is shared
+    by the ``customers`` active then; undiscounted and cut off at the last
+    period, so later cohorts have less time to earn.
+    """
+    p = np.exp(_log_survival(churn))
+    per_customer = np.asarray(margin, dtype=np.float64) / np.asarray(customers, dtype=np.float64)
+    n = len(p)
+    # sum_t per_customer[t] * S[c, t], as one convolution of the reversed series
+    return np.convolve((per_customer * p)[::-1], age_retention(n, early, decay))[:n][::-1] / p
@@ -0,0 +1,208 @@
+"""Typed columnar store for the generated datasets.
+
+Each table is a directory of ``.npy`` files, one per column, plus a small
+``_meta.json`` with the column order. Columns are stored in compact native
+dtypes (datetime64, bool, float32, int32, fixed-width unicode) and are
+memory-mapped on read, so loading skips CSV parsing and date conversion.
+
+Files are never rewritten in place, since a running app may hold maps of
+them: each one is written under a temporary name and renamed over the old
+one (``os.replace``), and ``_meta.json`` goes last. ``write_rows`` patches
+a row range of a copy of each column through a writable memory map and
+grows it by appending and rewriting the fixed-size header, so an update
+costs a file copy per column rather than re-encoding the table.
+"""
+
+import io
+import json
+import os
+import shutil
+
+from lazy import lazy_import
+
+np = lazy_import('numpy')
+pd = lazy_import('pandas')
+npy_format = lazy_import('numpy.lib.format')
+
+FORMAT_VERSION = 1
+META_FILE = '_meta.json'
+COLUMNAR_DIR = 'columnar'
+TMP_SUFFIX = '.tmp'
+
+
+def columnar_path(csv_path):
+    """Store directory for a CSV, e.g. ``columnar/financials_10yr``."""
+    directory, name = os.path.split(csv_path)
+    return os.path.join(directory, COLUMNAR_DIR, os.path.splitext(name)[0])
+
+
+def compact_column(series, dtype=None):
+    """Return a column as a NumPy array in its compact storage dtype.
+
+    A declared ``dtype`` overrides the inferred one; categorical columns are
+    stored as their (unicode) values.
+    """
+    if dtype == 'category':
+        return series.to_numpy().astype(str)
+    if dtype is not None:
+        return series.to_numpy().astype(dtype)
+    values = series.to_numpy()
+    kind = values.dtype.kind
+    if kind == 'M':
+        return values.astype('datetime64[ns]')
+    if kind == 'b':
+        return values
+    if kind == 'f':
+        return values.astype(np.float32)
+    if kind in 'iu':
+        info = np.iinfo(np.int32)
+        if len(values) == 0 or (values.min() >= info.min and values.max() <= info.max):
+            return values.astype(np.int32)
+        return values.astype(np.int64)
+    return values.astype(str)
+
+
+def write_columnar(df, path, dtypes=None):
+    """Write ``df`` as a columnar store directory at ``path``.
+
+    ``dtypes`` declares storage dtypes by column (see ``datasets.SCHEMAS``).
+    """
+    os.makedirs(path, exist_ok=True)
+    meta = {'version': FORMAT_VERSION, 'rows': len(df), 'columns': []}
+    dtypes = dtypes or {}
+    for column in df.columns:
+        values = compact_column(df[column], dtypes.get(column))
+        _save_npy(os.path.join(path, f'{column}.npy'), values)
+        meta['columns'].append({'name': column, 'dtype': values.dtype.str})
+    _write_meta(path, meta)
+
+
+def _save_npy(file, values):
+    # Saved aside and renamed, so maps of the old file keep their data
+    with open(file + TMP_SUFFIX, 'wb') as f:
+        np.save(f, values, allow_pickle=False)
+    os.replace(file + TMP_SUFFIX, file)
+
+
+def _write_meta(path, meta):
+    file = os.path.join(path, META_FILE)
+    with open(file + TMP_SUFFIX, 'w') as f:
+        json.dump(meta, f, indent=2)
+    os.replace(file + TMP_SUFFIX, file)
+
+
+def read_meta(path):
+    with open(os.path.join(path, META_FILE)) as f:
+        meta = json.load(f)
+    if meta['version'] != FORMAT_VERSION:
+        raise ValueError(f"Unsupported columnar format version {meta['version']} in {path}")
+    return meta
+
+
+def read_columnar(path, columns=None, mmap=True):
+    """Load a columnar store as a DataFrame whose columns share the mapped files."""
+    meta = read_meta(path)
+    names = [c['name'] for c in meta['columns']]
+    if columns is not None:
+        missing = set(columns) - set(names)
+        if missing:
+            raise KeyError(f"Columns not in {path}: {sorted(missing)}")
+        names = [name for name in names if name in columns]
+    data = {name: np.load(os.path.join(path, f'{name}.npy'), mmap_mode='r' if mmap else None)
+            for name in names}
+    return pd.DataFrame(data, copy=False)
+
+
+def load_table(csv_path, parse_dates=(), columns=None, dtypes=None):
+    """Load a dataset, preferring its columnar store over the CSV.
+
+    ``dtypes`` is passed to ``read_csv`` so the CSV is parsed straight into
+    compact dtypes.
+    """
+    path = columnar_path(csv_path)
+    if os.path.isfile(os.path.join(path, META_FILE)):
+        return read_columnar(path, columns)
+    df = pd.read_csv(csv_path, usecols=columns, dtype=dtypes)
+    for column in parse_dates:
+        if column in df:
+            df[column] = pd.to_datetime(df[column])
+    return df
+
+
+def _npy_header(shape, dtype, version):
+    buf = io.BytesIO()
+    header = {'descr': npy_format.dtype_to_descr(dtype), 'fortran_order': False, 'shape': shape}
+    if version == (1, 0):
+        npy_format.write_array_header_1_0(buf, header)
+    else:
+        npy_format.write_array_header_2_0(buf, header)
+    return buf.getvalue()
+
+
+def _append_npy(file, values):
+    """Append ``values`` to a 1-D ``.npy`` file, patching the header's shape.
+
+    Works in place: only ever called on a private copy (see ``write_rows``).
+    """
+    with open(file, 'r+b') as f:
+        version = npy_format.read_magic(f)
+        read_header = (npy_format.read_array_header_1_0 if version == (1, 0)
+                       else npy_format.read_array_header_2_0)
+        (rows,), _, dtype = read_header(f)
+        header_len = f.tell()
+        header = _npy_header((rows + len(values),), dtype, version)
+        if len(header) != header_len:
+            # The new shape no longer fits the header's padding
+            f.seek(0)
+            existing = npy_format.read_array(f)
+            f.seek(0)
+            npy_format.write_array(f, np.concatenate([existing, values.astype(dtype)]))
+            f.truncate()
+            return
+        f.seek(0)
+        f.write(header)
+        f.seek(0, os.SEEK_END)
+        f.write(np.ascontiguousarray(values, dtype=dtype).tobytes())
+
+
+def write_rows(path, df, start):
+    """Write ``df`` over rows ``start:start + len(df)`` of a store, growing it if needed.
+
+    Values are stored in each column's existing dtype; a column whose new
+    values do not fit it (e.g. a longer string) is rewritten in the wider
+    compact dtype.
+    """
+    meta = read_meta(path)
+    rows, stop = meta['rows'], start + len(df)
+    if start > rows:
+        raise ValueError(f"Row {start} would leave a gap after row {rows - 1} in {path}")
+    overlap = min(rows, stop) - start
+    for column in meta['columns']:
+        file = os.path.join(path, f"{column['name']}.npy")
+        values = compact_column(df[column['name']])
+        dtype = np.dtype(column['dtype'])
+        if values.dtype.kind == dtype.kind and values.dtype.itemsize < dtype.itemsize:
+            # The store declares a wider dtype (e.g. float64 totals); cast
+            # the raw values so no precision is lost on the way
+            values = df[column['name']].to_numpy().astype(dtype)
+        fits = values.dtype.kind == dtype.kind and np.array_equal(values.astype(dtype), values)
+        if not fits:
+            existing = np.load(file)
+            merged = np.concatenate([existing.astype(values.dtype)[:start], values,
+                                     existing.astype(values.dtype)[stop:]])
+            _save_npy(file, merged)
+            column['dtype'] = merged.dtype.str
+            continue
+        # Patch a copy and rename it over the file the app may have mapped
+        tmp = file + TMP_SUFFIX
+        shutil.copyfile(file, tmp)
+        if overlap > 0:
+            mapped = np.load(tmp, mmap_mode='r+')
+            mapped[start:start + overlap] = values[:overlap]
+            mapped.flush()
+            del mapped
+        if stop > rows:
+            _append_npy(tmp, values[overlap:])
+        os.replace(tmp, file)
+    meta['rows'] = max(rows, stop)
+    _write_meta(path, meta)
@@ -0,0 +1,129 @@
+"""Portfolio companies served from one dashboard process.
+
+The company in the repository root is the default; others live in
+``companies/<slug>/``, each with the same files (CSVs, ``columnar/``,
+``company_info.json``, ``snapshot.json``), and are picked with
+``?company=<slug>``.
+
+A ``Company`` caches its own datasets and page snapshot, keyed on the
+files' modification stamps, and ``CompanyCache`` keeps the most recently
+used companies in a bounded LRU. Evicting a cold company drops its frames
+and snapshot, so memory follows the companies investors are looking at,
+not the size of the portfolio.
+"""
+
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+
+from datasets import data_version, load_dataset
+from snapshot import load_snapshot
+
+COMPANIES_DIR = os.environ.get('COMPANIES_DIR', 'companies')
+DEFAULT_COMPANY = 'payflow'
+COMPANY_CACHE_SIZE = int(os.environ.get('COMPANY_CACHE_SIZE', 8))
+
+_SLUG = re.compile(r'^[a-z0-9][a-z0-9_-]*$')
+
+
+def company_dir(slug):
+    """Data directory of company ``slug``."""
+    if slug == DEFAULT_COMPANY:
+        return '.'
+    if not _SLUG.match(slug):
+        raise KeyError(f"Invalid company {slug!r}")
+    directory = os.path.join(COMPANIES_DIR, slug)
+    if not os.path.isfile(os.path.join(directory, 'company_info.json')):
+        raise KeyError(f"Unknown company {slug!r}")
+    return directory
+
+
+def list_companies():
+    slugs = [DEFAULT_COMPANY]
+    if os.path.isdir(COMPANIES_DIR):
+        slugs += sorted(s for s in os.listdir(COMPANIES_DIR)
+                        if _SLUG.match(s) and os.path.isfile(
+                            os.path.join(COMPANIES_DIR, s, 'company_info.json')))
+    return slugs
+
+
+class Company:
+    """One company's data directory with its own dataset and snapshot caches."""
+
+    def __init__(self, slug, directory):
+        self.slug = slug
+        self.directory = directory
+        with open(os.path.join(directory, 'company_info.json')) as f:
+            self.info = json.load(f)
+        self._datasets = {}
+        self._snapshot = (None, None)
+        self._lock = threading.Lock()
+
+    def version(self, names=None):
+        return data_version(names, self.directory)
+
+    def dataset(self, name, columns=None):
+        """Dataset ``name`` (memory-mapped where stored columnar), reloaded once its files change.
+
+        Frames are shared by every session; callers copy before mutating.
+        """
+        key = (name, tuple(columns) if columns is not None else None)
+        version = self.version([name])
+        with self._lock:
+            cached = self._datasets.get(key)
+            if cached and cached[0] == version:
+                return cached[1]
+        frame = load_dataset(name, columns, self.directory)
+        with self._lock:
+            self._datasets[key] = (version, frame)
+        return frame
+
+    def snapshot(self, version=None):
+        """The precompiled base-case page, or None if missing or stale."""
+        version = version or self.version()
+        with self._lock:
+            if self._snapshot[0] == version:
+                return self._snapshot[1]
+        snapshot = load_snapshot(self.directory)
+        with self._lock:
+            self._snapshot = (version, snapshot)
+        return snapshot
+
+
+class CompanyCache:
+    """Bounded LRU of ``Company`` objects; the least recently used is evicted."""
+
+    def __init__(self, maxsize=COMPANY_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._companies = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    def get(self, slug):
+        with self._lock:
+            if slug in self._companies:
+                self._companies.move_to_end(slug)
+                self.hits += 1
+                return self._companies[slug]
+        company = Company(slug, company_dir(slug))
+        with self._lock:
+            self.misses += 1
+            company = self._companies.setdefault(slug, company)
+            self._companies.move_to_end(slug)
+            while len(self._companies) > self.maxsize:
+                self._companies.popitem(last=False)
+                self.evictions += 1
+        return company
+
+    def active(self):
+        with self._lock:
+            return list(self._companies)
+
+    def clear(self):
+        with self._lock:
+            self._companies.clear()
+
+
+companies = CompanyCache()
@@ -0,0 +1,142 @@
+"""Registry of the dashboard's datasets, loaded lazily by name.
+
+Nothing is read until a caller asks for a dataset, and callers can ask for
+just the columns they render. Each table comes from its columnar store
+when present, otherwise from the CSV, and is returned in the dtypes its
+``SCHEMAS`` entry declares.
+"""
+
+import os
+
+from columnar import META_FILE, columnar_path, load_table
+
+# name -> (csv file, date columns)
+DATASETS = {
+    'financials': ('financials_10yr.csv', ['Date']),
+    'key_metrics': ('key_metrics_10yr.csv', ['Date']),
+    'roi': ('roi_comparison_10yr.csv', []),
+    'funding_rounds': ('funding_rounds_updated.csv', []),
+    'team': ('team_data_10yr.csv', ['Date']),
+    'target_markets': ('target_markets.csv', []),
+    'competitors': ('competitors.csv', []),
+    'roadmap': ('roadmap.csv', []),
+}
+
+# name -> {column: dtype}. float32 keeps about 7 significant digits, which
+# is enough for monthly figures, ratios and valuations shown in $M; running
+# totals stay float64. Counts fit int32; dollar amounts are int64, as a
+# round can pass int32's $2.1B. Repeated labels are categorical. Undeclared columns (free text) keep their loaded dtype.
+SCHEMAS = {
+    'financials': {
+        'Date': 'datetime64[ns]',
+        'Revenue': 'float32',
+        'COGS': 'float32',
+        'Sales_Marketing': 'float32',
+        'RD': 'float32',
+        'Admin': 'float32',
+        'Total_Costs': 'float32',
+        'Profit': 'float32',
+        'Is_Historical': 'bool',
+        'Cumulative_Revenue': 'float64',
+        'Cumulative_Costs': 'float64',
+        'Cumulative_Profit': 'float64',
+    },
+    'key_metrics': {
+        'Date': 'datetime64[ns]',
+        'Customers': 'int32',
+        'Transaction_Volume': 'float32',
+        'CAC': 'float32',
+        'LTV': 'float32',
+        'Is_Historical': 'bool',
+        'LTV_CAC_Ratio': 'float32',
+        'Churn_Rate': 'float32',
+    },
+    'roi': {
+        'Round': 'category',
+        'Investment': 'int64',
+        'Equity_Pct': 'float32',
+        'Years': 'int32',
+        'End_Month': 'int32',
+        'ARR': 'float32',
+        'Company_Valuation': 'float32',
+        'Equity_Value': 'float32',
+        'Absolute_Return': 'float32',
+        'ROI_Percentage': 'float32',
+        'Multiple': 'float32',
+        'Is_Historical': 'bool',
+    },
+    'funding_rounds': {
+        'Round': 'category',
+        'Amount': 'int64',
+        'Valuation': 'int64',
+        'Equity': 'float32',
+        'Month': 'int32',
+        'Status': 'category',
+        'Option_Pool': 'float32',
+        'Preference': 'float32',
+        'Participating': 'bool',
+        'Seniority': 'int32',
+    },
+    'team': {
+        'Date': 'datetime64[ns]',
+        'Engineering': 'int32',
+        'Sales': 'int32',
+        'Operations': 'int32',
+        'Leadership': 'int32',
+        'Is_Historical': 'bool',
+        'Total_Team': 'int32',
+    },
+    'target_markets': {
+        'Province': 'category',
+        'SMBs': 'int32',
+        'Latitude': 'float32',
+        'Longitude': 'float32',
+    },
+    'competitors': {
+        'Company': 'category',
+        'Market_Share': 'float32',
+        'Focus': 'category',
+        'Speed': 'int32',
+        'Cost_Effectiveness': 'int32',
+        'Canadian_Focus': 'int32',
+    },
+    'roadmap': {
+        'Quarter': 'category',
+        'Status': 'category',
+    },
+}
+
+
+def apply_schema(df, name):
+    """``df`` with its columns cast to dataset ``name``'s declared dtypes."""
+    dtypes = {column: dtype for column, dtype in SCHEMAS[name].items()
+              if column in df and df[column].dtype != dtype}
+    return df.astype(dtypes) if dtypes else df
+
+
+def load_dataset(name, columns=None, data_dir='.'):
+    """Load dataset ``name`` from ``data_dir``, optionally restricted to ``columns``."""
+    if name not in DATASETS:
+        raise KeyError(f"Unknown dataset {name!r}; expected one of {sorted(DATASETS)}")
+    csv_path, parse_dates = DATASETS[name]
+    csv_path = os.path.join(data_dir, csv_path)
+    columns = list(columns) if columns is not None else None
+    parse_dates = [c for c in parse_dates if columns is None or c in columns]
+    dtypes = {c: t for c, t in SCHEMAS[name].items() if not t.startswith('datetime')}
+    df = load_table(csv_path, parse_dates=parse_dates, columns=columns, dtypes=dtypes)
+    return apply_schema(df, name)
+
+
+def data_version(names=None, data_dir='.'):
+    """Modification stamps of the files behind ``names`` (default: every dataset).
+
+    Cheap enough to check on every rerun; caches keyed on it drop tables
+    that ``ingest.py`` has patched.
+    """
+    stamps = []
+    for name in names or sorted(DATASETS):
+        csv_path = os.path.join(data_dir, DATASETS[name][0])
+        meta = os.path.join(columnar_path(csv_path), META_FILE)
+        path = meta if os.path.isfile(meta) else csv_path
+        stamps.append(os.stat(path).st_mtime_ns)
+    return tuple(stamps)
@@ -0,0 +1,76 @@
+"""Point-count reduction for long time-series traces.
+
+``lttb`` (Largest-Triangle-Three-Buckets) keeps the points that best
+preserve a line's visual shape; ``minmax`` keeps every bucket's extremes,
+so spikes survive. Both return sorted indices into the input that always
+include its first and last point, which lets several traces (e.g. a line
+and its P10/P50/P90 fan) share one selection and keeps trace endpoints,
+such as the last actual month, exact.
+"""
+
+from lazy import lazy_import
+
+np = lazy_import('numpy')
+
+# Plotly draws a full-width chart in roughly this many horizontal pixels;
+# more than about one point per pixel is not visible
+CHART_WIDTH_PX = 1400
+MAX_POINTS = CHART_WIDTH_PX
+
+
+def lttb(y, n_out, x=None):
+    """Indices of the ``n_out`` points Largest-Triangle-Three-Buckets keeps."""
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n_out >= n:
+        return np.arange(n)
+    if n_out < 3:
+        return np.array([0, n - 1])[:max(n_out, 1)]
+    x = np.arange(n, dtype=float) if x is None else np.asarray(x, dtype=float)
+
+    # n_out - 2 buckets over the interior points
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    # Mean of every bucket, plus the last point as the one after the final bucket
+    counts = np.diff(edges)
+    next_x = np.append(np.add.reduceat(x[1:n - 1], edges[:-1] - 1) / counts, x[-1])
+    next_y = np.append(np.add.reduceat(y[1:n - 1], edges[:-1] - 1) / counts, y[-1])
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        bx, by = x[lo:hi], y[lo:hi]
+        area = np.abs((x[a] - next_x[i + 1]) * (by - y[a]) - (x[a] - bx) * (next_y[i + 1] - y[a]))
+        a = lo + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+
+def minmax(y, n_out):
+    """Indices of each bucket's minimum and maximum, plus the endpoints."""
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n_out >= n:
+        return np.arange(n)
+    buckets = max((n_out - 2) // 2, 1)
+    edges = np.linspace(1, n - 1, buckets + 1).astype(np.int64)
+    keep = [0, n - 1]
+    for lo, hi in zip(edges[:-1], edges[1:]):
+        bucket = y[lo:hi]
+        keep += [lo + int(np.argmin(bucket)), lo + int(np.argmax(bucket))]
+    return np.unique(keep)
+
+
+def downsample(y, max_points=MAX_POINTS, start=0, stop=None, method='lttb'):
+    """Absolute indices of at most ``max_points`` samples of ``y[start:stop]``.
+
+    ``max_points=None`` keeps every sample.
+    """
+    stop = len(y) if stop is None else stop
+    if stop <= start:
+        return np.arange(0)
+    if max_points is None:
+        return np.arange(start, stop)
+    pick = lttb if method == 'lttb' else minmax
+    return start + pick(y[start:stop], max_points)
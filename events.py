@@ -0,0 +1,304 @@
+"""Unit economics from a customer event log.
+
+    python events.py events.csv --workers 4
+    python events.py events.parquet --data-dir . --no-snapshot
+
+The log has one row per event, in time order::
+
+    Timestamp,Customer_ID,Event,Amount
+    2024-01-03T10:15:00,17,signup,
+    2024-01-05T12:00:00,17,transaction,1250.00
+    2024-03-01T00:00:00,17,churn,
+
+``Event`` is ``signup``, ``transaction`` (``Amount`` is the payment
+volume) or ``churn``; the log starts at launch, so active customers are
+signups less churns so far. Per month it gives ``Customers`` (at month
+end), ``Transaction_Volume`` and ``Churn_Rate`` (churns over customers at
+the start of the month), and with the month's actuals in financials
+``CAC`` (Sales_Marketing per signup) and ``LTV`` (gross profit per
+customer over the churn rate). The historical months of key_metrics are
+rewritten with them (see ``ingest.write_tail``).
+
+The log is read in pieces, never whole: CSV in ``chunk_bytes`` byte ranges
+cut at line ends, Parquet a row group at a time. Each piece is reduced to
+four counts per month, in worker processes when ``workers > 1``, and the
+counts are summed in log order. After each piece the counts and the offset
+reached (a byte offset, or a row group) are saved next to the log, so an
+interrupted run, or a later one over a log that has grown, resumes from
+there. The progress also keeps a fingerprint of the log up to that offset
+(its first and last ``FINGERPRINT_BYTES``, or the row groups' metadata),
+and a log rewritten since is read again from the start. Parquet needs the
+``pyarrow`` package.
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from lazy import lazy_import
+from projection import MONTHS, START_DATE
+
+np = lazy_import('numpy')
+pd = lazy_import('pandas')
+
+COLUMNS = ('Timestamp', 'Event', 'Amount')
+
+# Counts kept per month
+TOTALS = ('signups', 'churns', 'transactions', 'volume')
+
+# CSV bytes parsed per piece; a worker holds about a few times this
+CHUNK_BYTES = 64 << 20
+
+PROGRESS_VERSION = 2
+PROGRESS_SUFFIX = '.progress.json'
+
+# Bytes hashed at each end of the CSV read so far
+FINGERPRINT_BYTES = 64 << 10
+
+
+def month_index(timestamps, start_date=START_DATE):
+    """Months since ``start_date``'s month of ISO timestamp strings or datetimes."""
+    values = np.asarray(timestamps)
+    start = np.datetime64(start_date, 'M').astype(np.int64)
+    if values.dtype.kind == 'M':
+        return values.astype('datetime64[M]').astype(np.int64) - start
+    # 'YYYY-MM' digits, without parsing the rest of the timestamp
+    digits = values.astype('S7').view(np.uint8).reshape(-1, 7).astype(np.int64) - ord('0')
+    year = digits[:, 0] * 1000 + digits[:, 1] * 100 + digits[:, 2] * 10 + digits[:, 3]
+    return (year - 1970) * 12 + digits[:, 5] * 10 + digits[:, 6] - 1 - start
+
+
+def reduce_events(events, months=MONTHS, start_date=START_DATE):
+    """``(len(TOTALS), months)`` counts of an event frame; later months are dropped."""
+    month = month_index(events['Timestamp'].to_numpy(), start_date)
+    kind = events['Event'].to_numpy()
+    amount = pd.to_numeric(events['Amount']).to_numpy(dtype=np.float64, na_value=0.0)
+    inside = (month >= 0) & (month < months)
+    totals = np.zeros((len(TOTALS), months))
+    for row, (event, weights) in enumerate([('signup', None), ('churn', None),
+                                            ('transaction', None), ('transaction', amount)]):
+        mask = inside & (kind == event)
+        totals[row] = np.bincount(month[mask], None if weights is None else weights[mask],
+                                  minlength=months)
+    return totals
+
+
+def csv_pieces(path, offset, chunk_bytes=CHUNK_BYTES):
+    """``(start, end)`` byte ranges of a CSV's rows from ``offset`` on, cut after newlines.
+
+    A trailing line without its newline is still being written and is left
+    for the next run.
+    """
+    with open(path, 'rb') as f:
+        header = f.readline()
+        start = max(offset, len(header))
+        size = f.seek(0, os.SEEK_END)
+        while start < size:
+            f.seek(min(start + chunk_bytes, size) - 1)
+            rest = f.readline()
+            end = f.tell() if rest.endswith(b'\n') else None
+            if end is None:
+                # Unterminated last line: stop at the newline before it
+                f.seek(start)
+                body = f.read(size - start)
+                cut = body.rfind(b'\n')
+                if cut < 0:
+                    break
+                end = start + cut + 1
+            yield start, end
+            start = end
+
+
+def _reduce_csv(args):
+    path, start, end, months, start_date = args
+    with open(path, 'rb') as f:
+        header = f.readline()
+        f.seek(start)
+        body = f.read(end - start)
+    events = pd.read_csv(io.BytesIO(header + body), usecols=list(COLUMNS),
+                         dtype={'Timestamp': str, 'Event': 'category', 'Amount': np.float64})
+    return reduce_events(events, months, start_date)
+
+
+def _reduce_parquet(args):
+    path, group, months, start_date = args
+    import pyarrow.parquet as pq
+    table = pq.ParquetFile(path).read_row_group(group, columns=list(COLUMNS))
+    return reduce_events(table.to_pandas(), months, start_date)
+
+
+def _is_parquet(path):
+    return os.path.splitext(path)[1].lower() in ('.parquet', '.pq')
+
+
+def _tasks(path, offset, months, start_date, chunk_bytes):
+    # (reducer, [(args, offset after the piece)])
+    if not _is_parquet(path):
+        return _reduce_csv, [((path, start, end, months, start_date), end)
+                             for start, end in csv_pieces(path, offset, chunk_bytes)]
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Parquet event logs need the pyarrow package (pip install pyarrow)") from None
+    groups = pq.ParquetFile(path).num_row_groups
+    return _reduce_parquet, [((path, g, months, start_date), g + 1) for g in range(offset, groups)]
+
+
+def progress_path(path):
+    return path + PROGRESS_SUFFIX
+
+
+def fingerprint(path, offset):
+    """Hash of the part of a log before ``offset``, which appending leaves alone."""
+    digest = hashlib.sha256()
+    if _is_parquet(path):
+        import pyarrow.parquet as pq
+        metadata = pq.ParquetFile(path).metadata
+        for group in range(min(offset, metadata.num_row_groups)):
+            digest.update(repr(metadata.row_group(group).to_dict()).encode())
+        digest.update(str(min(offset, metadata.num_row_groups)).encode())
+        return digest.hexdigest()
+    with open(path, 'rb') as f:
+        digest.update(f.read(min(offset, FINGERPRINT_BYTES)))
+        f.seek(max(offset - FINGERPRINT_BYTES, 0))
+        tail = f.read(min(offset, FINGERPRINT_BYTES))
+    # A log cut short reads less than ``offset`` bytes
+    digest.update(len(tail).to_bytes(8, 'little') + tail)
+    return digest.hexdigest()
+
+
+def load_progress(path, months):
+    """``(offset, totals)`` saved for a log, or a fresh start if the log changed."""
+    saved = progress_path(path)
+    if os.path.isfile(saved):
+        with open(saved) as f:
+            progress = json.load(f)
+        if progress.get('version') == PROGRESS_VERSION:
+            totals = np.array(progress['totals'], dtype=np.float64)
+            offset = progress['offset']
+            if (totals.shape == (len(TOTALS), months)
+                    and progress['fingerprint'] == fingerprint(path, offset)):
+                return offset, totals
+    return 0, np.zeros((len(TOTALS), months))
+
+
+def save_progress(path, offset, totals):
+    # Written aside and renamed, so a crash leaves the previous progress
+    saved = progress_path(path)
+    with open(saved + '.tmp', 'w') as f:
+        json.dump({'version': PROGRESS_VERSION, 'offset': offset,
+                   'fingerprint': fingerprint(path, offset), 'totals': totals.tolist()}, f)
+    os.replace(saved + '.tmp', saved)
+
+
+def aggregate(path, months=MONTHS, start_date=START_DATE, workers=1, chunk_bytes=CHUNK_BYTES,
+              resume=True):
+    """Monthly ``TOTALS`` of an event log, ``{name: (months,)}``, resuming if saved.
+
+    Pieces are reduced by ``workers`` processes and summed in log order;
+    progress is saved after each one.
+    """
+    offset, totals = load_progress(path, months) if resume else (0, np.zeros((len(TOTALS), months)))
+    reducer, tasks = _tasks(path, offset, months, start_date, chunk_bytes)
+    args = [task for task, _ in tasks]
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(workers) as pool:
+            for (_, offset), counts in zip(tasks, pool.map(reducer, args)):
+                totals += counts
+                save_progress(path, offset, totals)
+    else:
+        for (_, offset), task in zip(tasks, args):
+            totals += reducer(task)
+            save_progress(path, offset, totals)
+    return dict(zip(TOTALS, totals))
+
+
+def unit_economics(totals, financials):
+    """key_metrics columns of every month from ``aggregate``'s totals and the financials.
+
+    Values a month cannot give are NaN or infinite: ``Churn_Rate`` without
+    opening customers, ``CAC`` without signups, ``LTV`` without churn.
+    """
+    customers = np.cumsum(totals['signups'] - totals['churns'])
+    opening = np.concatenate([[0.0], customers[:-1]])
+    revenue = financials['Revenue'].to_numpy(dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        churn = np.where(opening > 0, totals['churns'] / opening, np.nan)
+        cac = financials['Sales_Marketing'].to_numpy(dtype=np.float64) / totals['signups']
+        margin = 1 - financials['COGS'].to_numpy(dtype=np.float64) / revenue
+        ltv = revenue / customers * margin / churn
+    return pd.DataFrame({
+        'Customers': customers.astype(np.int64),
+        'Transaction_Volume': totals['volume'],
+        'CAC': cac,
+        'LTV': ltv,
+        'LTV_CAC_Ratio': ltv / cac,
+        'Churn_Rate': churn * 100,
+    })
+
+
+def write_key_metrics(totals, data_dir='.'):
+    """Rewrite the historical months of key_metrics from ``totals``; returns their count.
+
+    Values a month cannot give (see ``unit_economics``) keep their stored
+    value, and ``LTV_CAC_Ratio`` is rederived from the resulting columns.
+    """
+    from datasets import DATASETS
+    from ingest import read_tail, write_tail
+
+    financials_csv = os.path.join(data_dir, DATASETS['financials'][0])
+    key_metrics_csv = os.path.join(data_dir, DATASETS['key_metrics'][0])
+    financials = pd.read_csv(financials_csv, usecols=['Revenue', 'COGS', 'Sales_Marketing',
+                                                      'Is_Historical'])
+    historical = int(financials['Is_Historical'].sum())
+    metrics = unit_economics({k: v[:historical] for k, v in totals.items()},
+                             financials.iloc[:historical])
+    key_metrics, offset = read_tail(key_metrics_csv, 0)
+    for column in metrics.columns.drop('LTV_CAC_Ratio'):
+        values = metrics[column].to_numpy()
+        column_values = key_metrics[column].to_numpy().astype(values.dtype)
+        column_values[:historical] = np.where(np.isfinite(values), values,
+                                              column_values[:historical])
+        key_metrics[column] = column_values
+    key_metrics['LTV_CAC_Ratio'] = key_metrics['LTV'] / key_metrics['CAC']
+    write_tail(key_metrics_csv, key_metrics, offset, slice(0, historical - 1))
+    return historical
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('log', help='event log (.csv or .parquet)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--chunk-mb', type=int, default=CHUNK_BYTES >> 20,
+                        help='CSV megabytes parsed per piece')
+    parser.add_argument('--restart', action='store_true',
+                        help='ignore saved progress and read the log from the start')
+    parser.add_argument('--data-dir', default='.')
+    parser.add_argument('--no-snapshot', action='store_true',
+                        help='skip recompiling snapshot.json')
+    args = parser.parse_args(argv)
+
+    from datasets import load_dataset
+    months = len(load_dataset('key_metrics', ('Date',), data_dir=args.data_dir))
+    totals = aggregate(args.log, months, workers=args.workers, chunk_bytes=args.chunk_mb << 20,
+                       resume=not args.restart)
+    rows = write_key_metrics(totals, args.data_dir)
+    print(f"{int(totals['signups'].sum()):,} signups, {int(totals['churns'].sum()):,} churns, "
+          f"{int(totals['transactions'].sum()):,} transactions")
+    print(f"  key_metrics: {rows} historical months rewritten")
+
+    if not args.no_snapshot:
+        from functools import partial
+
+        from scenario import ScenarioGraph
+        from snapshot import SNAPSHOT_FILE, write_snapshot
+        loader = partial(load_dataset, data_dir=args.data_dir)
+        write_snapshot(ScenarioGraph(loader), args.data_dir)
+        print(f"  {SNAPSHOT_FILE} recompiled")
+
+
+if __name__ == '__main__':
+    main()
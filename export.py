@@ -0,0 +1,136 @@
+"""Streaming CSV export of Monte Carlo scenario results.
+
+    python export.py 1000000 --out-dir exports --compression gzip
+
+``scenario_frames`` runs the simulator one seeding block at a time (see
+``montecarlo.block_seeds``) and yields that block's financials,
+key_metrics and ROI rows as long-format frames with a ``Scenario`` column;
+``export_scenarios`` writes them to one CSV per table as they come, in
+``chunk_rows`` slices, optionally through gzip or zstd (the latter needs
+the ``zstandard`` package). Only one block is in memory at a time, so peak
+memory does not grow with the number of scenarios, but it does with the
+horizon: a block holds ``block_size x months`` values of each of the
+``len(SERIES)`` series (about 20 MB at 1,000 x 120) and the block's
+frames, a few times that again. Long horizons need a smaller
+``block_size``. Scenario ``i`` is path ``i`` of ``montecarlo.simulate``
+with the same seed and block size.
+"""
+
+import argparse
+import gzip
+import io
+import os
+
+from captable import diluted_equity
+from datasets import load_dataset
+from montecarlo import BLOCK_SIZE, VOLATILITY, block_seeds, simulate_chunk
+from projection import CURRENT_MONTH, MONTHS, SEED, START_DATE, to_frames
+from roi import roi_cube, roi_frame
+
+TABLES = ('financials', 'key_metrics', 'roi')
+
+# Rows formatted per write
+CHUNK_ROWS = 10_000
+
+COMPRESSION_SUFFIXES = {None: '', 'gzip': '.gz', 'zstd': '.zst'}
+
+# Projection series the exported tables are built from
+SERIES = ('revenue', 'cogs', 'sales_marketing', 'rd', 'admin', 'total_costs', 'profit',
+          'cumulative_revenue', 'cumulative_costs', 'cumulative_profit', 'customers',
+          'transaction_volume', 'cac', 'ltv', 'ltv_cac_ratio', 'churn_rate', 'engineering',
+          'sales', 'operations', 'leadership', 'is_historical')
+
+
+def scenario_frames(n_paths, assumptions=None, months=MONTHS, current_month=CURRENT_MONTH,
+                    seed=SEED, volatility=VOLATILITY, block_size=BLOCK_SIZE, rounds=None,
+                    start_date=START_DATE, tables=TABLES):
+    """Yield ``{table: DataFrame}`` for each block of ``block_size`` scenarios.
+
+    ``rounds`` is the funding-round table for the ROI rows (the published
+    one by default).
+    """
+    if 'roi' in tables and rounds is None:
+        rounds = load_dataset('funding_rounds')
+    if 'roi' in tables:
+        equity = diluted_equity(rounds, months=months)
+    first = 0
+    for block in block_seeds(n_paths, seed, block_size):
+        paths = simulate_chunk([block], assumptions, months, current_month, volatility,
+                               metrics=SERIES)
+        frames = {}
+        if 'financials' in tables or 'key_metrics' in tables:
+            frames['financials'], frames['key_metrics'], _ = to_frames(paths, start_date, first)
+        if 'roi' in tables:
+            frames['roi'] = roi_frame(roi_cube(paths['revenue'], rounds, equity=equity), rounds,
+                                      current_month=current_month, first_scenario=first)
+        yield {table: frames[table] for table in tables}
+        first += block[0]
+
+
+def open_csv(path, compression=None):
+    """Text file for writing, compressed with ``'gzip'`` or ``'zstd'`` if given."""
+    if compression is None:
+        return open(path, 'w', newline='', encoding='utf-8')
+    if compression == 'gzip':
+        # mtime=0 keeps identical exports byte-identical
+        raw = gzip.GzipFile(path, 'wb', mtime=0)
+    elif compression == 'zstd':
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError("zstd export needs the zstandard package (pip install zstandard)") from None
+        raw = zstandard.open(path, 'wb')
+    else:
+        raise ValueError(f"Unknown compression {compression!r}; expected 'gzip' or 'zstd'")
+    return io.TextIOWrapper(raw, newline='', encoding='utf-8')
+
+
+def export_scenarios(out_dir, n_paths, compression=None, chunk_rows=CHUNK_ROWS,
+                     tables=TABLES, **kwargs):
+    """Stream ``n_paths`` scenarios to ``<out_dir>/scenarios_<table>.csv[.gz|.zst]``.
+
+    Every table is written in the same pass over the scenarios. ``kwargs``
+    go to ``scenario_frames``. Returns ``{table: (path, rows)}``.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    suffix = '.csv' + COMPRESSION_SUFFIXES[compression]
+    paths = {table: os.path.join(out_dir, f'scenarios_{table}{suffix}') for table in tables}
+    rows = dict.fromkeys(tables, 0)
+    files = {}
+    try:
+        for table, path in paths.items():
+            files[table] = open_csv(path, compression)
+        for frames in scenario_frames(n_paths, tables=tables, **kwargs):
+            for table, frame in frames.items():
+                frame.to_csv(files[table], header=rows[table] == 0, index=False, chunksize=chunk_rows)
+                rows[table] += len(frame)
+    finally:
+        for f in files.values():
+            f.close()
+    return {table: (paths[table], rows[table]) for table in tables}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('paths', type=int, help='number of scenarios')
+    parser.add_argument('--months', type=int, default=MONTHS)
+    parser.add_argument('--seed', type=int, default=SEED)
+    parser.add_argument('--data-dir', default='.', help='directory of the funding rounds table')
+    parser.add_argument('--out-dir', default='exports')
+    parser.add_argument('--compression', choices=['gzip', 'zstd'])
+    parser.add_argument('--chunk-rows', type=int, default=CHUNK_ROWS)
+    parser.add_argument('--block-size', type=int, default=BLOCK_SIZE,
+                        help='scenarios simulated (and held in memory) at a time; '
+                             'memory grows with block size x months')
+    args = parser.parse_args(argv)
+
+    rounds = load_dataset('funding_rounds', data_dir=args.data_dir)
+    written = export_scenarios(args.out_dir, args.paths, args.compression, args.chunk_rows,
+                               months=args.months, seed=args.seed, block_size=args.block_size,
+                               rounds=rounds)
+    for table, (path, rows) in written.items():
+        print(f"  {path}: {rows:,} rows")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,375 @@
+"""Plotly figure builders for the dashboard, memoized across reruns.
+
+Each builder is a pure function of its data and parameters. ``cached_figure``
+keys it on a content hash of its arguments and keeps the most recent
+figures in a bounded LRU shared by every session in the process, so a
+rerun that changes nothing (or a session on the base case someone else
+already drew) reuses the existing figure instead of rebuilding it.
+
+Cached figures are shared: callers must not mutate them.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict, namedtuple
+from functools import wraps
+
+import plotly.graph_objects as go
+
+from downsample import MAX_POINTS, downsample
+from lazy import lazy_import
+
+np = lazy_import('numpy')
+pd = lazy_import('pandas')
+
+FIGURE_CACHE_SIZE = 64
+
+# Line traces longer than this are drawn with WebGL (Scattergl); SVG
+# scatter gets sluggish past roughly 10k points
+WEBGL_THRESHOLD = 10_000
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+_builders = {}
+
+
+def fingerprint(value):
+    """Stable content digest of a builder argument."""
+    h = hashlib.blake2b(digest_size=16)
+    _feed(h, value)
+    return h.hexdigest()
+
+
+def _feed(h, value):
+    if isinstance(value, np.ndarray):
+        h.update(f'nd{value.dtype.str}{value.shape}'.encode())
+        h.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, (pd.Series, pd.DataFrame)):
+        h.update(f'pd{type(value).__name__}{list(getattr(value, "columns", [value.name]))}'.encode())
+        h.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+    elif isinstance(value, (list, tuple)):
+        h.update(f'seq{len(value)}'.encode())
+        for item in value:
+            _feed(h, item)
+    elif isinstance(value, dict):
+        h.update(f'map{len(value)}'.encode())
+        for key in sorted(value):
+            _feed(h, key)
+            _feed(h, value[key])
+    else:
+        h.update(repr(value).encode())
+
+
+def cached_figure(maxsize=FIGURE_CACHE_SIZE):
+    """Memoize a figure builder on a content hash of its arguments."""
+    def decorator(build):
+        cache = OrderedDict()
+        stats = {'hits': 0, 'misses': 0}
+        lock = threading.Lock()
+
+        @wraps(build)
+        def wrapper(*args, **kwargs):
+            key = fingerprint((args, kwargs))
+            with lock:
+                if key in cache:
+                    cache.move_to_end(key)
+                    stats['hits'] += 1
+                    return cache[key]
+                stats['misses'] += 1
+            fig = build(*args, **kwargs)
+            with lock:
+                cache[key] = fig
+                while len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return fig
+
+        def cache_info():
+            with lock:
+                return CacheInfo(stats['hits'], stats['misses'], maxsize, len(cache))
+
+        def cache_clear():
+            with lock:
+                cache.clear()
+                stats.update(hits=0, misses=0)
+
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        _builders[build.__name__] = wrapper
+        return wrapper
+    return decorator
+
+
+def cache_stats():
+    """Hit/miss counts per builder, e.g. ``{'revenue_figure': CacheInfo(...)}``."""
+    return {name: builder.cache_info() for name, builder in _builders.items()}
+
+
+def scatter_type(n_points, threshold=WEBGL_THRESHOLD):
+    """``go.Scattergl`` for a figure whose longest trace exceeds ``threshold``.
+
+    The choice is made per figure, not per trace: ``fill='tonexty'`` only
+    pairs with a previous trace of the same type, so mixing SVG and WebGL
+    traces would drop the fan's fill.
+    """
+    return go.Scattergl if n_points > threshold else go.Scatter
+
+
+def add_fan(fig, x, band, rgb, name, scatter=go.Scatter):
+    # P90 edge, then P10 filled up to it, then the P50 median line
+    fig.add_trace(scatter(
+        x=x, y=band[2][x], mode='lines', line=dict(width=0),
+        showlegend=False, hoverinfo='skip'
+    ))
+    fig.add_trace(scatter(
+        x=x, y=band[0][x], mode='lines', line=dict(width=0),
+        fill='tonexty', fillcolor=f'rgba({rgb}, 0.15)',
+        name=f'{name} P10-P90 Range'
+    ))
+    fig.add_trace(scatter(
+        x=x, y=band[1][x], mode='lines',
+        line=dict(color=f'rgb({rgb})', width=1, dash='dot'),
+        name=f'{name} Median (P50)'
+    ))
+
+
+def split_months(y, current_month, window=None, max_points=MAX_POINTS):
+    """Downsampled month indices of the actual and projected traces.
+
+    ``window`` is a ``(start, stop)`` month range to show at up to
+    ``max_points`` per trace; each trace keeps its endpoints, so the last
+    actual month and the first projected one are always drawn.
+    """
+    start, stop = window or (0, len(y))
+    historical = downsample(y, max_points, start, min(stop, current_month))
+    projected = downsample(y, max_points, max(start, current_month), stop)
+    return historical, projected
+
+
+@cached_figure()
+def roi_figure(rounds, roi_percentage):
+    fig = go.Figure()
+
+    fig.add_trace(go.Bar(
+        x=list(rounds),
+        y=roi_percentage,
+        text=[f"{val:,.0f}%" for val in roi_percentage],
+        textposition='outside',
+        marker_color=['#4caf50', '#ff9800', '#f44336'],
+        name='5-Year ROI %'
+    ))
+
+    fig.update_layout(
+        title="5-Year ROI Comparison: Invest Early = Higher Returns",
+        xaxis_title="Funding Round",
+        yaxis_title="ROI Percentage (%)",
+        height=400,
+        showlegend=False,
+        plot_bgcolor='white'
+    )
+    return fig
+
+
+@cached_figure()
+def revenue_figure(revenue, current_month, band, window=None, max_points=MAX_POINTS,
+                   gl_threshold=WEBGL_THRESHOLD):
+    fig = go.Figure()
+    historical_months, projected_months = split_months(revenue, current_month, window, max_points)
+    scatter = scatter_type(max(len(historical_months), len(projected_months)), gl_threshold)
+
+    # Historical revenue (solid line)
+    fig.add_trace(scatter(
+        x=historical_months,
+        y=revenue[historical_months],
+        mode='lines',
+        name='Actual Performance',
+        line=dict(color='#2ecc71', width=3),
+        fill='tozeroy',
+        fillcolor='rgba(46, 204, 113, 0.2)'
+    ))
+
+    fig.add_trace(scatter(
+        x=projected_months,
+        y=revenue[projected_months],
+        mode='lines',
+        name='Projected',
+        line=dict(color='#3498db', width=2, dash='dash'),
+        fill='tozeroy',
+        fillcolor='rgba(52, 152, 219, 0.1)'
+    ))
+
+    # Monte Carlo fan over the projection
+    add_fan(fig, projected_months, band, '52, 152, 219', 'Revenue', scatter)
+
+    # Add vertical line at current month
+    fig.add_vline(
+        x=current_month,
+        line_dash="dot",
+        line_color="red",
+        line_width=2,
+        annotation_text="YOU ARE HERE - Series A",
+        annotation_position="top"
+    )
+
+    fig.update_layout(
+        title="Monthly Revenue: Historical Performance + 10-Year Projection",
+        xaxis_title="Months Since Launch",
+        yaxis_title="Monthly Revenue ($)",
+        height=500,
+        hovermode='x unified',
+        plot_bgcolor='white'
+    )
+    if window:
+        fig.update_xaxes(range=[window[0], window[1] - 1])
+    return fig
+
+
+@cached_figure()
+def market_figure(markets, values, labels):
+    fig = go.Figure()
+
+    fig.add_trace(go.Bar(
+        x=list(markets),
+        y=values,
+        text=list(labels),
+        textposition='outside',
+        marker_color=['#1f77b4', '#ff7f0e', '#2ca02c'],
+        showlegend=False
+    ))
+
+    fig.update_layout(
+        title="Canadian B2B Payments Market",
+        yaxis_title="Market Size (Billions CAD)",
+        height=400,
+        plot_bgcolor='white'
+    )
+    return fig
+
+
+@cached_figure()
+def customers_figure(customers, current_month, band, window=None, max_points=MAX_POINTS,
+                     gl_threshold=WEBGL_THRESHOLD):
+    fig = go.Figure()
+    historical_months, projected_months = split_months(customers, current_month, window, max_points)
+    scatter = scatter_type(max(len(historical_months), len(projected_months)), gl_threshold)
+
+    # Historical customers
+    fig.add_trace(scatter(
+        x=historical_months,
+        y=customers[historical_months],
+        mode='lines+markers',
+        name='Actual Customers',
+        line=dict(color='#2ecc71', width=3),
+        marker=dict(size=6)
+    ))
+
+    fig.add_trace(scatter(
+        x=projected_months,
+        y=customers[projected_months],
+        mode='lines',
+        name='Projected Customers',
+        line=dict(color='#3498db', width=2, dash='dash')
+    ))
+
+    add_fan(fig, projected_months, band, '52, 152, 219', 'Customers', scatter)
+
+    fig.add_vline(
+        x=current_month,
+        line_dash="dot",
+        line_color="red",
+        line_width=2,
+        annotation_text="Series A Opportunity",
+        annotation_position="top"
+    )
+
+    fig.update_layout(
+        title="Customer Growth: From 35 to 1M+ over 10 Years",
+        xaxis_title="Months Since Launch",
+        yaxis_title="Number of Customers",
+        height=450,
+        hovermode='x unified',
+        plot_bgcolor='white'
+    )
+    if window:
+        fig.update_xaxes(range=[window[0], window[1] - 1])
+    return fig
+
+
+@cached_figure()
+def tornado_figure(parameters, output_low, output_high, base, output_label, swing):
+    fig = go.Figure()
+    # Largest swing on top: bars are drawn bottom-up
+    labels = [name.replace('_', ' ') for name in reversed(parameters)]
+    low, high = output_low[::-1], output_high[::-1]
+
+    fig.add_trace(go.Bar(
+        y=labels, x=low - base, base=base, orientation='h',
+        marker_color='#f44336', name=f'Input -{swing:.0%}',
+        customdata=low, hovertemplate='%{y}: %{customdata:,.0f}<extra></extra>'
+    ))
+    fig.add_trace(go.Bar(
+        y=labels, x=high - base, base=base, orientation='h',
+        marker_color='#4caf50', name=f'Input +{swing:.0%}',
+        customdata=high, hovertemplate='%{y}: %{customdata:,.0f}<extra></extra>'
+    ))
+    fig.add_vline(x=base, line_color='black', line_width=1)
+
+    fig.update_layout(
+        title=f"What Moves the {output_label}: Each Assumption ±{swing:.0%}",
+        xaxis_title=output_label,
+        barmode='overlay',
+        height=150 + 30 * len(labels),
+        plot_bgcolor='white'
+    )
+    return fig
+
+
+@cached_figure()
+def payout_figure(exit_values, rounds, investors, common, exit_month):
+    fig = go.Figure()
+    # Stacked, so the layers add up to the exit value
+    x = exit_values / 1e6
+    for r, name in enumerate(rounds):
+        fig.add_trace(go.Scatter(
+            x=x, y=investors[:, r] / 1e6, mode='lines', name=name, stackgroup='exit',
+            hovertemplate=f'{name}: $%{{y:,.1f}}M<extra></extra>'
+        ))
+    fig.add_trace(go.Scatter(
+        x=x, y=common / 1e6, mode='lines', name='Founders & Option Pool', stackgroup='exit',
+        line=dict(color='#7f7f7f'),
+        hovertemplate='Founders & pool: $%{y:,.1f}M<extra></extra>'
+    ))
+
+    fig.update_layout(
+        title=f"Exit Waterfall: Who Takes Home What at an Exit in Month {exit_month}",
+        xaxis_title="Exit Value ($M)",
+        yaxis_title="Payout ($M)",
+        height=450,
+        hovermode='x unified',
+        plot_bgcolor='white'
+    )
+    return fig
+
+
+@cached_figure()
+def retention_figure(retention, cohorts):
+    # Cohort x age triangle in %; later cohorts have no data at older ages
+    fig = go.Figure(go.Heatmap(
+        z=retention * 100,
+        x=np.arange(retention.shape[1]),
+        y=list(cohorts),
+        colorscale='Blues',
+        zmin=0,
+        zmax=100,
+        colorbar=dict(title='Active (%)'),
+        hovertemplate='Cohort %{y}, month %{x}: %{z:.1f}% active<extra></extra>'
+    ))
+
+    fig.update_layout(
+        title="Cohort Retention: Share of Each Monthly Cohort Still Active",
+        xaxis_title="Months Since Acquisition",
+        yaxis_title="Acquisition Cohort",
+        yaxis_autorange='reversed',
+        height=550,
+        plot_bgcolor='white'
+    )
+    return fig
@@ -0,0 +1,179 @@
+"""Goal seek: the growth rate or round terms that reach a target.
+
+Answers questions like "what Series A growth gets the 5-year Series A ROI
+to 850%?" or "how high can the Series B valuation go while its investors
+still see 300%?" against a ``ScenarioGraph``, so every other input stays at
+the session's what-if values.
+
+A target is one of ``TARGETS``: a round's ROI (%) or multiple after
+``years``, or ARR or company valuation ($) at ``month``. A lever is one of
+the revenue growth inputs (``scenario.REVENUE_INPUTS``) or a round's
+``valuation`` or ``equity`` at issue (e.g. ``'series_a_valuation'``). ROI is
+on ownership diluted by the later rounds (``captable.py``), so a later
+round's terms move an earlier round's ROI too. The target is
+evaluated for a whole grid of lever values in one broadcast pass, and the
+first grid step that crosses it is refined by safeguarded secant
+(regula falsi) steps, falling back to bisection across the jumps of the
+ARR multiple. A solve takes one grid pass and a handful of single-path
+evaluations, a few milliseconds.
+"""
+
+from collections import namedtuple
+
+from captable import diluted_equity
+from lazy import lazy_import
+from projection import extend, regime_rates
+from roi import roi_cube, valuation_multiple
+from scenario import REVENUE_INPUTS, round_key
+
+np = lazy_import('numpy')
+
+TARGETS = ('roi', 'multiple', 'arr', 'valuation')
+
+# Lever values tried in the first, vectorized pass
+GRID_POINTS = 64
+
+# Refinement stops once the target is met within RTOL (relative) or the
+# bracket is narrower than XTOL of the search range
+RTOL = 1e-9
+XTOL = 1e-12
+MAX_ITERATIONS = 100
+
+# Search range of the growth inputs (monthly rate) and of a round's equity
+# at issue (%), which with its option pool must stay below 100%
+GROWTH_BOUNDS = (0.0, 1.0)
+EQUITY_BOUNDS = (0.1, 75.0)
+
+GoalSeek = namedtuple('GoalSeek', ['lever', 'value', 'achieved', 'evaluations'])
+
+
+def levers(graph):
+    """Names of the inputs ``goal_seek`` can solve for."""
+    names = graph.get('rounds')['Round']
+    return list(REVENUE_INPUTS) + [round_key(name, field) for name in names
+                                   for field in ('valuation', 'equity')]
+
+
+def default_bounds(graph, lever):
+    """Search range of ``lever``; a valuation spans the round's ``EQUITY_BOUNDS``."""
+    if lever in REVENUE_INPUTS:
+        return GROWTH_BOUNDS
+    name, field = _round_lever(graph, lever)
+    if field == 'equity':
+        return EQUITY_BOUNDS
+    amount = _round(graph, name)['Amount']
+    return tuple(amount * 100 / equity for equity in reversed(EQUITY_BOUNDS))
+
+
+def _round_lever(graph, lever):
+    for name in graph.get('rounds')['Round']:
+        for field in ('valuation', 'equity'):
+            if lever == round_key(name, field):
+                return name, field
+    raise KeyError(f"Unknown lever {lever!r}; expected one of {levers(graph)}")
+
+
+def _round(graph, name):
+    rounds = graph.get('rounds')
+    row = rounds[rounds['Round'] == name]
+    if row.empty:
+        raise KeyError(f"Unknown round {name!r}; expected one of {list(rounds['Round'])}")
+    return {column: row[column].item() for column in ('Amount', 'Equity', 'Month')}
+
+
+def target_function(graph, target, lever, round_name='Series A', years=5, month=60):
+    """``f(values)``: the target for an array of lever values, in one pass."""
+    if target not in TARGETS:
+        raise KeyError(f"Unknown target {target!r}; expected one of {TARGETS}")
+    if lever not in REVENUE_INPUTS:
+        lever_round, field = _round_lever(graph, lever)
+        if target in ('arr', 'valuation'):
+            raise ValueError(f"{lever!r} does not move {target!r}; pick a growth input")
+    row = _round(graph, round_name) if target in ('roi', 'multiple') else None
+    history = graph.actual('revenue')
+    rounds = graph.get('rounds')
+    terms = {column: rounds[column].to_numpy(dtype=np.float64)
+             for column in ('Amount', 'Valuation', 'Option_Pool') if column in rounds}
+    terms['Month'] = rounds['Month'].to_numpy()
+    r = list(rounds['Round']).index(round_name) if row is not None else None
+    if row is not None and lever in REVENUE_INPUTS:
+        fixed_equity = diluted_equity(terms, (years,), graph.months)[r, 0]
+
+    def equity_after(values):
+        # The round's diluted ownership after ``years``, for each lever value
+        if lever in REVENUE_INPUTS:
+            return fixed_equity
+        k = list(rounds['Round']).index(lever_round)
+        valuation = values if field == 'valuation' else terms['Amount'][k] * 100 / values
+        batch = dict(terms, Valuation=np.repeat(terms['Valuation'][np.newaxis], values.size, axis=0))
+        batch['Valuation'][:, k] = valuation.ravel()
+        return diluted_equity(batch, (years,), graph.months)[:, r, 0].reshape(values.shape)
+
+    def f(values):
+        values = np.asarray(values, dtype=np.float64)
+        revenue = graph.get('revenue')
+        if lever in REVENUE_INPUTS:
+            inputs = dict(graph.inputs, **{lever: values})
+            factors = 1 + regime_rates(inputs, 'revenue_growth', graph.months, values.shape)
+            revenue = extend(history, factors)
+        if row is None:
+            arr = revenue[..., month] * 12
+            return arr if target == 'arr' else arr * valuation_multiple(arr)
+        if lever not in REVENUE_INPUTS:
+            revenue = np.broadcast_to(revenue, values.shape + revenue.shape)
+        equity = np.broadcast_to(equity_after(values), values.shape)[..., np.newaxis, np.newaxis]
+        cube = roi_cube(revenue, {'Amount': [row['Amount']], 'Month': [row['Month']]},
+                        horizons=(years,), equity=equity)
+        return cube['roi_percentage' if target == 'roi' else 'multiple'][..., 0, 0]
+
+    return f
+
+
+def goal_seek(graph, target, value, lever, round_name='Series A', years=5, month=60,
+              bounds=None, grid=GRID_POINTS):
+    """The lever value at which ``target`` first reaches ``value``.
+
+    Returns a ``GoalSeek(lever, value, achieved, evaluations)``. The target
+    may rise or fall with the lever; the answer is the boundary of the
+    values that reach it, e.g. the least growth, or the highest valuation
+    (least equity) of the round itself that still gets there. Raises
+    ``ValueError`` when no value within ``bounds`` reaches the target.
+    """
+    f = target_function(graph, target, lever, round_name, years, month)
+    lo, hi = bounds or default_bounds(graph, lever)
+    xs = np.linspace(lo, hi, grid)
+    ys = f(xs)
+    met = ys >= value
+    if not met.any():
+        raise ValueError(f"{target} peaks at {ys.max():,.1f} for {lever} in [{lo:g}, {hi:g}], "
+                         f"short of {value:,.1f}")
+    if ys[-1] < ys[0]:
+        xs, ys, met = xs[::-1], ys[::-1], met[::-1]
+    i = int(met.argmax())
+    evaluations = grid
+    if i == 0:
+        return GoalSeek(lever, xs[0].item(), ys[0].item(), evaluations)
+
+    # a misses the target and b meets it; wa and wb are the residuals the
+    # secant uses, halved at an end that has gone stale (the Illinois rule)
+    a, b = xs[i - 1].item(), xs[i].item()
+    fb = ys[i].item() - value
+    wa, wb = ys[i - 1].item() - value, fb
+    side = 0
+    while evaluations < grid + MAX_ITERATIONS:
+        if fb <= RTOL * max(1.0, abs(value)) or abs(b - a) <= XTOL * (hi - lo):
+            break
+        x = b - wb * (b - a) / (wb - wa)
+        if not min(a, b) < x < max(a, b):
+            x = (a + b) / 2
+        fx = f(x).item() - value
+        evaluations += 1
+        if fx >= 0:
+            b, fb, wb = x, fx, fx
+            wa = wa / 2 if side == 1 else wa
+            side = 1
+        else:
+            a, wa = x, fx
+            wb = wb / 2 if side == -1 else wb
+            side = -1
+    return GoalSeek(lever, b, fb + value, evaluations)
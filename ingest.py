@@ -0,0 +1,257 @@
+"""Record one month of actuals without regenerating the data.
+
+    python ingest.py 19 --revenue 452000 --cogs 118000 --sales-marketing 151000 \
+        --rd 88000 --admin 41000 --customers 910
+
+Month ``N`` is 1-based, like the dashboard's "Month N". It may correct an
+existing actual (N <= current month), record the next one (N = current
+month + 1, replacing that month's projection) or extend the tables by a
+month (N = months + 1). Fields left out keep the month's current values
+(or the previous month's, when appending). The month is marked
+``Is_Historical``; ``Total_Costs``, ``Profit`` and ``LTV_CAC_Ratio`` are
+rederived for it, the ``Cumulative_*`` columns are recomputed from it
+forward off the previous month's totals, and only the ROI rows valued at
+that month, or whose round crosses the historical boundary, are rebuilt.
+
+Each CSV is patched from its first changed row to the end (the row is
+found by counting newlines back from the end of the file) and its columnar
+copy is patched through a renamed copy of each column file (see
+``columnar.write_rows``), so an update costs the rows from the changed
+month on rather than re-encoding the whole history. Nothing
+is written until every table has been patched in memory, so a bad value
+leaves the data as it was. The page snapshot is recompiled afterwards.
+"""
+
+import argparse
+import io
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from captable import diluted_equity
+from columnar import META_FILE, columnar_path, write_rows
+from datasets import DATASETS
+from roi import roi_cube, roi_frame
+
+FINANCIAL_FIELDS = {
+    'revenue': 'Revenue',
+    'cogs': 'COGS',
+    'sales_marketing': 'Sales_Marketing',
+    'rd': 'RD',
+    'admin': 'Admin',
+}
+METRIC_FIELDS = {
+    'customers': 'Customers',
+    'transaction_volume': 'Transaction_Volume',
+    'cac': 'CAC',
+    'ltv': 'LTV',
+    'churn_rate': 'Churn_Rate',
+}
+CUMULATIVE = {
+    'Cumulative_Revenue': 'Revenue',
+    'Cumulative_Costs': 'Total_Costs',
+    'Cumulative_Profit': 'Profit',
+}
+
+
+def _row_offset(csv_path, row):
+    """Header line and byte offset at which data row ``row`` starts.
+
+    When the columnar store gives the row count, newlines are counted back
+    from the end of the file, so the scan covers only rows ``row:``.
+    """
+    with open(csv_path, 'rb') as f:
+        header = f.readline()
+        meta = os.path.join(columnar_path(csv_path), META_FILE)
+        if not os.path.isfile(meta):
+            return header, _scan_forward(f, len(header), row)
+        with open(meta) as m:
+            rows = json.load(m)['rows']
+        return header, _scan_backward(f, rows - row + 1, len(header))
+
+
+def _scan_forward(f, offset, lines):
+    f.seek(offset)
+    for _ in range(lines):
+        line = f.readline()
+        if not line:
+            break
+        offset += len(line)
+    return offset
+
+
+def _scan_backward(f, newlines, floor, block=1 << 16):
+    # Offset just past the ``newlines``-th newline from the end, or ``floor``
+    end = f.seek(0, os.SEEK_END)
+    seen = 0
+    while end > floor:
+        start = max(end - block, floor)
+        f.seek(start)
+        chunk = f.read(end - start)
+        count = chunk.count(b'\n')
+        if seen + count >= newlines:
+            pos = len(chunk)
+            for _ in range(newlines - seen):
+                pos = chunk.rindex(b'\n', 0, pos)
+            return start + pos + 1
+        seen += count
+        end = start
+    return floor
+
+
+def read_tail(csv_path, start):
+    """Rows ``start:`` of a CSV (indexed from ``start``) and their byte offset."""
+    header, offset = _row_offset(csv_path, start)
+    with open(csv_path, 'rb') as f:
+        f.seek(offset)
+        body = f.read()
+    tail = pd.read_csv(io.BytesIO(header + body), float_precision='round_trip')
+    tail.index += start
+    return tail, offset
+
+
+def write_tail(csv_path, tail, offset, changed):
+    """Replace a CSV from ``offset`` on with ``tail``.
+
+    Rows after an edit shift in a text file, so the whole tail is written;
+    the columnar copy only gets the ``changed`` rows (a ``slice`` of labels).
+    """
+    with open(csv_path, 'r+b') as f:
+        f.seek(offset)
+        f.write(tail.to_csv(index=False, header=False).encode())
+        f.truncate()
+    path = columnar_path(csv_path)
+    if os.path.isfile(os.path.join(path, META_FILE)):
+        rows = tail.loc[changed].copy()
+        if 'Date' in rows:
+            rows['Date'] = pd.to_datetime(rows['Date'])
+        write_rows(path, rows, int(rows.index[0]))
+
+
+def _patch_month(tail, m, fields, values):
+    """Set month ``m`` of ``tail`` (appending it if new) and mark it historical."""
+    if m not in tail.index:
+        row = tail.loc[m - 1].copy()
+        row['Date'] = (pd.Timestamp(row['Date']) + pd.offsets.MonthEnd(1)).strftime('%Y-%m-%d')
+        tail.loc[m] = row
+    for key, column in fields.items():
+        value = values.get(key)
+        if value is None:
+            continue
+        # A fractional value turns an integer column into a float one
+        if tail[column].dtype.kind in 'iu' and value != int(value):
+            tail[column] = tail[column].astype(np.float64)
+        tail.loc[m, column] = value
+    tail.loc[m, 'Is_Historical'] = True
+    return tail
+
+
+def ingest_month(month, values, data_dir='.'):
+    """Record actuals for 1-based ``month``; returns the rows rewritten per table."""
+    csv = {name: os.path.join(data_dir, DATASETS[name][0]) for name in DATASETS}
+    m = month - 1
+    start = max(m - 1, 0)
+
+    financials, fin_offset = read_tail(csv['financials'], start)
+    months = start + len(financials)
+    historical = financials['Is_Historical'].to_numpy()
+    # Actuals are contiguous: the month must already be historical or be the next one
+    current_month = start + (len(historical) if historical.all() else int(np.argmin(historical)))
+    if m < 0 or m > months:
+        raise ValueError(f"Month {month} is outside 1..{months + 1}")
+    if m > current_month:
+        raise ValueError(f"Month {month} would skip months; the next actual is month {current_month + 1}")
+    new_current = max(current_month, m + 1)
+
+    # Financials: the month itself, then cumulative totals from it forward
+    financials = _patch_month(financials, m, FINANCIAL_FIELDS, values)
+    cogs, sm, rd, admin = (financials.loc[m, c] for c in ['COGS', 'Sales_Marketing', 'RD', 'Admin'])
+    financials.loc[m, 'Total_Costs'] = cogs + sm + rd + admin
+    financials.loc[m, 'Profit'] = financials.loc[m, 'Revenue'] - financials.loc[m, 'Total_Costs']
+    for cumulative, column in CUMULATIVE.items():
+        before = financials.loc[m - 1, cumulative] if m > 0 else 0.0
+        # Sequential sum from the previous total, as np.cumsum over the full column
+        financials.loc[m:, cumulative] = np.cumsum(
+            np.concatenate(([before], financials.loc[m:, column].to_numpy())))[1:]
+    # Every table is patched in memory and written only once all of them are
+    writes = [(csv['financials'], financials, fin_offset, slice(m, None))]
+
+    # Key metrics and team: just the month
+    key_metrics, km_offset = read_tail(csv['key_metrics'], start)
+    key_metrics = _patch_month(key_metrics, m, METRIC_FIELDS, values)
+    key_metrics.loc[m, 'LTV_CAC_Ratio'] = key_metrics.loc[m, 'LTV'] / key_metrics.loc[m, 'CAC']
+    writes.append((csv['key_metrics'], key_metrics, km_offset, slice(m, m)))
+    team, team_offset = read_tail(csv['team'], start)
+    team = _patch_month(team, m, {}, values)
+    writes.append((csv['team'], team, team_offset, slice(m, m)))
+
+    # ROI: rows valued at this month, plus rows whose valuation month or
+    # historical flag moved; the table is rounds x horizons, not history
+    rounds = pd.read_csv(csv['funding_rounds'])
+    roi = pd.read_csv(csv['roi'], float_precision='round_trip')
+    new_months = max(months, m + 1)
+    revenue = np.full(new_months, np.nan)
+    revenue[m] = financials.loc[m, 'Revenue']
+    equity = diluted_equity(rounds, months=new_months)
+    rebuilt = roi_frame(roi_cube(revenue, rounds, equity=equity), rounds, current_month=new_current)
+    changed = ((rebuilt['End_Month'] == m) | (rebuilt['End_Month'] != roi['End_Month'])
+               | (rebuilt['Is_Historical'] != roi['Is_Historical'])).to_numpy()
+    roi_rows = 0
+    if changed.any():
+        first = int(np.argmax(changed))
+        tail = roi.loc[first:].copy()
+        for column in ['End_Month', 'Is_Historical']:
+            tail[column] = rebuilt.loc[first:, column]
+        valued = changed[first:] & (rebuilt.loc[first:, 'End_Month'] == m).to_numpy()
+        for column in ['ARR', 'Company_Valuation', 'Equity_Value', 'Absolute_Return',
+                       'ROI_Percentage', 'Multiple']:
+            tail.loc[tail.index[valued], column] = rebuilt.loc[first:, column][valued]
+        last = first + int(np.flatnonzero(changed[first:])[-1])
+        writes.append((csv['roi'], tail, _row_offset(csv['roi'], first)[1], slice(first, last)))
+        roi_rows = int(changed.sum())
+
+    for args in writes:
+        write_tail(*args)
+
+    return {
+        'month': month,
+        'current_month': new_current,
+        'financials': len(financials.loc[m:]),
+        'key_metrics': 1,
+        'team': 1,
+        'roi': roi_rows,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('month', type=int, help='1-based month, e.g. 19')
+    for key in list(FINANCIAL_FIELDS) + list(METRIC_FIELDS):
+        parser.add_argument(f"--{key.replace('_', '-')}", dest=key,
+                            type=int if key == 'customers' else float)
+    parser.add_argument('--data-dir', default='.')
+    parser.add_argument('--no-snapshot', action='store_true',
+                        help='skip recompiling snapshot.json')
+    args = parser.parse_args(argv)
+
+    values = {k: v for k, v in vars(args).items() if k in FINANCIAL_FIELDS or k in METRIC_FIELDS}
+    summary = ingest_month(args.month, values, args.data_dir)
+    print(f"Month {summary['month']} recorded; current month is now {summary['current_month']}")
+    print(f"  rows rewritten: financials {summary['financials']}, key_metrics {summary['key_metrics']}, "
+          f"team {summary['team']}, roi {summary['roi']}")
+
+    if not args.no_snapshot:
+        from functools import partial
+
+        from datasets import load_dataset
+        from scenario import ScenarioGraph
+        from snapshot import SNAPSHOT_FILE, write_snapshot
+        loader = partial(load_dataset, data_dir=args.data_dir)
+        write_snapshot(ScenarioGraph(loader), args.data_dir)
+        print(f"  {SNAPSHOT_FILE} recompiled")
+
+
+if __name__ == '__main__':
+    main()
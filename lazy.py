@@ -0,0 +1,37 @@
+"""Deferred imports for the dashboard's fast start.
+
+NumPy and pandas take about half a second to import, and the base-case
+page, rendered from the precompiled snapshot, needs neither. Modules on
+the app's import path bind them with ``np = lazy_import('numpy')``: the
+name is a stand-in module that imports the real one on first attribute
+access and then takes over its namespace, so later lookups cost nothing
+extra. The import itself goes through ``importlib``, whose module locks
+make concurrent first uses from several sessions safe.
+
+``DASHBOARD_FAST_START=0`` turns this off and imports eagerly, e.g. to warm
+a server before its first session.
+"""
+
+import importlib
+import os
+import sys
+import types
+
+FAST_START = os.environ.get('DASHBOARD_FAST_START', '1') != '0'
+
+
+class LazyModule(types.ModuleType):
+    """Stand-in for a module that is imported when first used."""
+
+    def __getattr__(self, attr):
+        module = importlib.import_module(self.__name__)
+        self.__dict__.update(module.__dict__)
+        return getattr(module, attr)
+
+
+def lazy_import(name):
+    """Module ``name``, imported now if it already is (or fast start is off), else on first use."""
+    module = sys.modules.get(name)
+    if module is not None or not FAST_START:
+        return module or importlib.import_module(name)
+    return LazyModule(name)
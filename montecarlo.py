@@ -0,0 +1,218 @@
+"""Monte Carlo scenario simulator for the projection model.
+
+Runs the vectorized engine in ``projection.py`` on a (scenarios x months)
+batch. Each projected month gets a normal shock on its revenue and customer
+growth rate, so every path follows the same regimes with different luck.
+
+Scenarios are generated in fixed-size blocks, each seeded from its own
+``numpy.random.SeedSequence`` child, so a run is reproducible whether it is
+materialized at once, streamed chunk by chunk or spread over processes.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+from lazy import lazy_import
+from projection import CURRENT_MONTH, MONTHS, SEED, draw_uniforms, project
+
+np = lazy_import('numpy')
+
+METRICS = ('revenue', 'customers', 'total_costs')
+PERCENTILES = (10, 50, 90)
+
+# Standard deviation of the monthly growth-rate shock in projected months
+VOLATILITY = 0.03
+
+# Scenarios per independently seeded block
+BLOCK_SIZE = 1000
+
+# Default scenarios per chunk in streaming mode (whole blocks)
+CHUNK_SIZE = 8 * BLOCK_SIZE
+
+# Tasks queued per worker process, to even out load across cores
+TASKS_PER_WORKER = 4
+
+# Months a PercentileSketch bins or ranks at a time, which bounds the
+# temporaries to MONTH_BLOCK x bins whatever the horizon
+MONTH_BLOCK = 256
+
+
+def block_seeds(n_paths, seed=SEED, block_size=BLOCK_SIZE):
+    """Return ``(size, SeedSequence)`` for every block of a run."""
+    n_blocks = -(-n_paths // block_size)
+    children = np.random.SeedSequence(seed).spawn(n_blocks)
+    sizes = [block_size] * n_blocks
+    if n_blocks:
+        sizes[-1] = n_paths - block_size * (n_blocks - 1)
+    return list(zip(sizes, children))
+
+
+def _block_inputs(size, seed_seq, months, current_month, volatility, resample_history):
+    rng = np.random.default_rng(seed_seq)
+    draws = draw_uniforms(rng, months, current_month, size=size) if resample_history else None
+    shocks = volatility * rng.standard_normal((size, months))
+    shocks[:, :current_month] = 0.0
+    return draws, shocks
+
+
+def simulate_chunk(blocks, assumptions=None, months=MONTHS, current_month=CURRENT_MONTH,
+                   volatility=VOLATILITY, resample_history=False, metrics=METRICS,
+                   history=None):
+    """Simulate a list of ``(size, SeedSequence)`` blocks in one engine call.
+
+    Returns ``{metric: (paths, months)}``. By default the historical months
+    keep the seeded actuals and only the projection is random;
+    ``resample_history`` redraws them per path too. ``history`` passes
+    recorded actuals through to ``projection.project``.
+    """
+    inputs = [_block_inputs(size, seed_seq, months, current_month, volatility, resample_history)
+              for size, seed_seq in blocks]
+    shocks = np.concatenate([s for _, s in inputs])
+    if resample_history:
+        draws = {k: np.concatenate([d[k] for d, _ in inputs]) for k in inputs[0][0]}
+    else:
+        draws = draw_uniforms(np.random.RandomState(SEED), months, current_month)
+    projection = project(assumptions, months, current_month, draws=draws, shocks=shocks,
+                         history=history)
+    return {m: np.broadcast_to(projection[m], shocks.shape) for m in metrics}
+
+
+def simulate(n_paths, assumptions=None, months=MONTHS, current_month=CURRENT_MONTH,
+             seed=SEED, volatility=VOLATILITY, resample_history=False, metrics=METRICS,
+             history=None):
+    """Materialize every path as ``{metric: (n_paths, months)}`` arrays."""
+    return simulate_chunk(block_seeds(n_paths, seed), assumptions, months, current_month,
+                          volatility, resample_history, metrics, history)
+
+
+class PercentileSketch:
+    """Per-month histogram over log-spaced bins.
+
+    Counts are integers, so sketches built from any split of the scenarios
+    merge to exactly the same state. With the default 4096 bins over
+    [1, 1e15] a percentile is within 0.5% of the exact value (1024 bins:
+    within 2%); values outside the range land in the edge bins.
+
+    Counts are uint32, up to ``COUNT_MAX`` scenarios, and take ``months x
+    bins x 4`` bytes: 2 MB at 120 months, 164 MB at 10k months, so long
+    horizons want fewer ``bins``.
+    """
+
+    COUNT_MAX = 2**32 - 1
+
+    def __init__(self, months, lo=1.0, hi=1e15, bins=4096):
+        self.months = months
+        self.lo = lo
+        self.hi = hi
+        self.bins = bins
+        self.counts = np.zeros((months, bins), dtype=np.uint32)
+        self._log_lo = np.log(lo)
+        self._width = (np.log(hi) - self._log_lo) / bins
+
+    def _check_room(self, n):
+        if self.count + n > self.COUNT_MAX:
+            raise ValueError(f"A sketch holds at most {self.COUNT_MAX:,} scenarios")
+
+    def update(self, values):
+        """Add a ``(n, months)`` batch of paths."""
+        self._check_room(len(values))
+        for start in range(0, self.months, MONTH_BLOCK):
+            stop = min(start + MONTH_BLOCK, self.months)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                idx = np.floor((np.log(values[:, start:stop]) - self._log_lo) / self._width)
+            idx = np.nan_to_num(idx, nan=0.0, posinf=self.bins - 1, neginf=0.0)
+            idx = np.clip(idx, 0, self.bins - 1).astype(np.int64)
+            flat = idx + np.arange(stop - start) * self.bins
+            self.counts[start:stop] += np.bincount(
+                flat.ravel(), minlength=(stop - start) * self.bins).reshape(
+                    stop - start, self.bins).astype(np.uint32)
+        return self
+
+    def merge(self, other):
+        if (other.months, other.lo, other.hi, other.bins) != (self.months, self.lo, self.hi, self.bins):
+            raise ValueError("Cannot merge sketches with different binning")
+        self._check_room(other.count)
+        self.counts += other.counts
+        return self
+
+    @property
+    def count(self):
+        return int(self.counts[0].sum()) if self.months else 0
+
+    def percentiles(self, q=PERCENTILES):
+        """Approximate percentiles, shape ``(len(q), months)``."""
+        out = np.empty((len(q), self.months))
+        for start in range(0, self.months, MONTH_BLOCK):
+            stop = min(start + MONTH_BLOCK, self.months)
+            cumulative = np.cumsum(self.counts[start:stop], axis=1, dtype=np.int64)
+            total = cumulative[:, -1:]
+            for k, pct in enumerate(q):
+                rank = np.ceil(pct / 100 * total).clip(min=1)
+                idx = (cumulative < rank).sum(axis=1)
+                out[k, start:stop] = np.exp(self._log_lo + (idx + 0.5) * self._width)
+        return out
+
+
+def sketch_blocks(blocks, assumptions=None, months=MONTHS, current_month=CURRENT_MONTH,
+                  volatility=VOLATILITY, resample_history=False, metrics=METRICS,
+                  chunk_size=CHUNK_SIZE, history=None):
+    """Fold blocks into one ``PercentileSketch`` per metric, a chunk at a time."""
+    sketches = {m: PercentileSketch(months) for m in metrics}
+    per_chunk = max(1, chunk_size // BLOCK_SIZE)
+    for start in range(0, len(blocks), per_chunk):
+        chunk = simulate_chunk(blocks[start:start + per_chunk], assumptions, months,
+                               current_month, volatility, resample_history, metrics, history)
+        for m in metrics:
+            sketches[m].update(chunk[m])
+    return sketches
+
+
+def _sketch_task(blocks, kwargs):
+    # Runs in a worker process; only the histogram counts travel back
+    return {m: s.counts for m, s in sketch_blocks(blocks, **kwargs).items()}
+
+
+def _split(blocks, n_tasks, per_chunk):
+    # Contiguous groups of whole chunks, roughly equal in size
+    chunks = [blocks[i:i + per_chunk] for i in range(0, len(blocks), per_chunk)]
+    n_tasks = max(1, min(n_tasks, len(chunks)))
+    bounds = np.linspace(0, len(chunks), n_tasks + 1).round().astype(int)
+    return [sum(chunks[lo:hi], []) for lo, hi in zip(bounds[:-1], bounds[1:]) if hi > lo]
+
+
+def simulate_bands(n_paths, assumptions=None, months=MONTHS, current_month=CURRENT_MONTH,
+                   seed=SEED, volatility=VOLATILITY, resample_history=False,
+                   metrics=METRICS, percentiles=PERCENTILES, chunk_size=None, workers=None,
+                   history=None):
+    """Return ``{metric: (len(percentiles), months)}`` percentile bands.
+
+    Without ``chunk_size`` all paths are materialized and the percentiles
+    are exact. With it, blocks are generated ``chunk_size`` paths at a time
+    and folded into a ``PercentileSketch``, so memory stays bounded by the
+    chunk and the sketches (see ``PercentileSketch`` for their size, which
+    grows with ``months``) no matter how many paths are simulated.
+
+    ``workers`` spreads the chunks over a process pool (implies chunked
+    mode). Blocks keep their own seeds and sketch counts add exactly, so the
+    bands are bit-identical for any number of workers.
+    """
+    if chunk_size is None and workers is None:
+        paths = simulate(n_paths, assumptions, months, current_month, seed,
+                         volatility, resample_history, metrics, history)
+        return {m: np.percentile(paths[m], percentiles, axis=0) for m in metrics}
+
+    chunk_size = chunk_size or CHUNK_SIZE
+    kwargs = dict(assumptions=assumptions, months=months, current_month=current_month,
+                  volatility=volatility, resample_history=resample_history,
+                  metrics=metrics, chunk_size=chunk_size, history=history)
+    blocks = block_seeds(n_paths, seed)
+    if workers is None or workers <= 1:
+        sketches = sketch_blocks(blocks, **kwargs)
+    else:
+        sketches = {m: PercentileSketch(months) for m in metrics}
+        sketches[metrics[0]]._check_room(n_paths)
+        tasks = _split(blocks, workers * TASKS_PER_WORKER, max(1, chunk_size // BLOCK_SIZE))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for counts in pool.map(_sketch_task, tasks, [kwargs] * len(tasks)):
+                for m in metrics:
+                    sketches[m].counts += counts[m]
+    return {m: sketches[m].percentiles(percentiles) for m in metrics}
@@ -0,0 +1,267 @@
+"""Deployment ZIP of the dashboard, rebuilt only when its inputs change.
+
+    python package.py [--data-dir companies/acme] [-o acme.zip] [--workers 4]
+
+``build()`` packages the app's code from the repository root and the data
+files from ``data_dir`` (a company directory, see ``companies.py``), so the
+same code can be shipped with each company's data. Archives are
+reproducible: members are sorted, timestamps are fixed at 1980-01-01 and
+permissions at 0644, so identical inputs give byte-identical ZIPs. A hash
+of the inputs (each member's name, size and CRC-32, which the ZIP needs
+anyway) is stored as the archive comment; a build whose inputs hash to the
+existing archive's comment is skipped. Checking costs one CRC pass over
+the inputs, and the CRCs are reused if the build goes ahead; with no
+archive to compare against (or ``force``) the CRCs are taken while
+deflating, so a cold build reads each file once, like a plain
+``zipfile`` loop. An edit that keeps a file's size and CRC-32 (about 1 in
+4 billion) goes unnoticed; ``--force`` rebuilds regardless.
+
+Formats that are already compressed are stored as-is, as is anything
+deflate does not shrink. Files are deflated in parallel on a thread pool
+(zlib releases the GIL) and written in order, and identical contents are
+compressed once per process, so per-company builds reuse the code's
+compressed bytes.
+"""
+
+import argparse
+import hashlib
+import os
+import struct
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+from columnar import columnar_path
+from datasets import DATASETS
+
+ZIP_FILE = 'payflow-streamlit-complete.zip'
+
+# Bumped when the archive layout changes, so old archives are rebuilt
+PACKAGE_VERSION = 2
+
+CODE_FILES = [
+    'app.py',
+    'captable.py',
+    'cohorts.py',
+    'columnar.py',
+    'companies.py',
+    'datasets.py',
+    'downsample.py',
+    'events.py',
+    'figures.py',
+    'goalseek.py',
+    'ingest.py',
+    'lazy.py',
+    'montecarlo.py',
+    'perf.py',
+    'projection.py',
+    'roi.py',
+    'scenario.py',
+    'sensitivity.py',
+    'script_6.py',
+    'snapshot.py',
+    'static.py',
+    'waterfall.py',
+    'requirements.txt',
+    'README.md',
+    'config.toml',
+]
+DATA_FILES = [csv_path for csv_path, _ in DATASETS.values()] + [
+    'company_info.json',
+    'market_data.json',
+    'snapshot.json',
+]
+# Source path -> path inside the archive
+ARCNAMES = {'config.toml': '.streamlit/config.toml'}
+
+STORED_SUFFIXES = {'.zip', '.gz', '.tgz', '.bz2', '.xz', '.zst', '.7z', '.parquet',
+                   '.png', '.jpg', '.jpeg', '.gif', '.webp', '.woff', '.woff2', '.pdf'}
+
+STORED, DEFLATED = 0, 8
+# 1980-01-01 00:00:00 in MS-DOS time and date fields
+DOS_TIME, DOS_DATE = 0, (1 << 5) | 1
+EXTERNAL_ATTR = 0o100644 << 16
+MADE_BY = (3 << 8) | 20  # Unix, spec 2.0
+ZIP32_LIMIT = 0xFFFFFFFF
+
+# Compressed members by (CRC-32, size), shared across builds in this
+# process; only small files (the code) are kept
+_compressed = {}
+CACHE_MAX_BYTES = 1 << 20
+
+# Bytes read at a time
+CHUNK = 1 << 20
+
+
+def package_files(data_dir='.'):
+    """``[(source path, archive name)]`` in archive order."""
+    files = [(path, ARCNAMES.get(path, path)) for path in CODE_FILES]
+    for path in DATA_FILES:
+        source = os.path.join(data_dir, path)
+        files.append((source, path))
+        store = columnar_path(source)
+        if path.endswith('.csv') and os.path.isdir(store):
+            arcdir = columnar_path(path)
+            files += [(os.path.join(store, f), f'{arcdir}/{f}') for f in sorted(os.listdir(store))]
+    return sorted(files, key=lambda file: file[1])
+
+
+def file_digest(source, chunk=CHUNK):
+    """``(crc, size)`` of a file."""
+    crc, size = 0, 0
+    with open(source, 'rb') as f:
+        while data := f.read(chunk):
+            crc = zlib.crc32(data, crc)
+            size += len(data)
+    return crc, size
+
+
+def inputs_hash(files, digests):
+    """Hash of ``[(source, arcname)]``'s ``(crc, size)`` digests plus the archive settings."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f'package-v{PACKAGE_VERSION}'.encode())
+    for (_, arcname), (crc, size) in zip(files, digests):
+        h.update(arcname.encode() + b'\0' + struct.pack('<IQ', crc, size))
+    return h.hexdigest()
+
+
+def compress(source, arcname, digest=None, level=zlib.Z_DEFAULT_COMPRESSION, chunk=CHUNK):
+    """``(method, crc, size, body)`` of one member, streamed in ``chunk`` reads.
+
+    The CRC is taken while reading unless ``digest`` already gives it.
+    """
+    store = os.path.splitext(arcname)[1].lower() in STORED_SUFFIXES
+    if digest is None and os.path.getsize(source) <= CACHE_MAX_BYTES:
+        digest = file_digest(source, chunk)
+    key = (digest, level, store)
+    member = _compressed.get(key)
+    if member is not None:
+        return member
+    crc, size, parts = 0, 0, []
+    deflate = None if store else zlib.compressobj(level, zlib.DEFLATED, -15)
+    with open(source, 'rb') as f:
+        while data := f.read(chunk):
+            if digest is None:
+                crc = zlib.crc32(data, crc)
+            size += len(data)
+            parts.append(deflate.compress(data) if deflate else data)
+    if digest is not None:
+        crc = digest[0]
+    if deflate:
+        parts.append(deflate.flush())
+    body = b''.join(parts)
+    method = STORED if store else DEFLATED
+    if not store and len(body) >= size:
+        with open(source, 'rb') as f:
+            method, body = STORED, f.read()
+    member = (method, crc, size, body)
+    if size <= CACHE_MAX_BYTES:
+        _compressed[(crc, size), level, store] = member
+    return member
+
+
+def archive_hash(path):
+    """Inputs hash recorded in an archive built by ``build``, or None."""
+    try:
+        with open(path, 'rb') as f:
+            size = f.seek(0, os.SEEK_END)
+            f.seek(max(size - 22 - 0xFFFF, 0))
+            tail = f.read()
+    except OSError:
+        return None
+    end = tail.rfind(b'PK\x05\x06')
+    if end < 0:
+        return None
+    comment = tail[end + 22:end + 22 + struct.unpack('<H', tail[end + 20:end + 22])[0]]
+    return comment.decode('ascii', 'replace')
+
+
+def write_zip(path, members, comment=b''):
+    """Write ``(arcname, (method, crc, size, body))`` pairs as a ZIP archive.
+
+    ``comment`` may be a function, called once the members are written.
+    """
+    central = []
+    tmp = f'{path}.tmp'
+    with open(tmp, 'wb') as f:
+        for arcname, (method, crc, size, body) in members:
+            if max(size, len(body), f.tell()) >= ZIP32_LIMIT:
+                raise ValueError(f"{arcname} is past the 4 GiB ZIP32 limit; ZIP64 is not supported")
+            name = arcname.encode()
+            flags = 0 if name.isascii() else 0x800
+            version = 20 if method == DEFLATED else 10
+            fields = struct.pack('<HHHHHIII', version, flags, method, DOS_TIME, DOS_DATE,
+                                 crc, len(body), size)
+            central.append(struct.pack('<4sH', b'PK\x01\x02', MADE_BY) + fields
+                           + struct.pack('<HHHHHII', len(name), 0, 0, 0, 0, EXTERNAL_ATTR, f.tell())
+                           + name)
+            f.write(b'PK\x03\x04' + fields + struct.pack('<HH', len(name), 0) + name)
+            f.write(body)
+        if len(central) >= 0xFFFF:
+            raise ValueError(f"{len(central)} members need ZIP64, which is not supported")
+        if callable(comment):
+            comment = comment()
+        start = f.tell()
+        f.write(b''.join(central))
+        f.write(struct.pack('<4sHHHHIIH', b'PK\x05\x06', 0, 0, len(central), len(central),
+                            f.tell() - start, start, len(comment)) + comment)
+    os.replace(tmp, path)
+
+
+def build(path=ZIP_FILE, data_dir='.', level=zlib.Z_DEFAULT_COMPRESSION, workers=None, force=False):
+    """Build the deployment ZIP unless an archive of the same inputs exists.
+
+    Returns ``(archive names, missing source paths, built)``.
+    """
+    files = package_files(data_dir)
+    missing = [source for source, _ in files if not os.path.isfile(source)]
+    files = [file for file in files if file[0] not in missing]
+    names = [arcname for _, arcname in files]
+    existing = None if force else archive_hash(path)
+    if existing is not None:
+        digests = [file_digest(source) for source, _ in files]
+        if inputs_hash(files, digests) == existing:
+            return names, missing, False
+    else:
+        # Nothing to compare against: the CRCs come out of compressing
+        digests = [None] * len(files)
+
+    written = []
+
+    def member(file, digest):
+        source, arcname = file
+        return arcname, compress(source, arcname, digest, level)
+
+    def recorded(members):
+        for arcname, compressed in members:
+            written.append(compressed[1:3])
+            yield arcname, compressed
+
+    def comment():
+        return inputs_hash(files, written).encode()
+
+    if workers is None or workers <= 1:
+        write_zip(path, recorded(map(member, files, digests)), comment)
+    else:
+        # Members are written in order as they finish
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            write_zip(path, recorded(pool.map(member, files, digests)), comment)
+    return names, missing, True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('-o', '--output', default=ZIP_FILE)
+    parser.add_argument('--data-dir', default='.')
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--force', action='store_true', help='rebuild even if the inputs are unchanged')
+    args = parser.parse_args(argv)
+
+    names, missing, built = build(args.output, args.data_dir, workers=args.workers, force=args.force)
+    for source in missing:
+        print(f"  ✗ Missing: {source}")
+    state = 'built' if built else 'unchanged, skipped'
+    print(f"{args.output}: {len(names)} files ({state})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+"""Per-section render timing for the dashboard.
+
+A ``Stopwatch`` splits one rerun of app.py into phases: each
+``lap(section, phase)`` closes the running phase and opens the next, so
+top-level page code is instrumented without re-indenting it. Phases are
+``prep`` (data), ``figure`` (building or looking up a chart) and ``emit``
+(``st.*`` calls). Durations go to process-wide histograms keyed by section
+and phase, shared by every session; ``export()`` renders them as
+Prometheus text or OpenMetrics.
+
+Timing is off unless ``DASHBOARD_PERF=1`` is set or the session opened the
+page with ``?debug=perf``. ``stopwatch()`` then returns a shared no-op
+whose methods do nothing, so each lap costs one method call.
+"""
+
+import bisect
+import os
+import threading
+import time
+
+# Upper bounds in seconds; +Inf is implied
+BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+METRIC = 'dashboard_section_seconds'
+
+ENABLED = os.environ.get('DASHBOARD_PERF') == '1'
+
+_lock = threading.Lock()
+_histograms = {}
+
+
+class Histogram:
+    """Cumulative-bucket histogram of durations in seconds."""
+
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, seconds):
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.sum += seconds
+        self.count += 1
+
+    def quantile(self, q):
+        """Upper bound of the bucket holding the ``q`` quantile."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float('inf')
+
+
+class Stopwatch:
+    """Times consecutive phases of one page run.
+
+    Laps that return to a phase add to it, and ``stop()`` records one
+    observation per ``(section, phase)`` for the run.
+    """
+
+    def __init__(self):
+        self.totals = {}
+        self.key = None
+        self.start = 0.0
+
+    def lap(self, section, phase):
+        """Close the running phase, if any, and start ``(section, phase)``."""
+        now = time.perf_counter()
+        if self.key is not None:
+            self.totals[self.key] = self.totals.get(self.key, 0.0) + now - self.start
+        self.key, self.start = (section, phase), now
+
+    def stop(self):
+        self.lap(None, None)
+        self.key = None
+        for (section, phase), seconds in self.totals.items():
+            observe(section, phase, seconds)
+        self.totals = {}
+
+
+class _NullStopwatch:
+    def lap(self, section, phase):
+        pass
+
+    def stop(self):
+        pass
+
+
+_NULL = _NullStopwatch()
+
+
+def observe(section, phase, seconds):
+    with _lock:
+        histogram = _histograms.get((section, phase))
+        if histogram is None:
+            histogram = _histograms[(section, phase)] = Histogram()
+        histogram.observe(seconds)
+
+
+def stopwatch(enabled=False):
+    """A ``Stopwatch``, or a no-op one unless timing is enabled."""
+    return Stopwatch() if enabled or ENABLED else _NULL
+
+
+def snapshot():
+    """Copy of every histogram, keyed by ``(section, phase)``."""
+    with _lock:
+        copies = {}
+        for key, histogram in _histograms.items():
+            copy = Histogram(histogram.buckets)
+            copy.counts, copy.sum, copy.count = list(histogram.counts), histogram.sum, histogram.count
+            copies[key] = copy
+        return copies
+
+
+def reset():
+    with _lock:
+        _histograms.clear()
+
+
+def _le(bound):
+    return '+Inf' if bound == float('inf') else repr(bound)
+
+
+def export(openmetrics=False):
+    """Histograms in the Prometheus text format, or OpenMetrics."""
+    lines = [f'# HELP {METRIC} Time spent rendering each dashboard section, by phase.',
+             f'# TYPE {METRIC} histogram']
+    if openmetrics:
+        lines.insert(1, f'# UNIT {METRIC} seconds')
+    for (section, phase), histogram in sorted(snapshot().items()):
+        labels = f'section="{section}",phase="{phase}"'
+        cumulative = 0
+        for bound, count in zip(histogram.buckets + (float('inf'),), histogram.counts):
+            cumulative += count
+            lines.append(f'{METRIC}_bucket{{{labels},le="{_le(bound)}"}} {cumulative}')
+        lines.append(f'{METRIC}_sum{{{labels}}} {histogram.sum!r}')
+        lines.append(f'{METRIC}_count{{{labels}}} {histogram.count}')
+    if openmetrics:
+        lines.append('# EOF')
+    return '\n'.join(lines) + '\n'
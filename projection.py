@@ -0,0 +1,421 @@
+"""Vectorized projection engine for the PayFlow Canada financial model.
+
+Builds every monthly series that script_6.py used to build with per-month
+Python loops (revenue, costs, profit, customers, unit economics, team) as
+NumPy arrays. All functions broadcast over leading axes, so the same code
+evaluates one path, a batch of Monte Carlo paths or a grid of assumptions.
+"""
+
+import math
+
+from lazy import lazy_import
+
+np = lazy_import('numpy')
+pd = lazy_import('pandas')
+
+MONTHS = 120
+CURRENT_MONTH = 18
+SEED = 42
+START_DATE = '2024-01-01'
+
+# Month index where each growth regime starts: launch, seed, Series A,
+# Series B, Series C and the mature (decaying) phase
+LAUNCH_END = 6
+SEED_END = 18
+SERIES_A_END = 36
+SERIES_B_END = 54
+MATURE_START = 72
+
+COST_COLUMNS = ['COGS', 'Sales_Marketing', 'RD', 'Admin']
+COST_KEYS = ['cogs', 'sales_marketing', 'rd', 'admin']
+
+# Default model assumptions (the constants hardcoded in script_6.py)
+ASSUMPTIONS = {
+    # Revenue
+    'base_revenue': 8000,
+    'revenue_growth_launch_low': 0.12,
+    'revenue_growth_launch_high': 0.18,
+    'revenue_growth_seed_low': 0.28,
+    'revenue_growth_seed_high': 0.35,
+    'revenue_growth_series_a': 0.22,
+    'revenue_growth_series_b': 0.16,
+    'revenue_growth_series_c': 0.12,
+    'revenue_growth_mature': 0.12,
+    'revenue_growth_decay': 0.001,
+    'revenue_growth_floor': 0.05,
+    # Cost ratios: historical ranges, then a glide from ratio to ratio - glide
+    'cogs_low': 0.28,
+    'cogs_high': 0.32,
+    'sales_marketing_low': 0.38,
+    'sales_marketing_high': 0.45,
+    'rd_low': 0.22,
+    'rd_high': 0.28,
+    'admin_low': 0.12,
+    'admin_high': 0.18,
+    'cogs_ratio': 0.30,
+    'cogs_glide': 0.05,
+    'sales_marketing_ratio': 0.40,
+    'sales_marketing_glide': 0.10,
+    'rd_ratio': 0.25,
+    'rd_glide': 0.05,
+    'admin_ratio': 0.15,
+    'admin_glide': 0.05,
+    'cost_glide_months': 60,
+    # Customers
+    'base_customers': 35,
+    'customer_growth_low': 0.18,
+    'customer_growth_high': 0.25,
+    'customer_growth_series_a': 0.20,
+    'customer_growth_series_b': 0.17,
+    'customer_growth_series_c': 0.14,
+    'customer_growth_mature': 0.14,
+    'customer_growth_decay': 0.0008,
+    'customer_growth_floor': 0.08,
+    # Unit economics
+    'volume_multiple_historical': 15,
+    'volume_multiple_projected': 18,
+    'cac_start': 220,
+    'cac_decline': 1.5,
+    'cac_floor': 45,
+    'ltv_start': 450,
+    'ltv_step': 35,
+    'ltv_cap': 4500,
+    'churn_start': 9.0,
+    'churn_decline': 0.08,
+    'churn_floor': 1.5,
+    # Team
+    'engineering_base': 3,
+    'engineering_growth': 0.06,
+    'sales_base': 2,
+    'sales_growth': 0.08,
+    'operations_base': 1,
+    'operations_growth': 0.05,
+    'leadership_base': 2,
+    'leadership_cap': 8,
+}
+
+# Above 2**52 every float64 is an integer, so flooring is a no-op
+_EXACT_INT_LIMIT = 2.0 ** 52
+
+# Months advanced between checks for the 2**52 switch-over
+_FLOOR_BLOCK = 64
+
+
+def resolve_assumptions(assumptions=None):
+    """Return the default assumptions updated with ``assumptions``."""
+    resolved = dict(ASSUMPTIONS)
+    if assumptions:
+        unknown = set(assumptions) - set(ASSUMPTIONS)
+        if unknown:
+            raise KeyError(f"Unknown assumptions: {sorted(unknown)}")
+        resolved.update(assumptions)
+    return resolved
+
+
+def _param(a, key):
+    # Trailing month axis so array-valued assumptions broadcast over batches
+    return np.asarray(a[key])[..., np.newaxis]
+
+
+def _batch_shape(a, u):
+    # Batch axes shared by the draws and any array-valued assumptions
+    arrays = (np.shape(v) for v in a.values() if not isinstance(v, (int, float)))
+    return np.broadcast_shapes(u.shape[:-1], *arrays)
+
+
+def draw_count(months=MONTHS, current_month=CURRENT_MONTH):
+    """Number of uniform draws per path, keyed like ``draw_uniforms``."""
+    revenue = max(0, min(months, SEED_END) - 1)
+    history = min(months, current_month)
+    return {
+        'revenue': revenue,
+        'costs': (history, len(COST_KEYS)),
+        'customers': max(0, history - 1),
+    }
+
+
+def draw_uniforms(rng, months=MONTHS, current_month=CURRENT_MONTH, size=()):
+    """Draw the U[0, 1) samples behind the historical months.
+
+    Draws are taken in the order script_6.py consumed them from
+    ``np.random``, so ``np.random.RandomState(42)`` reproduces the
+    published CSVs exactly. ``size`` prepends batch axes.
+    """
+    size = (size,) if np.isscalar(size) else tuple(size)
+    counts = draw_count(months, current_month)
+    return {
+        'revenue': rng.random(size + (counts['revenue'],)),
+        'costs': rng.random(size + counts['costs']),
+        'customers': rng.random(size + (counts['customers'],)),
+    }
+
+
+def regime_rates(a, prefix, months=MONTHS, shape=()):
+    """Deterministic monthly growth rates; only months >= SEED_END are used.
+
+    ``prefix`` is ``'revenue_growth'`` or ``'customer_growth'``.
+    """
+    i = np.arange(months)
+    mature = np.maximum(
+        _param(a, f'{prefix}_floor'),
+        _param(a, f'{prefix}_mature') - (i - MATURE_START) * _param(a, f'{prefix}_decay'),
+    )
+    rates = np.where(i < MATURE_START, _param(a, f'{prefix}_series_c'), mature)
+    rates = np.where(i < SERIES_B_END, _param(a, f'{prefix}_series_b'), rates)
+    rates = np.where(i < SERIES_A_END, _param(a, f'{prefix}_series_a'), rates)
+    return np.broadcast_to(rates, shape + (months,))
+
+
+def revenue_factors(a, draws, months=MONTHS, shocks=None):
+    """Month-over-month revenue multipliers; element 0 is unused."""
+    u = draws['revenue']
+    batch = _batch_shape(a, u)
+    growth = np.array(regime_rates(a, 'revenue_growth', months, batch))
+    n_launch = max(0, min(months, LAUNCH_END) - 1)
+    launch = u[..., :n_launch]
+    seed = u[..., n_launch:]
+    low, high = _param(a, 'revenue_growth_launch_low'), _param(a, 'revenue_growth_launch_high')
+    growth[..., 1:1 + n_launch] = low + (high - low) * launch
+    low, high = _param(a, 'revenue_growth_seed_low'), _param(a, 'revenue_growth_seed_high')
+    growth[..., LAUNCH_END:LAUNCH_END + seed.shape[-1]] = low + (high - low) * seed
+    if shocks is not None:
+        growth = growth + shocks
+    return 1 + growth
+
+
+def compound(start, factors):
+    """``out[0] = start``, ``out[i] = out[i-1] * factors[i]`` along the last axis."""
+    start = np.asarray(start)
+    seq = np.array(np.broadcast_to(factors, np.broadcast_shapes(start.shape + (1,), factors.shape)),
+                   dtype=np.float64)
+    seq[..., 0] = start
+    return np.cumprod(seq, axis=-1)
+
+
+def floored_compound(start, factors):
+    """``out[i] = floor(out[i-1] * factors[i])`` along the last axis.
+
+    The truncation makes this a true recurrence, but only while counts are
+    below 2**52: past that every float64 is an integer, so the tail is a
+    plain cumulative product as long as no factor shrinks the count.
+    """
+    start = np.asarray(start, dtype=np.float64)
+    shape = np.broadcast_shapes(start.shape + (1,), factors.shape)
+    factors = np.broadcast_to(factors, shape)
+    out = np.empty(shape)
+    out[..., 0] = start
+    months = shape[-1]
+    i = 1
+    while i < months:
+        if np.all(out[..., i - 1] >= _EXACT_INT_LIMIT) and np.all(factors[..., i:] >= 1):
+            out[..., i - 1:] = compound(out[..., i - 1], factors[..., i - 1:])
+            break
+        stop = min(months, i + _FLOOR_BLOCK)
+        if out.ndim == 1:
+            # Plain floats avoid NumPy call overhead on a single path
+            c = float(out[i - 1])
+            block = []
+            for f in factors[i:stop].tolist():
+                c = c * f
+                if c < _EXACT_INT_LIMIT:
+                    c = float(math.floor(c))
+                block.append(c)
+            out[i:stop] = block
+        else:
+            for j in range(i, stop):
+                out[..., j] = np.floor(out[..., j - 1] * factors[..., j])
+        i = stop
+    return out
+
+
+def glide_ratios(a, months=MONTHS, current_month=CURRENT_MONTH):
+    """Projected cost-to-revenue ratios, shape ``(..., 4, months)``.
+
+    Each ratio glides linearly from ``<key>_ratio`` to ``<key>_ratio -
+    <key>_glide`` over ``cost_glide_months`` after the current month.
+    Entries before the current month are meaningless.
+    """
+    i = np.arange(months)
+    scale = np.minimum(1.0, (i - current_month) / _param(a, 'cost_glide_months'))
+    ratios = [_param(a, f'{key}_ratio') - _param(a, f'{key}_glide') * scale for key in COST_KEYS]
+    return np.stack(np.broadcast_arrays(*ratios), axis=-2)
+
+
+def extend(history, factors, floored=False):
+    """Continue ``history`` (last axis) by compounding ``factors``.
+
+    ``factors`` spans every month; the ones covering history are ignored.
+    ``floored`` truncates each month like the customer series.
+    """
+    history = np.asarray(history, dtype=np.float64)
+    h = history.shape[-1]
+    grow = floored_compound if floored else compound
+    tail = grow(history[..., -1], factors[..., h - 1:])
+    batch = tail.shape[:-1]
+    return np.concatenate([np.broadcast_to(history[..., :-1], batch + (h - 1,)), tail], axis=-1)
+
+
+def cost_ratios(a, draws, months=MONTHS, current_month=CURRENT_MONTH):
+    """Cost-to-revenue ratios, shape ``(..., 4, months)`` in COST_KEYS order."""
+    u = np.moveaxis(draws['costs'], -1, -2)
+    history = u.shape[-1]
+    low = np.stack(np.broadcast_arrays(*(_param(a, f'{key}_low') for key in COST_KEYS)), axis=-2)
+    high = np.stack(np.broadcast_arrays(*(_param(a, f'{key}_high') for key in COST_KEYS)), axis=-2)
+    historical = low + (high - low) * u
+    projected = glide_ratios(a, months, current_month)
+    batch = np.broadcast_shapes(projected.shape[:-2], historical.shape[:-2])
+    ratios = np.array(np.broadcast_to(projected, batch + projected.shape[-2:]))
+    ratios[..., :history] = historical
+    return ratios
+
+
+def customer_factors(a, draws, months=MONTHS, current_month=CURRENT_MONTH, shocks=None):
+    """Month-over-month customer multipliers; element 0 is unused."""
+    u = draws['customers']
+    batch = _batch_shape(a, u)
+    growth = np.array(regime_rates(a, 'customer_growth', months, batch))
+    low, high = _param(a, 'customer_growth_low'), _param(a, 'customer_growth_high')
+    growth[..., 1:1 + u.shape[-1]] = low + (high - low) * u
+    if shocks is not None:
+        growth = growth + shocks
+    return 1 + growth
+
+
+def project(assumptions=None, months=MONTHS, current_month=CURRENT_MONTH,
+            seed=SEED, draws=None, shocks=None, history=None):
+    """Compute every projected series in one vectorized pass.
+
+    Returns a dict of arrays whose last axis is the month. ``draws`` (see
+    ``draw_uniforms``) overrides the seeded historical randomness, and
+    ``shocks`` adds a per-month perturbation to projected growth rates.
+    Array-valued assumptions broadcast against the batch axes of ``draws``.
+
+    ``history`` replaces the modelled historical months with actuals: a dict
+    with ``'revenue'`` and ``'customers'`` of length ``current_month`` and
+    optionally ``'costs'`` of shape ``(4, current_month)`` in COST_KEYS order.
+    Projections then compound from the last actual month.
+    """
+    a = resolve_assumptions(assumptions)
+    if draws is None:
+        draws = draw_uniforms(np.random.RandomState(seed), months, current_month)
+    i = np.arange(months)
+    historical = i < current_month
+
+    factors = revenue_factors(a, draws, months, shocks)
+    if history is None:
+        revenue = compound(a['base_revenue'], factors)
+    else:
+        revenue = extend(history['revenue'], factors)
+    costs = revenue[..., np.newaxis, :] * cost_ratios(a, draws, months, current_month)
+    if history is not None and 'costs' in history:
+        costs[..., :current_month] = history['costs']
+    cogs, sales_marketing, rd, admin = (costs[..., k, :] for k in range(len(COST_KEYS)))
+    total_costs = cogs + sales_marketing + rd + admin
+    profit = revenue - total_costs
+
+    factors = customer_factors(a, draws, months, current_month, shocks)
+    if history is None:
+        customers = floored_compound(a['base_customers'], factors)
+    else:
+        customers = extend(history['customers'], factors, floored=True)
+
+    volume_multiple = np.where(historical, _param(a, 'volume_multiple_historical'),
+                               _param(a, 'volume_multiple_projected'))
+    cac = np.maximum(_param(a, 'cac_floor'), _param(a, 'cac_start') - i * _param(a, 'cac_decline'))
+    ltv = np.minimum(_param(a, 'ltv_cap'), _param(a, 'ltv_start') + i * _param(a, 'ltv_step'))
+    churn = np.maximum(_param(a, 'churn_floor'),
+                       _param(a, 'churn_start') - i * _param(a, 'churn_decline'))
+
+    team = {}
+    for key in ['engineering', 'sales', 'operations']:
+        team[key] = np.floor(_param(a, f'{key}_base')
+                             * np.power(1 + _param(a, f'{key}_growth'), i))
+    team['leadership'] = np.minimum(_param(a, 'leadership_cap'),
+                                    _param(a, 'leadership_base') + i // 12)
+
+    return {
+        'revenue': revenue,
+        'cogs': cogs,
+        'sales_marketing': sales_marketing,
+        'rd': rd,
+        'admin': admin,
+        'total_costs': total_costs,
+        'profit': profit,
+        'cumulative_revenue': np.cumsum(revenue, axis=-1),
+        'cumulative_costs': np.cumsum(total_costs, axis=-1),
+        'cumulative_profit': np.cumsum(profit, axis=-1),
+        'customers': customers,
+        'transaction_volume': revenue * volume_multiple,
+        'cac': cac,
+        'ltv': ltv,
+        'ltv_cac_ratio': ltv / cac,
+        'churn_rate': churn,
+        'engineering': team['engineering'],
+        'sales': team['sales'],
+        'operations': team['operations'],
+        'leadership': team['leadership'],
+        'is_historical': historical,
+    }
+
+
+def to_frames(projection, start_date=START_DATE, first_scenario=0):
+    """Build the financials, key_metrics and team_data DataFrames of one path.
+
+    A ``(paths, months)`` batch gives long-format frames, one row per path
+    and month, with a leading ``Scenario`` column numbered from
+    ``first_scenario``.
+    """
+    p = projection
+    shape = np.shape(p['revenue'])
+    months = shape[-1]
+    dates = pd.date_range(start=start_date, periods=months, freq='ME')
+    batch = len(shape) > 1
+    if batch:
+        dates = np.tile(dates.to_numpy(), shape[0])
+
+    def col(values):
+        return np.broadcast_to(values, shape).ravel()
+
+    historical = col(p['is_historical'])
+    scenario = {'Scenario': np.repeat(np.arange(first_scenario, first_scenario + shape[0]), months)} if batch else {}
+
+    financials = pd.DataFrame({
+        **scenario,
+        'Date': dates,
+        'Revenue': col(p['revenue']),
+        'COGS': col(p['cogs']),
+        'Sales_Marketing': col(p['sales_marketing']),
+        'RD': col(p['rd']),
+        'Admin': col(p['admin']),
+        'Total_Costs': col(p['total_costs']),
+        'Profit': col(p['profit']),
+        'Is_Historical': historical,
+        'Cumulative_Revenue': col(p['cumulative_revenue']),
+        'Cumulative_Costs': col(p['cumulative_costs']),
+        'Cumulative_Profit': col(p['cumulative_profit']),
+    })
+
+    key_metrics = pd.DataFrame({
+        **scenario,
+        'Date': dates,
+        'Customers': col(p['customers']).astype(np.int64),
+        'Transaction_Volume': col(p['transaction_volume']),
+        'CAC': col(p['cac']),
+        'LTV': col(p['ltv']),
+        'Is_Historical': historical,
+        'LTV_CAC_Ratio': col(p['ltv_cac_ratio']),
+        'Churn_Rate': col(p['churn_rate']),
+    })
+
+    team_data = pd.DataFrame({
+        **scenario,
+        'Date': dates,
+        'Engineering': col(p['engineering']).astype(np.int64),
+        'Sales': col(p['sales']).astype(np.int64),
+        'Operations': col(p['operations']).astype(np.int64),
+        'Leadership': col(p['leadership']),
+        'Is_Historical': historical,
+    })
+    team_data['Total_Team'] = team_data[['Engineering', 'Sales', 'Operations', 'Leadership']].sum(axis=1)
+
+    return financials, key_metrics, team_data
@@ -0,0 +1,112 @@
+"""Vectorized ROI builder for the funding rounds.
+
+Replaces the ``iterrows()`` x horizon loop in script_6.py with one
+broadcasted computation over a (scenario x round x horizon) cube. Revenue
+may be a single path of shape ``(months,)`` or a Monte Carlo matrix of
+shape ``(scenarios, months)``; the cube keeps the same leading axes.
+"""
+
+from lazy import lazy_import
+from projection import CURRENT_MONTH
+
+np = lazy_import('numpy')
+pd = lazy_import('pandas')
+
+# Holding periods, in years
+HORIZONS = (1, 3, 5, 7, 10)
+
+# Valuation multiple step function on ARR: below 10M -> 8x,
+# below 50M -> 10x, otherwise 12x
+ARR_THRESHOLDS = (10_000_000, 50_000_000)
+ARR_MULTIPLES = (8, 10, 12)
+
+
+def valuation_multiple(arr, thresholds=ARR_THRESHOLDS, multiples=ARR_MULTIPLES):
+    """ARR multiple for each element of ``arr``.
+
+    ``thresholds`` (ascending) and ``multiples`` (one more entry) hold the
+    steps on their last axis; any leading axes broadcast against ``arr``.
+    """
+    arr = np.asarray(arr)
+    step = (arr[..., np.newaxis] >= np.asarray(thresholds)).sum(axis=-1)
+    multiples = np.asarray(multiples)
+    multiples = np.broadcast_to(multiples, step.shape + multiples.shape[-1:])
+    return np.take_along_axis(multiples, step[..., np.newaxis], axis=-1)[..., 0]
+
+
+def end_months(start_months, horizons=HORIZONS, months=120):
+    """Month index at which each round is valued, shape ``(rounds, horizons)``."""
+    offsets = np.rint(np.asarray(horizons, dtype=float) * 12).astype(np.int64)
+    return np.minimum(np.asarray(start_months)[:, np.newaxis] + offsets, months - 1)
+
+
+def roi_cube(revenue, rounds, horizons=HORIZONS, thresholds=ARR_THRESHOLDS,
+             multiples=ARR_MULTIPLES, equity=None):
+    """Return the ROI cube as a dict of ``(..., rounds, horizons)`` arrays.
+
+    ``rounds`` is the funding-round table (a DataFrame or a dict of
+    columns with ``Amount``, ``Equity`` and ``Month``). ``equity``
+    overrides the table's ``Equity`` percentages and may broadcast against
+    the cube, e.g. a diluted ``(..., rounds, horizons)`` array.
+    """
+    revenue = np.asarray(revenue)
+    investment = np.asarray(rounds['Amount'])[:, np.newaxis]
+    if equity is None:
+        equity = np.asarray(rounds['Equity'])[:, np.newaxis]
+    end = end_months(rounds['Month'], horizons, revenue.shape[-1])
+
+    arr = revenue[..., end] * 12
+    multiple = valuation_multiple(arr, thresholds, multiples)
+    company_value = arr * multiple
+    equity_value = company_value * (equity / 100)
+    absolute_return = equity_value - investment
+    return {
+        'end_month': end,
+        'arr': arr,
+        'company_valuation': company_value,
+        'equity_pct': np.broadcast_to(equity, arr.shape),
+        'equity_value': equity_value,
+        'absolute_return': absolute_return,
+        'roi_percentage': (absolute_return / investment) * 100,
+        'multiple': equity_value / investment,
+    }
+
+
+def roi_frame(cube, rounds, horizons=HORIZONS, current_month=CURRENT_MONTH, first_scenario=0):
+    """Flatten a single-path cube into the roi_comparison table.
+
+    A cube of ``(paths, rounds, horizons)`` arrays gives one table per path,
+    stacked, with a leading ``Scenario`` column numbered from
+    ``first_scenario``.
+    """
+    names = np.asarray(rounds['Round'])
+    investment = np.asarray(rounds['Amount'])
+    start = np.asarray(rounds['Month'])
+    n_rounds, n_horizons = cube['end_month'].shape
+    shape = np.shape(cube['arr'])
+    paths = shape[0] if len(shape) > 2 else None
+    rows = n_rounds * n_horizons
+
+    def per_path(values):
+        return values if paths is None else np.tile(values, paths)
+
+    def col(values):
+        return np.broadcast_to(values, shape).ravel()
+
+    scenario = {} if paths is None else {
+        'Scenario': np.repeat(np.arange(first_scenario, first_scenario + paths), rows)}
+    return pd.DataFrame({
+        **scenario,
+        'Round': per_path(np.repeat(names, n_horizons)),
+        'Investment': per_path(np.repeat(investment, n_horizons)),
+        'Equity_Pct': col(cube['equity_pct']),
+        'Years': per_path(np.tile(np.asarray(horizons), n_rounds)),
+        'End_Month': per_path(cube['end_month'].ravel()),
+        'ARR': col(cube['arr']),
+        'Company_Valuation': col(cube['company_valuation']),
+        'Equity_Value': col(cube['equity_value']),
+        'Absolute_Return': col(cube['absolute_return']),
+        'ROI_Percentage': col(cube['roi_percentage']),
+        'Multiple': col(cube['multiple']),
+        'Is_Historical': per_path(np.repeat(start < current_month, n_horizons)),
+    })
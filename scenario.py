@@ -0,0 +1,234 @@
+"""Incremental what-if engine behind the dashboard sidebar.
+
+A ``ScenarioGraph`` holds the loaded actuals plus a flat dict of inputs
+(the projection assumptions and each round's amount and valuation) and
+derives every table the page renders through a small dependency graph:
+
+    revenue -> costs -> total_costs -> profit -> cumulative -> financials
+    rounds -> equity (diluted by later rounds)
+    revenue, rounds, equity -> roi
+    customers, revenue -> key_metrics
+
+Nodes are memoized; changing an input drops only the nodes downstream of
+it, so e.g. a new Series B valuation recomputes the ROI rows but not
+revenue.
+"""
+
+from collections import Counter, deque
+
+from captable import diluted_equity
+from datasets import load_dataset
+from lazy import lazy_import
+from montecarlo import simulate_bands
+from projection import ASSUMPTIONS, COST_COLUMNS, COST_KEYS, extend, glide_ratios, regime_rates
+from roi import roi_cube, roi_frame
+
+np = lazy_import('numpy')
+
+# Paths behind the fan charts; small enough to redraw on a slider tweak
+FAN_PATHS = 2000
+
+REVENUE_INPUTS = ['revenue_growth_series_a', 'revenue_growth_series_b', 'revenue_growth_series_c',
+                  'revenue_growth_mature', 'revenue_growth_decay', 'revenue_growth_floor']
+CUSTOMER_INPUTS = ['customer_growth_series_a', 'customer_growth_series_b',
+                   'customer_growth_series_c', 'customer_growth_mature',
+                   'customer_growth_decay', 'customer_growth_floor']
+COST_INPUTS = ([f'{key}_ratio' for key in COST_KEYS] + [f'{key}_glide' for key in COST_KEYS]
+               + ['cost_glide_months'])
+
+# Placeholder dependency standing for every round's amount and valuation
+ROUND_TERMS = '*round_terms'
+
+
+def round_key(name, field):
+    """Input name for a round's term, e.g. ``round_key('Series B', 'valuation')``."""
+    return f"{name.lower().replace('-', '_').replace(' ', '_')}_{field}"
+
+
+def _revenue(g):
+    factors = 1 + regime_rates(g.inputs, 'revenue_growth', g.months)
+    return extend(g.actual('revenue'), factors)
+
+
+def _costs(g):
+    ratios = glide_ratios(g.inputs, g.months, g.current_month)
+    costs = g.get('revenue') * ratios
+    costs[:, :g.current_month] = g.actual('costs')
+    return costs
+
+
+def _total_costs(g):
+    cogs, sales_marketing, rd, admin = g.get('costs')
+    return cogs + sales_marketing + rd + admin
+
+
+def _profit(g):
+    return g.get('revenue') - g.get('total_costs')
+
+
+def _cumulative(g):
+    return {
+        'Cumulative_Revenue': np.cumsum(g.get('revenue')),
+        'Cumulative_Costs': np.cumsum(g.get('total_costs')),
+        'Cumulative_Profit': np.cumsum(g.get('profit')),
+    }
+
+
+def _financials(g):
+    financials = g.load('financials').copy()
+    financials['Revenue'] = g.get('revenue')
+    financials[COST_COLUMNS] = g.get('costs').T
+    financials['Total_Costs'] = g.get('total_costs')
+    financials['Profit'] = g.get('profit')
+    for column, values in g.get('cumulative').items():
+        financials[column] = values
+    return financials
+
+
+def _customers(g):
+    factors = 1 + regime_rates(g.inputs, 'customer_growth', g.months)
+    return extend(g.actual('customers'), factors, floored=True)
+
+
+def _key_metrics(g):
+    key_metrics = g.load('key_metrics').copy()
+    projected = ~key_metrics['Is_Historical'].to_numpy()
+    key_metrics['Customers'] = g.get('customers').astype(np.int64)
+    volume = key_metrics['Transaction_Volume'].to_numpy().copy()
+    volume[projected] = g.get('revenue')[projected] * g.inputs['volume_multiple_projected']
+    key_metrics['Transaction_Volume'] = volume
+    return key_metrics
+
+
+def _rounds(g):
+    rounds = g.load('funding_rounds').copy()
+    rounds['Amount'] = [g.inputs[round_key(name, 'amount')] for name in rounds['Round']]
+    rounds['Valuation'] = [g.inputs[round_key(name, 'valuation')] for name in rounds['Round']]
+    rounds['Equity'] = (rounds['Amount'] / rounds['Valuation'] * 100).round(1)
+    return rounds
+
+
+def _equity(g):
+    return diluted_equity(g.get('rounds'), months=g.months)
+
+
+def _roi(g):
+    rounds = g.get('rounds')
+    cube = roi_cube(g.get('revenue'), rounds, equity=g.get('equity'))
+    return roi_frame(cube, rounds, current_month=g.current_month)
+
+
+def _bands(g):
+    assumptions = {k: g.inputs[k] for k in REVENUE_INPUTS + CUSTOMER_INPUTS}
+    return simulate_bands(FAN_PATHS, assumptions, g.months, g.current_month,
+                          metrics=('revenue', 'customers'),
+                          history={key: g.actual(key) for key in ACTUALS})
+
+
+# actual -> (dataset, columns) holding its historical months
+ACTUALS = {
+    'revenue': ('financials', ['Revenue']),
+    'costs': ('financials', COST_COLUMNS),
+    'customers': ('key_metrics', ['Customers']),
+}
+
+# node -> (dependencies, compute); dependencies are input names or nodes
+NODES = {
+    'revenue': (REVENUE_INPUTS, _revenue),
+    'costs': (['revenue'] + COST_INPUTS, _costs),
+    'total_costs': (['costs'], _total_costs),
+    'profit': (['revenue', 'total_costs'], _profit),
+    'cumulative': (['revenue', 'total_costs', 'profit'], _cumulative),
+    'financials': (['revenue', 'costs', 'total_costs', 'profit', 'cumulative'], _financials),
+    'customers': (CUSTOMER_INPUTS, _customers),
+    'key_metrics': (['customers', 'revenue', 'volume_multiple_projected'], _key_metrics),
+    'rounds': ([ROUND_TERMS], _rounds),
+    'equity': (['rounds'], _equity),
+    'roi': (['revenue', 'rounds', 'equity'], _roi),
+    'bands': (REVENUE_INPUTS + CUSTOMER_INPUTS, _bands),
+}
+
+
+class ScenarioGraph:
+    """Memoized dependency graph of the what-if scenario.
+
+    ``loader(name, columns=None)`` returns a dataset from the registry in
+    ``datasets.py``; tables and columns are only requested when a node
+    needs them. Historical rows are kept as actuals and only the projected
+    months respond to the inputs.
+    """
+
+    def __init__(self, loader=load_dataset):
+        self._loader = loader
+        is_historical = loader('financials', ('Is_Historical',))['Is_Historical'].to_numpy()
+        self.months = len(is_historical)
+        self.current_month = int(is_historical.sum())
+        self._actuals = {}
+
+        funding_rounds = self.load('funding_rounds')
+
+        self.round_inputs = []
+        self.defaults = dict(ASSUMPTIONS)
+        for _, row in funding_rounds.iterrows():
+            for field, column in [('amount', 'Amount'), ('valuation', 'Valuation')]:
+                key = round_key(row['Round'], field)
+                self.round_inputs.append(key)
+                self.defaults[key] = row[column]
+        self.inputs = dict(self.defaults)
+
+        self._dependents = {}
+        for node, (deps, _) in NODES.items():
+            for dep in deps:
+                for name in (self.round_inputs if dep == ROUND_TERMS else [dep]):
+                    self._dependents.setdefault(name, set()).add(node)
+
+        self._cache = {}
+        self.recomputed = Counter()
+
+    def load(self, name, columns=None):
+        return self._loader(name, tuple(columns) if columns is not None else None)
+
+    def actual(self, key):
+        """Historical months of ``revenue``, ``costs`` (4 x months) or ``customers``."""
+        if key not in self._actuals:
+            dataset, columns = ACTUALS[key]
+            values = self.load(dataset, columns).to_numpy()[:self.current_month]
+            self._actuals[key] = values[:, 0] if len(columns) == 1 else values.T
+        return self._actuals[key]
+
+    def get(self, node):
+        """Return a node's value, computing it (and its inputs) if stale."""
+        if node not in self._cache:
+            self._cache[node] = NODES[node][1](self)
+            self.recomputed[node] += 1
+        return self._cache[node]
+
+    def update(self, values):
+        """Set inputs and drop every node downstream of a changed one.
+
+        Returns the set of invalidated nodes.
+        """
+        unknown = set(values) - set(self.inputs)
+        if unknown:
+            raise KeyError(f"Unknown scenario inputs: {sorted(unknown)}")
+        changed = [k for k, v in values.items() if self.inputs[k] != v]
+        self.inputs.update(values)
+
+        stale = set()
+        queue = deque(changed)
+        while queue:
+            for node in self._dependents.get(queue.popleft(), ()):
+                if node not in stale:
+                    stale.add(node)
+                    queue.append(node)
+        for node in stale:
+            self._cache.pop(node, None)
+        return stale
+
+    def reset(self):
+        """Return every input to its default."""
+        return self.update(self.defaults)
+
+    @property
+    def is_default(self):
+        return self.inputs == self.defaults
@@ -1,46 +1,24 @@
 
 # Now create the complete ZIP package with all files
-import zipfile
-import os
+from package import ZIP_FILE, build
 
-files_to_include = [
-    'app.py',
-    'requirements.txt',
-    'README.md',
-    'financials_10yr.csv',
-    'key_metrics_10yr.csv',
-    'roi_comparison_10yr.csv',
-    'funding_rounds_updated.csv',
-    'target_markets.csv',
-    'competitors.csv',
-    'roadmap.csv',
-    'team_data_10yr.csv',
-    'company_info.json',
-    'market_data.json',
-    '.streamlit/config.toml'
-]
-
-zip_filename = 'payflow-streamlit-complete.zip'
-
-with zipfile.ZipFile(zip_filename, 'w', zipfile.ZIP_DEFLATED) as zipf:
-    for file in files_to_include:
-        if os.path.exists(file):
-            zipf.write(file, file)
-            print(f"  ✓ {file}")
-        else:
-            print(f"  ✗ MISSING: {file}")
+zip_filename = ZIP_FILE
+files, missing, built = build(zip_filename)
+for file in missing:
+    print(f"  ✗ MISSING: {file}")
+print(f"  {'✓ Built' if built else '= Unchanged'}: {zip_filename}")
 
 print("\n" + "="*70)
 print("🎉 COMPLETE STREAMLIT PACKAGE READY!")
 print("="*70)
 print(f"\nPackage: {zip_filename}")
-print(f"Total files: {len([f for f in files_to_include if os.path.exists(f)])}")
+print(f"Total files: {len(files)}")
 print("\n📦 Package Contents:")
-print("   ✓ app.py - Main Streamlit dashboard")
+print("   ✓ app.py - Main Streamlit dashboard and its modules")
 print("   ✓ requirements.txt - Python dependencies")
 print("   ✓ README.md - Complete deployment guide")
-print("   ✓ 8 CSV data files (10-year projections)")
-print("   ✓ 2 JSON config files")
+print("   ✓ 8 CSV data files (10-year projections) and columnar/ copies")
+print("   ✓ 3 JSON files (company info, market data, page snapshot)")
 print("   ✓ .streamlit/config.toml - Theme settings")
 print("\n🚀 DEPLOYMENT STEPS:")
 print("   1. Download payflow-streamlit-complete.zip")
@@ -0,0 +1,188 @@
+"""Sensitivity (tornado) analysis of the projection model.
+
+Which assumption matters most? ``sensitivity`` perturbs every input of the
+model: each projection assumption, the ARR valuation steps and the valued
+round's amount and valuation; ROI is on the round's ownership diluted by
+the later rounds (``captable.py``). All perturbations are evaluated as one
+batch, ``4 * inputs + 1`` rows of a single broadcast ``project`` call: the
+base case, each input at -/+ ``swing`` and each at -/+ ``STEP`` for the
+local elasticity (the % change of an output per 1% change of the input).
+
+Without ``history`` the whole script_6.py model responds, including the
+seeded historical months; with the actuals (as the dashboard passes them)
+only the projection does, so inputs that only shape history show no swing.
+
+Results are kept in a bounded LRU keyed on the base scenario and shared by
+every session; callers must not mutate them.
+"""
+
+import threading
+from collections import OrderedDict, namedtuple
+
+from captable import diluted_equity
+from datasets import load_dataset
+from figures import fingerprint
+from lazy import lazy_import
+from projection import ASSUMPTIONS, CURRENT_MONTH, MONTHS, SEED, project, resolve_assumptions
+from roi import ARR_MULTIPLES, ARR_THRESHOLDS, end_months, valuation_multiple
+from scenario import round_key
+
+np = lazy_import('numpy')
+pd = lazy_import('pandas')
+
+# Default -/+ perturbation of every input, and the relative step of the
+# central difference behind the elasticities
+SWING = 0.10
+STEP = 1e-4
+
+SENSITIVITY_CACHE_SIZE = 16
+
+ARR_PARAMETERS = ['arr_threshold_low', 'arr_threshold_high',
+                  'arr_multiple_low', 'arr_multiple_mid', 'arr_multiple_high']
+
+# output -> label; ROI is the valued round's after ``years``, the rest at ``month``
+OUTPUTS = {
+    'roi': '{round_name} ROI after {years} years (%)',
+    'arr': 'ARR at month {month} ($)',
+    'valuation': 'Company valuation at month {month} ($)',
+    'customers': 'Customers at month {month}',
+    'cumulative_profit': 'Cumulative profit at month {month} ($)',
+}
+
+Sensitivity = namedtuple('Sensitivity', ['base', 'table'])
+
+_cache = OrderedDict()
+_lock = threading.Lock()
+
+
+def parameters(round_name='Series A'):
+    """Names of the perturbed inputs, in batch order."""
+    return (list(ASSUMPTIONS) + ARR_PARAMETERS
+            + [round_key(round_name, 'amount'), round_key(round_name, 'valuation')])
+
+
+def _round_terms(rounds, round_name):
+    # The terms of every round, and the valued one's index
+    names = list(rounds['Round'])
+    if round_name not in names:
+        raise KeyError(f"Unknown round {round_name!r}; expected one of {names}")
+    terms = {column: np.asarray(rounds[column], dtype=np.float64)
+             for column in ('Amount', 'Valuation', 'Option_Pool') if column in rounds}
+    terms['Month'] = np.asarray(rounds['Month'])
+    return terms, names.index(round_name)
+
+
+def perturbations(base, swing=SWING, step=STEP):
+    """``(4 * len(base) + 1, len(base))`` batch: the base row, then per input
+    its -swing, +swing, -step and +step rows."""
+    base = np.asarray(base, dtype=np.float64)
+    n = len(base)
+    batch = np.tile(base, (4 * n + 1, 1))
+    rows = 1 + np.arange(4 * n).reshape(n, 4)
+    scales = np.array([1 - swing, 1 + swing, 1 - step, 1 + step])
+    batch[rows, np.arange(n)[:, np.newaxis]] = base[:, np.newaxis] * scales
+    return batch
+
+
+def evaluate(batch, names, terms, r, years=5, month=60, months=MONTHS,
+             current_month=CURRENT_MONTH, seed=SEED, history=None):
+    """Every ``OUTPUTS`` entry for each row of ``batch``, as ``{output: (rows,)}``.
+
+    ``terms`` holds every round's columns; round ``r`` is valued, on its
+    ownership diluted by the later rounds. ROI is NaN on rows whose swung
+    terms sell the whole post-money.
+    """
+    inputs = dict(zip(names, batch.T))
+    projection = project({key: inputs[key] for key in ASSUMPTIONS}, months, current_month,
+                         seed, history=history)
+    thresholds = np.stack([inputs['arr_threshold_low'], inputs['arr_threshold_high']], axis=-1)
+    multiples = np.stack([inputs[key] for key in ARR_PARAMETERS[2:]], axis=-1)
+    amount = inputs[names[-2]]
+    rounds = dict(terms, Amount=np.repeat(terms['Amount'][np.newaxis], len(batch), axis=0),
+                  Valuation=np.repeat(terms['Valuation'][np.newaxis], len(batch), axis=0))
+    rounds['Amount'][:, r] = amount
+    rounds['Valuation'][:, r] = inputs[names[-1]]
+    # A swing that sells the whole post-money (stake plus pool) has no cap
+    # table: value the base terms there and report no ROI
+    pool = terms['Option_Pool'][r] / 100 if 'Option_Pool' in terms else 0.0
+    invalid = amount / inputs[names[-1]] + pool >= 1
+    rounds['Amount'][invalid, r] = terms['Amount'][r]
+    rounds['Valuation'][invalid, r] = terms['Valuation'][r]
+
+    revenue = projection['revenue']
+    arr = revenue[:, month] * 12
+    end = end_months(terms['Month'][r:r + 1], (years,), months).item()
+    exit_arr = revenue[:, end] * 12
+    equity = diluted_equity(rounds, (years,), months)[:, r, 0]
+    equity_value = exit_arr * valuation_multiple(exit_arr, thresholds, multiples) * equity / 100
+    return {
+        'roi': np.where(invalid, np.nan, (equity_value - amount) / amount * 100),
+        'arr': arr,
+        'valuation': arr * valuation_multiple(arr, thresholds, multiples),
+        'customers': projection['customers'][:, month],
+        'cumulative_profit': projection['cumulative_profit'][:, month],
+    }
+
+
+def sensitivity(assumptions=None, rounds=None, round_name='Series A', years=5, month=60,
+                swing=SWING, months=MONTHS, current_month=CURRENT_MONTH, seed=SEED,
+                history=None):
+    """``{output: Sensitivity(base, table)}`` for every input of the model.
+
+    ``rounds`` is the funding-round table (default: the dataset). Each
+    table has a row per input with ``Parameter``, ``Value``, ``Output_Low``
+    and ``Output_High`` (the output at -/+ ``swing``), ``Swing`` (their
+    difference) and ``Elasticity``, largest absolute swing first.
+    """
+    a = resolve_assumptions(assumptions)
+    rounds = load_dataset('funding_rounds') if rounds is None else rounds
+    terms, r = _round_terms(rounds, round_name)
+    key = fingerprint((a, terms, round_name, years, month, swing, months, current_month, seed,
+                       history))
+    with _lock:
+        if key in _cache:
+            _cache.move_to_end(key)
+            return _cache[key]
+
+    names = parameters(round_name)
+    base = ([a[name] for name in ASSUMPTIONS] + list(ARR_THRESHOLDS) + list(ARR_MULTIPLES)
+            + [terms['Amount'][r], terms['Valuation'][r]])
+    batch = perturbations(base, swing)
+    outputs = evaluate(batch, names, terms, r, years, month, months, current_month, seed, history)
+
+    rows = 1 + np.arange(4 * len(names)).reshape(-1, 4)
+    results = {}
+    for output, y in outputs.items():
+        y = np.asarray(y, dtype=np.float64)
+        low, high, down, up = (y[rows[:, k]] for k in range(4))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            elasticity = (up - down) / (2 * STEP * abs(y[0]))
+        table = pd.DataFrame({
+            'Parameter': names,
+            'Value': batch[0],
+            'Output_Low': low,
+            'Output_High': high,
+            'Swing': high - low,
+            'Elasticity': elasticity,
+        })
+        order = np.argsort(-np.abs(table['Swing'].to_numpy()), kind='stable')
+        results[output] = Sensitivity(y[0].item(), table.iloc[order].reset_index(drop=True))
+
+    with _lock:
+        _cache[key] = results
+        while len(_cache) > SENSITIVITY_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return results
+
+
+def scenario_sensitivity(graph, **kwargs):
+    """``sensitivity`` around a ``ScenarioGraph``'s inputs, with its actuals as history."""
+    assumptions = {key: graph.inputs[key] for key in ASSUMPTIONS}
+    history = {key: graph.actual(key) for key in ('revenue', 'costs', 'customers')}
+    return sensitivity(assumptions, graph.get('rounds'), months=graph.months,
+                       current_month=graph.current_month, history=history, **kwargs)
+
+
+def cache_clear():
+    with _lock:
+        _cache.clear()
@@ -0,0 +1,221 @@
+"""Precompiled payload of the base-case page.
+
+``compile_page(graph)`` gathers every value and chart the dashboard shows
+for a scenario. ``write_snapshot`` stores the base case as one versioned
+JSON file next to the data (``script_6.py`` runs it after regenerating the
+tables), and ``load_snapshot`` reads it back with the charts rebuilt as
+Plotly figures. The app loads it once per process and shares it read-only,
+so rendering the base case is dictionary lookups; only a what-if from the
+sidebar falls back to the live ``ScenarioGraph``.
+
+The snapshot records a hash of the dataset files it was compiled from and
+is ignored once they change.
+"""
+
+import hashlib
+import json
+import os
+
+import plotly.graph_objects as go
+
+from cohorts import acquisitions, lifetime_value, retention_matrix
+from columnar import columnar_path
+from datasets import DATASETS
+from figures import (customers_figure, market_figure, payout_figure, retention_figure,
+                     revenue_figure, roi_figure, tornado_figure)
+from lazy import lazy_import
+from roi import end_months, valuation_multiple
+from sensitivity import OUTPUTS, SWING, scenario_sensitivity
+from waterfall import payouts, preference_terms
+
+np = lazy_import('numpy')
+
+SNAPSHOT_VERSION = 7
+SNAPSHOT_FILE = 'snapshot.json'
+
+FIGURES = ('roi', 'tornado', 'waterfall', 'revenue', 'market', 'customers', 'retention')
+
+# Inputs shown on the tornado chart, by swing in the headline ROI
+TORNADO_BARS = 12
+
+# Exit waterfall chart: at the raising round's (the first open one's)
+# ROI_YEARS exit, exit values up to EXIT_RANGE x the preference stack,
+# where the rounds convert one by one
+EXIT_RANGE = 8
+EXIT_POINTS = 400
+
+# Market sizing chart: (bar label, value in billions CAD, text)
+MARKET = [
+    ('Total Addressable\nMarket (TAM)', 45, '$45B'),
+    ('Serviceable Addressable\nMarket (SAM)', 12, '$12B'),
+    ('Serviceable Obtainable\nMarket (SOM)', 0.6, '$600M'),
+]
+
+# Headline returns of the open rounds (the ROI chart's and the tornado's),
+# and the month the goal seek's ARR and valuation targets default to
+ROI_YEARS = 5
+TARGET_MONTH = 60
+
+
+def source_hash(data_dir='.'):
+    """Digest of the files the dataset loader reads (columnar store or CSV)."""
+    h = hashlib.blake2b(digest_size=16)
+    for name, (csv_path, _) in sorted(DATASETS.items()):
+        csv_path = os.path.join(data_dir, csv_path)
+        path = columnar_path(csv_path)
+        files = ([os.path.join(path, f) for f in sorted(os.listdir(path))]
+                 if os.path.isdir(path) else [csv_path])
+        for file in files:
+            h.update(os.path.relpath(file, data_dir).encode())
+            with open(file, 'rb') as f:
+                h.update(f.read())
+    return h.hexdigest()
+
+
+def open_rounds(graph):
+    """Rounds whose terms the sidebar lets investors edit."""
+    rounds = graph.load('funding_rounds', ('Round', 'Status'))
+    return list(rounds.loc[rounds['Status'] != 'Complete', 'Round'])
+
+
+def round_pools(graph):
+    """Option pool target (post-money fraction) of each open round, 0 without a pool."""
+    rounds = graph.load('funding_rounds').set_index('Round')
+    return {name: (rounds.at[name, 'Option_Pool'].item() / 100 if 'Option_Pool' in rounds else 0.0)
+            for name in open_rounds(graph)}
+
+
+def figure_inputs(graph, name, window=None):
+    """``(builder, args)`` for one of the page's ``FIGURES``."""
+    if name == 'roi':
+        roi = graph.get('roi')
+        roi = roi[(roi['Years'] == ROI_YEARS) & roi['Round'].isin(open_rounds(graph))]
+        return roi_figure, (tuple(roi['Round']), roi['ROI_Percentage'].to_numpy())
+    if name == 'tornado':
+        raising = open_rounds(graph)[0]
+        result = scenario_sensitivity(graph, round_name=raising, years=ROI_YEARS)['roi']
+        top = result.table.head(TORNADO_BARS)
+        label = OUTPUTS['roi'].format(round_name=raising, years=ROI_YEARS)
+        return tornado_figure, (tuple(top['Parameter']), top['Output_Low'].to_numpy(),
+                                top['Output_High'].to_numpy(), result.base, label, SWING)
+    if name == 'waterfall':
+        rounds = graph.get('rounds')
+        start = rounds.loc[rounds['Round'] == open_rounds(graph)[0], 'Month'].to_numpy()
+        exit_month = end_months(start, (ROI_YEARS,), graph.months).item()
+        stack = (rounds['Amount'].to_numpy(dtype=float) * preference_terms(rounds)[0]).sum()
+        exit_values = np.linspace(0, EXIT_RANGE * stack, EXIT_POINTS)
+        result = payouts(exit_values, rounds, graph.months, [exit_month])
+        return payout_figure, (exit_values, tuple(rounds['Round']), result.investors[:, 0],
+                               result.common[:, 0], exit_month)
+    if name == 'revenue':
+        return revenue_figure, (graph.get('revenue'), graph.current_month,
+                                graph.get('bands')['revenue'], window)
+    if name == 'market':
+        markets, values, labels = zip(*MARKET)
+        return market_figure, (markets, np.array(values, dtype=float), labels)
+    if name == 'customers':
+        return customers_figure, (graph.get('customers'), graph.current_month,
+                                  graph.get('bands')['customers'], window)
+    if name == 'retention':
+        key_metrics = graph.load('key_metrics', ('Date', 'Churn_Rate'))
+        retention = retention_matrix(key_metrics['Churn_Rate'].to_numpy() / 100, dtype='float32')
+        return retention_figure, (retention, tuple(key_metrics['Date'].dt.strftime('%Y-%m')))
+    raise KeyError(f"Unknown figure {name!r}; expected one of {FIGURES}")
+
+
+def build_figure(graph, name, window=None):
+    """One of the page's ``FIGURES`` for the graph's current inputs."""
+    builder, args = figure_inputs(graph, name, window)
+    return builder(*args)
+
+
+def _round_returns(graph):
+    # Terms and ROI_YEARS returns of each open round, on diluted ownership
+    rounds = graph.get('rounds').set_index('Round')
+    roi = graph.get('roi')
+    roi = roi[roi['Years'] == ROI_YEARS].set_index('Round')
+    return {name: {
+        'amount': rounds.at[name, 'Amount'].item(),
+        'valuation': rounds.at[name, 'Valuation'].item(),
+        'equity': rounds.at[name, 'Equity'].item(),
+        'diluted_equity': roi.at[name, 'Equity_Pct'].item(),
+        'roi': roi.at[name, 'ROI_Percentage'].item(),
+        'multiple': roi.at[name, 'Multiple'].item(),
+    } for name in open_rounds(graph)}
+
+
+def compile_page(graph, figures=FIGURES):
+    """Every value the page renders for the graph's inputs, plus ``figures``."""
+    cm = graph.current_month
+    rounds = graph.get('rounds')
+    current_round = rounds[rounds['Status'] == 'Current Opportunity'].iloc[0]
+    key_metrics = graph.load('key_metrics', ('CAC', 'LTV', 'LTV_CAC_Ratio', 'Churn_Rate',
+                                             'Transaction_Volume'))
+    metrics = key_metrics.iloc[cm - 1]
+    # The customer count as acquisition cohorts, and their gross-margin LTV
+    churn = key_metrics['Churn_Rate'].to_numpy() / 100
+    customers = graph.get('customers')
+    revenue = graph.get('revenue')
+    values = {
+        'current_month': cm,
+        'months': graph.months,
+        'round_amount': current_round['Amount'].item(),
+        'round_valuation': current_round['Valuation'].item(),
+        'round_equity': current_round['Equity'].item(),
+        'current_revenue': revenue[cm - 1].item(),
+        'current_customers': int(customers[cm - 1]),
+        'ltv_cac': metrics['LTV_CAC_Ratio'].item(),
+        'cac': metrics['CAC'].item(),
+        'ltv': metrics['LTV'].item(),
+        'churn': metrics['Churn_Rate'].item(),
+        'volume': metrics['Transaction_Volume'].item(),
+        'new_customers': acquisitions(customers, churn)[cm - 1].item(),
+        'cohort_ltv': lifetime_value(revenue - graph.get('costs')[0], customers, churn)[cm - 1].item(),
+        'rounds': _round_returns(graph),
+    }
+    arr = graph.get('revenue')[TARGET_MONTH] * 12
+    values['target_arr'] = arr.item()
+    values['target_valuation'] = (arr * valuation_multiple(arr)).item()
+    return {
+        'values': values,
+        'figures': {name: build_figure(graph, name) for name in figures},
+    }
+
+
+def _spec(fig):
+    # Drop the resolved default template so Streamlit can still theme the chart
+    spec = json.loads(fig.to_json())
+    spec['layout'].pop('template', None)
+    return spec
+
+
+def write_snapshot(graph, data_dir='.'):
+    """Compile the graph's base case and write it to ``data_dir``.
+
+    ``graph`` must load its datasets from the same directory.
+    """
+    page = compile_page(graph)
+    payload = {
+        'version': SNAPSHOT_VERSION,
+        'source': source_hash(data_dir),
+        'defaults': {k: v.item() if hasattr(v, 'item') else v for k, v in graph.defaults.items()},
+        'open_rounds': open_rounds(graph),
+        'round_pools': round_pools(graph),
+        'values': page['values'],
+        'figures': {name: _spec(fig) for name, fig in page['figures'].items()},
+    }
+    with open(os.path.join(data_dir, SNAPSHOT_FILE), 'w') as f:
+        json.dump(payload, f, separators=(',', ':'))
+
+
+def load_snapshot(data_dir='.'):
+    """Read ``data_dir``'s snapshot, or return None if it is missing, old or stale."""
+    path = os.path.join(data_dir, SNAPSHOT_FILE)
+    if not os.path.isfile(path):
+        return None
+    with open(path) as f:
+        snapshot = json.load(f)
+    if snapshot.get('version') != SNAPSHOT_VERSION or snapshot.get('source') != source_hash(data_dir):
+        return None
+    snapshot['figures'] = {name: go.Figure(spec) for name, spec in snapshot['figures'].items()}
+    return snapshot
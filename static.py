@@ -0,0 +1,88 @@
+"""Static HTML and CSS of the pitch page, compacted once at import.
+
+The blocks are written indented for reading; ``compact`` strips the
+indentation and newlines so each rerun sends the short form, and the
+templates only need ``str.format`` with the company's info and the
+round's terms.
+"""
+
+
+def compact(html):
+    """``html`` with each line's indentation and the newlines removed."""
+    return ''.join(line.strip() for line in html.splitlines())
+
+
+PAGE_CSS = compact("""
+<style>
+    .main > div {
+        padding-top: 2rem;
+    }
+    .stMetric {
+        background-color: #f0f2f6;
+        padding: 1rem;
+        border-radius: 0.5rem;
+    }
+    h1 {
+        color: #1f77b4;
+        padding-bottom: 1rem;
+    }
+    h2 {
+        color: #2c3e50;
+        padding-top: 2rem;
+        padding-bottom: 1rem;
+        border-bottom: 2px solid #1f77b4;
+    }
+    .highlight-box {
+        background-color: #e3f2fd;
+        padding: 2rem;
+        border-radius: 1rem;
+        border-left: 5px solid #1f77b4;
+        margin: 2rem 0;
+    }
+    .cta-box {
+        background-color: #c8e6c9;
+        padding: 2rem;
+        border-radius: 1rem;
+        border-left: 5px solid #4caf50;
+        margin: 2rem 0;
+    }
+</style>
+""")
+
+TITLE = "<h1 style='text-align: center;'>🚀 {name}</h1>"
+TAGLINE = "<h3 style='text-align: center; color: #666;'>{tagline}</h3>"
+
+# Fields: amount_m, valuation_m (both in $M), equity
+CALLOUT = compact("""
+<div class='highlight-box'>
+    <h2 style='margin:0; padding:0; border:none; color:#1f77b4;'>💎 Series A Investment Opportunity</h2>
+    <h3 style='margin-top:1rem;'>${amount_m:g}M for {equity:g}% Equity @ ${valuation_m:g}M Valuation</h3>
+    <p style='font-size:1.1rem; margin-top:1rem;'>Join us at the perfect inflection point - proven traction, massive market, exceptional team.</p>
+</div>
+""")
+
+# Fields: amount, valuation (post-money), equity, years, roi, contact_email, calendly
+TERMS = compact("""
+<div class='cta-box'>
+    <h3>Series A Round Details</h3>
+    <ul style='font-size:1.1rem; line-height:2rem;'>
+        <li><strong>Amount Raising:</strong> ${amount:,.0f} CAD</li>
+        <li><strong>Post-Money Valuation:</strong> ${valuation:,.0f} CAD (${pre_money:,.0f} pre-money)</li>
+        <li><strong>Equity Offered:</strong> {equity:g}%</li>
+        <li><strong>Use of Funds:</strong> Product development (40%), Sales & Marketing (40%), Team expansion (20%)</li>
+        <li><strong>Expected Close:</strong> Q1 2025</li>
+        <li><strong>Projected {years}-Year ROI:</strong> {roi:,.0f}%</li>
+    </ul>
+    <h3 style='margin-top:2rem;'>Ready to Invest?</h3>
+    <p style='font-size:1.1rem;'>Contact: <strong>{contact_email}</strong></p>
+    <p style='font-size:1.1rem;'>Schedule a call: <strong>{calendly}</strong></p>
+</div>
+""")
+
+# Fields: legal_name, location, sector
+FOOTER = compact("""
+<div style='text-align: center; color: #666; padding: 2rem;'>
+    <p><strong>{legal_name}</strong> | {location} | {sector}</p>
+    <p><em>This presentation contains forward-looking statements and projections based on current market conditions and assumptions.</em></p>
+</div>
+""")
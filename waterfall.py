@@ -0,0 +1,117 @@
+"""Exit waterfall: what each round takes home at a given exit value.
+
+At an exit, preferred rounds are paid their liquidation preference
+(``Preference`` x ``Amount``) first, senior tiers before junior ones
+(higher ``Seniority`` first, pari passu within a tier). What is left goes
+to common (founders and the option pool) and to preferred that shares as
+if converted: ``Participating`` rounds take their preference and their
+pro-rata share; the others take whichever is larger, their preference or
+converting to common, and convert in order of their per-share preference
+as the exit grows. Ownership comes from ``captable.py``.
+
+Ownership, and so the waterfall, only changes when a round closes, so the
+payouts are solved once per closed-round state on an ``(exit values,
+states, rounds)`` grid and gathered onto the exit months. A table without the
+preference columns gets 1x non-participating, pari passu preferences.
+"""
+
+from collections import namedtuple
+
+from captable import issue, round_terms
+from lazy import lazy_import
+from projection import MONTHS
+
+np = lazy_import('numpy')
+
+Payouts = namedtuple('Payouts', ['investors', 'common'])
+
+
+def preference_terms(rounds):
+    """``(preference multiple, participating, seniority)`` arrays of a round table."""
+    n = len(rounds['Round'])
+    multiple = np.asarray(rounds['Preference'], dtype=np.float64) if 'Preference' in rounds else np.ones(n)
+    participating = (np.asarray(rounds['Participating'], dtype=bool) if 'Participating' in rounds
+                     else np.zeros(n, dtype=bool))
+    seniority = np.asarray(rounds['Seniority']) if 'Seniority' in rounds else np.zeros(n, dtype=int)
+    return multiple, participating, seniority
+
+
+def _pay_preferences(exit_values, preference, seniority):
+    # Preferences paid tier by tier, senior first; a short tier is split pro rata
+    paid = np.zeros(np.broadcast_shapes(exit_values.shape + (1,), preference.shape))
+    left = np.broadcast_to(exit_values, paid.shape[:-1]).copy()
+    for tier in np.unique(seniority)[::-1]:
+        owed = np.where(seniority == tier, preference, 0.0)
+        total = owed.sum(axis=-1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            fraction = np.where(total > 0, np.minimum(left / total, 1.0), 0.0)
+        paid += owed * fraction[..., np.newaxis]
+        left -= np.minimum(left, total)
+    return paid
+
+
+def _distribute(exit_values, ownership, common, preference, participating, seniority, converted):
+    # Payouts with the ``converted`` rounds sharing as common and giving up their preference
+    paid = _pay_preferences(exit_values, np.where(converted, 0.0, preference), seniority)
+    sharing = participating | converted
+    held = np.where(sharing, ownership, 0.0)
+    weight = common + held.sum(axis=-1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        price = np.where(weight > 0, (exit_values - paid.sum(axis=-1)) / weight, 0.0)
+    return paid + held * price[..., np.newaxis], common * price
+
+
+def _solve(exit_values, ownership, preference, participating, seniority):
+    """Payouts ``(..., rounds)`` and to common ``(...)`` for exits that broadcast
+    against the leading axes of ``ownership`` and ``preference``."""
+    n = ownership.shape[-1]
+    common = 1 - ownership.sum(axis=-1)
+    # Non-participating rounds convert in order of their per-share preference,
+    # so the candidates are the prefixes of that order: k = 0..n rounds converted
+    can_convert = ~participating & (ownership > 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        threshold = np.where(can_convert, preference / ownership, np.inf)
+    rank = np.argsort(np.argsort(threshold, axis=-1, kind='stable'), axis=-1)
+    converted = can_convert[..., np.newaxis, :] & (rank[..., np.newaxis, :]
+                                                   < np.arange(n + 1)[:, np.newaxis])
+    investors, to_common = _distribute(exit_values[..., np.newaxis], ownership[..., np.newaxis, :],
+                                       common[..., np.newaxis], preference[..., np.newaxis, :],
+                                       participating, seniority, converted)
+
+    # Stop at the first prefix whose next round is no better off converting
+    nth = rank[..., np.newaxis, :] == np.arange(n)[:, np.newaxis]
+    gains = (np.where(nth, investors[..., 1:, :], 0.0).sum(axis=-1)
+             > np.where(nth, investors[..., :-1, :], 0.0).sum(axis=-1))
+    wants = gains & (nth & can_convert[..., np.newaxis, :]).any(axis=-1)
+    k = np.argmin(np.concatenate([wants, np.zeros(wants.shape[:-1] + (1,), dtype=bool)],
+                                 axis=-1), axis=-1)
+    return (np.take_along_axis(investors, k[..., np.newaxis, np.newaxis], axis=-2)[..., 0, :],
+            np.take_along_axis(to_common, k[..., np.newaxis], axis=-1)[..., 0])
+
+
+def payouts(exit_values, rounds, months=MONTHS, exit_months=None):
+    """Each round's and common's payout for every exit value at every exit month.
+
+    ``exit_values`` ($) and ``exit_months`` (default: every month) are 1-D;
+    returns ``Payouts(investors, common)`` of shapes ``(values, months,
+    rounds)`` and ``(values, months)``. Rounds that have not closed by an
+    exit month get nothing.
+    """
+    amount, valuation, pool, month = round_terms(rounds)
+    multiple, participating, seniority = preference_terms(rounds)
+    shares, _, total_shares = issue(amount, valuation, pool)
+    n = len(month)
+
+    # State s: the first s rounds have closed; solve only the states exited from
+    exit_months = np.arange(months) if exit_months is None else np.asarray(exit_months)
+    states, at = np.unique(np.searchsorted(month, exit_months, side='right'), return_inverse=True)
+    closed = np.arange(n) < states[:, np.newaxis]
+    totals = np.concatenate([[1.0], total_shares])[states]
+    ownership = np.where(closed, shares / totals[:, np.newaxis], 0.0)
+    preference = np.where(closed, multiple * amount, 0.0)
+
+    exit_values = np.asarray(exit_values, dtype=np.float64)
+    investors, common = _solve(exit_values[:, np.newaxis], ownership, preference,
+                               participating, seniority)
+    return Payouts(investors[:, at], common[:, at])
+